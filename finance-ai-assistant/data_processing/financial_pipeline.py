@@ -1,41 +1,162 @@
 """
 Financial Data Processing Pipeline (Simplified for Windows)
 Handles financial data processing and analysis without Pathway
+
+pandas, NumPy and Numba are imported where they are used, so importing
+this module stays cheap for processes that never build a frame.
 """
 
-import pandas as pd
-import numpy as np
+from __future__ import annotations
+
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TYPE_CHECKING
+import functools
+import math
 import logging
 import asyncio
-import threading
-import time
 import os
+from collections import deque
+import orjson
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Rows kept in memory per frame; the simulated feed appends forever and
+# the oldest rows are overwritten past this
+MAX_HISTORY = 50_000
+
+# Compact column types for price frames: symbol codes instead of Python
+# strings, single-precision prices
+PRICE_DTYPES = {'symbol': 'category', 'price': 'float32', 'volume': 'uint32'}
+SENTIMENT_CATEGORIES = ['bullish', 'bearish', 'neutral']
+INDICATOR_COLUMNS = ['sma_20', 'rsi', 'bb_upper', 'bb_middle', 'bb_lower', 'price_change']
+
+class _ColumnRing:
+    """
+    Fixed-capacity frame stored as one preallocated NumPy array per column
+    (categorical columns as their codes). Appends write in place and
+    overwrite the oldest rows, so the history is never copied; DataFrames
+    are built only for the rows a caller asks for.
+    """
+
+    def __init__(self, data: pd.DataFrame, capacity: int = MAX_HISTORY):
+        import numpy as np
+        import pandas as pd
+
+        data = data.tail(capacity)
+        self.capacity = capacity
+        self.dtypes = data.dtypes.to_dict()
+        self._columns: Dict[str, Any] = {}
+        for name, column in data.items():
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                values = column.cat.codes.to_numpy()
+            else:
+                values = column.to_numpy()
+            self._columns[name] = np.empty(capacity, dtype=values.dtype)
+            self._columns[name][:len(values)] = values
+        self._head = len(data)  # Rows written so far
+
+    def __len__(self) -> int:
+        return min(self._head, self.capacity)
+
+    def append(self, data: pd.DataFrame):
+        """
+        Write rows after the newest one, wrapping over the oldest
+        """
+        import numpy as np
+        import pandas as pd
+
+        data = data.tail(self.capacity)
+        positions = (self._head + np.arange(len(data))) % self.capacity
+        for name, column in data.items():
+            dtype = self.dtypes[name]
+            if isinstance(dtype, pd.CategoricalDtype):
+                values = pd.Categorical(column, dtype=dtype).codes
+            else:
+                values = column.to_numpy()
+            self._columns[name][positions] = values
+        self._head += len(data)
+
+    def tail(self, n: int) -> pd.DataFrame:
+        """
+        The newest n rows, oldest first
+        """
+        import numpy as np
+        import pandas as pd
+
+        n = min(n, len(self))
+        positions = (self._head - n + np.arange(n)) % self.capacity
+        columns = {}
+        for name, values in self._columns.items():
+            dtype = self.dtypes[name]
+            if isinstance(dtype, pd.CategoricalDtype):
+                columns[name] = pd.Categorical.from_codes(values[positions], dtype=dtype)
+            else:
+                columns[name] = pd.Series(values[positions], dtype=dtype)
+        return pd.DataFrame(columns)
+
+    def frame(self) -> pd.DataFrame:
+        return self.tail(len(self))
+
 class FinancialDataProcessor:
     """
     Simplified financial data processing pipeline for Windows
     """
 
     def __init__(self):
+        import pandas as pd
+
+        _ensure_dir("data")
         self.price_data = pd.DataFrame()
         self.analysis_data = pd.DataFrame()
         self.alerts_data = pd.DataFrame()
         self.is_running = False
-        self.data_thread = None
+        self.update_task: Optional[asyncio.Task] = None
+        self._indicator_state: Dict[str, Dict[str, Any]] = {}
+
+    # The frames live in column rings; these build DataFrames on access
+    @property
+    def price_data(self) -> pd.DataFrame:
+        return self._price_ring.frame()
+
+    @price_data.setter
+    def price_data(self, data: pd.DataFrame):
+        self._price_ring = _ColumnRing(data)
+
+    @property
+    def analysis_data(self) -> pd.DataFrame:
+        return self._analysis_ring.frame()
+
+    @analysis_data.setter
+    def analysis_data(self, data: pd.DataFrame):
+        self._analysis_ring = _ColumnRing(data)
+
+    @property
+    def alerts_data(self) -> pd.DataFrame:
+        return self._alerts_ring.frame()
+
+    @alerts_data.setter
+    def alerts_data(self, data: pd.DataFrame):
+        self._alerts_ring = _ColumnRing(data)
 
     def load_sample_data(self) -> pd.DataFrame:
         """
         Load or create sample financial data
         """
+        import pandas as pd
+
         try:
-            # Try to load existing data
+            # Try to load existing data; Parquet keeps the timestamp dtype
+            if os.path.exists("data/price_stream.parquet"):
+                data = pd.read_parquet("data/price_stream.parquet")
+                logger.info(f"Loaded {len(data)} records from existing data")
+                return data
             if os.path.exists("data/price_stream.csv"):
                 data = pd.read_csv("data/price_stream.csv")
                 data['timestamp'] = pd.to_datetime(data['timestamp'])
+                data = data.astype(PRICE_DTYPES)
                 logger.info(f"Loaded {len(data)} records from existing data")
                 return data
         except Exception as e:
@@ -43,163 +164,109 @@ class FinancialDataProcessor:
 
         # Create sample data
         logger.info("Creating sample financial data...")
-        data = self._create_sample_data()
+        end_date = datetime.now()
+        data = build_price_panel(
+            ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'NVDA', 'JPM', 'JNJ'],
+            end_date - timedelta(days=30),
+            end_date,
+            volatility=0.03,  # 3% daily volatility
+            base_spread=300
+        )
         self._save_data(data)
         return data
 
-    def _create_sample_data(self, days: int = 30) -> pd.DataFrame:
-        """
-        Create sample financial data for testing
-        """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-
-        # Sample stock symbols
-        symbols = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'NVDA', 'JPM', 'JNJ']
-
-        data_rows = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            if current_date.weekday() < 5:  # Only weekdays
-                for symbol in symbols:
-                    # Generate realistic price movements
-                    base_price = 100 + (hash(symbol + str(current_date.date())) % 300)
-                    volatility = np.random.normal(0, 0.03)  # 3% daily volatility
-                    price = base_price * (1 + volatility)
-
-                    data_rows.append({
-                        'symbol': symbol,
-                        'timestamp': current_date,
-                        'price': round(price, 2),
-                        'volume': np.random.randint(1000000, 10000000),
-                        'source': 'simulated'
-                    })
-
-            current_date += timedelta(days=1)
-
-        return pd.DataFrame(data_rows)
-
     def _save_data(self, data: pd.DataFrame):
         """
-        Save data to CSV file
+        Save data to Parquet file
         """
-        os.makedirs("data", exist_ok=True)
-        data.to_csv("data/price_stream.csv", index=False)
-        logger.info(f"Sample data saved to data/price_stream.csv")
+        _ensure_dir("data")
+        data.to_parquet("data/price_stream.parquet", engine="pyarrow", compression="zstd", index=False)
+        logger.info(f"Sample data saved to data/price_stream.parquet")
 
     def calculate_technical_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate technical indicators for the data
         """
-        result_data = []
+        import numpy as np
+        import pandas as pd
 
-        for symbol in data['symbol'].unique():
-            symbol_data = data[data['symbol'] == symbol].copy()
-            symbol_data = symbol_data.sort_values('timestamp')
+        # One sort up front; every indicator below is a grouped vector op
+        data = data.sort_values(['symbol', 'timestamp'], ignore_index=True)
+        prices = data.groupby('symbol', sort=False, observed=True)['price']
+        price_change = prices.diff()
 
-            # Calculate SMA (Simple Moving Average)
-            symbol_data['sma_20'] = symbol_data['price'].rolling(window=20, min_periods=1).mean()
+        # Calculate SMA (Simple Moving Average) and the band width from the
+        # same 20-period window
+        sma, std = _rolling_mean_std(data['price'], data['symbol'], 20)
+        data['sma_20'] = sma
 
-            # Calculate RSI (Relative Strength Index)
-            symbol_data['rsi'] = self._calculate_rsi(symbol_data['price'])
+        # Calculate RSI (Relative Strength Index)
+        data['rsi'] = self._calculate_rsi(data['price'], data['symbol'])
 
-            # Calculate Bollinger Bands
-            bb_result = self._calculate_bollinger_bands(symbol_data['price'])
-            symbol_data['bb_upper'] = bb_result['upper']
-            symbol_data['bb_middle'] = bb_result['middle']
-            symbol_data['bb_lower'] = bb_result['lower']
+        # Calculate Bollinger Bands
+        data['bb_upper'] = sma + (std * 2)
+        data['bb_middle'] = sma
+        data['bb_lower'] = sma - (std * 2)
 
-            # Calculate price change
-            symbol_data['price_change'] = symbol_data['price'].diff()
+        # Calculate price change
+        data['price_change'] = price_change
 
-            # Determine sentiment
-            symbol_data['sentiment'] = symbol_data['price_change'].apply(
-                lambda x: 'bullish' if x > 0 else ('bearish' if x < 0 else 'neutral')
-            )
+        # Store indicators at the same precision as the prices
+        data[INDICATOR_COLUMNS] = data[INDICATOR_COLUMNS].astype('float32')
 
-            result_data.append(symbol_data)
-
-        return pd.concat(result_data, ignore_index=True)
-
-    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
-        """
-        Calculate RSI for a price series
-        """
-        try:
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period, min_periods=1).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period, min_periods=1).mean()
+        # Determine sentiment
+        change = price_change.to_numpy()
+        data['sentiment'] = pd.Categorical.from_codes(
+            np.select([change > 0, change < 0], [0, 1], default=2),
+            categories=SENTIMENT_CATEGORIES
+        )
 
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            return rsi.fillna(50.0)  # Fill NaN values with neutral RSI
-        except:
-            return pd.Series([50.0] * len(prices), index=prices.index)
+        return data
 
-    def _calculate_bollinger_bands(self, prices: pd.Series, period: int = 20) -> Dict[str, pd.Series]:
+    def _calculate_rsi(self, prices: pd.Series, symbols: pd.Series, period: int = 14) -> pd.Series:
         """
-        Calculate Bollinger Bands
+        Calculate RSI per symbol using Wilder's smoothing
         """
-        sma = prices.rolling(window=period, min_periods=1).mean()
-        std = prices.rolling(window=period, min_periods=1).std()
+        import pandas as pd
 
-        return {
-            'upper': sma + (std * 2),
-            'middle': sma,
-            'lower': sma - (std * 2)
-        }
+        rsi, _, _ = _wilder_rsi(prices, symbols, period)
+        return pd.Series(rsi, index=prices.index)
 
     def create_alerts(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Create alerts for significant market events
         """
-        alerts = []
-
-        for symbol in data['symbol'].unique():
-            symbol_data = data[data['symbol'] == symbol].copy()
-
-            # Price movement alerts (>5% change)
-            price_changes = symbol_data['price'].pct_change()
-            significant_moves = price_changes[abs(price_changes) > 0.05]
-
-            for idx, change in significant_moves.items():
-                alerts.append({
-                    'symbol': symbol,
-                    'timestamp': symbol_data.loc[idx, 'timestamp'],
-                    'alert_type': 'price_movement',
-                    'message': f"Significant price movement: {change:.2%}",
-                    'value': change
-                })
-
-            # RSI alerts
-            rsi_values = symbol_data['rsi']
-            overbought = rsi_values[rsi_values > 70]
-            oversold = rsi_values[rsi_values < 30]
-
-            for idx in overbought.index:
-                alerts.append({
-                    'symbol': symbol,
-                    'timestamp': symbol_data.loc[idx, 'timestamp'],
-                    'alert_type': 'overbought',
-                    'message': f"Overbought signal: RSI = {rsi_values.loc[idx]:.1f}",
-                    'value': rsi_values.loc[idx]
-                })
-
-            for idx in oversold.index:
-                alerts.append({
-                    'symbol': symbol,
-                    'timestamp': symbol_data.loc[idx, 'timestamp'],
-                    'alert_type': 'oversold',
-                    'message': f"Oversold signal: RSI = {rsi_values.loc[idx]:.1f}",
-                    'value': rsi_values.loc[idx]
-                })
-
-        return pd.DataFrame(alerts)
+        import pandas as pd
+
+        # Price movement alerts (>5% change)
+        price_changes = data.groupby('symbol', sort=False, observed=True)['price'].pct_change()
+        significant = price_changes.abs() > 0.05
+        moves = data.loc[significant, ['symbol', 'timestamp']].assign(
+            alert_type='price_movement',
+            message=price_changes[significant].map('Significant price movement: {:.2%}'.format),
+            value=price_changes[significant]
+        )
+
+        # RSI alerts
+        rsi_values = data['rsi']
+        overbought = rsi_values > 70
+        oversold = rsi_values < 30
+        overbought_alerts = data.loc[overbought, ['symbol', 'timestamp']].assign(
+            alert_type='overbought',
+            message=rsi_values[overbought].map('Overbought signal: RSI = {:.1f}'.format),
+            value=rsi_values[overbought]
+        )
+        oversold_alerts = data.loc[oversold, ['symbol', 'timestamp']].assign(
+            alert_type='oversold',
+            message=rsi_values[oversold].map('Oversold signal: RSI = {:.1f}'.format),
+            value=rsi_values[oversold]
+        )
+
+        return pd.concat([moves, overbought_alerts, oversold_alerts], ignore_index=True)
 
     def start_data_processing(self):
         """
-        Start the data processing pipeline
+        Start the data processing pipeline on the running event loop
         """
         if self.is_running:
             logger.warning("Data processing is already running")
@@ -209,166 +276,421 @@ class FinancialDataProcessor:
         logger.info("Starting financial data processing pipeline...")
 
         # Load initial data
-        self.price_data = self.load_sample_data()
-        self.analysis_data = self.calculate_technical_indicators(self.price_data)
-        self.alerts_data = self.create_alerts(self.analysis_data)
-
-        logger.info(f"Processed {len(self.price_data)} price records")
-        logger.info(f"Generated {len(self.analysis_data)} analysis records")
-        logger.info(f"Created {len(self.alerts_data)} alerts")
+        price_data = self.load_sample_data()
+        analysis_data = self.calculate_technical_indicators(price_data)
+        alerts_data = self.create_alerts(analysis_data)
+        self._init_indicator_state(analysis_data)
+        self.price_data = price_data
+        self.analysis_data = analysis_data
+        self.alerts_data = alerts_data
+
+        logger.info(f"Processed {len(price_data)} price records")
+        logger.info(f"Generated {len(analysis_data)} analysis records")
+        logger.info(f"Created {len(alerts_data)} alerts")
+
+        # Start background task for continuous updates
+        self.update_task = asyncio.create_task(self._continuous_update())
+
+    def _init_indicator_state(self, analysis: pd.DataFrame, sma_period: int = 20, rsi_period: int = 14):
+        """
+        Seed the per-symbol rolling windows from a full indicator pass
+        """
+        _, avg_gains, avg_losses = _wilder_rsi(analysis['price'], analysis['symbol'], rsi_period)
+        changes_seen = analysis.groupby('symbol', sort=False, observed=True).cumcount().to_numpy()
+
+        self._indicator_state = {}
+        for symbol, group in analysis.groupby('symbol', sort=False, observed=True):
+            last = analysis.index.get_loc(group.index[-1])
+            prices = group['price'].tail(sma_period).tolist()
+            self._indicator_state[symbol] = {
+                'sma_window': deque(prices, maxlen=sma_period),
+                'sma_sum': float(sum(prices)),
+                'avg_gain': float(avg_gains[last]),
+                'avg_loss': float(avg_losses[last]),
+                'rsi_count': int(changes_seen[last]),
+                'rsi_period': rsi_period,
+                'prev_price': float(group['price'].iloc[-1]),
+                'prev_timestamp': group['timestamp'].iloc[-1]
+            }
 
-        # Start background thread for continuous updates
-        self.data_thread = threading.Thread(target=self._continuous_update, daemon=True)
-        self.data_thread.start()
+    def _update_indicators(self, symbol: str, price: float) -> Dict[str, Any]:
+        """
+        Advance one symbol's rolling windows by a price and return its indicators
+        """
+        state = self._indicator_state[symbol]
+        window = state['sma_window']
+
+        # Keep the running sum in step with the window before it drops a price
+        if len(window) == window.maxlen:
+            state['sma_sum'] -= window[0]
+        window.append(price)
+        state['sma_sum'] += price
+
+        n = len(window)
+        sma = state['sma_sum'] / n
+        std = (sum((p - sma) ** 2 for p in window) / (n - 1)) ** 0.5 if n > 1 else float('nan')
+
+        # Same recurrence as _wilder_rsi_kernel
+        change = price - state['prev_price']
+        state['rsi_count'] += 1
+        weight = min(state['rsi_count'], state['rsi_period'])
+        state['avg_gain'] += (max(change, 0.0) - state['avg_gain']) / weight
+        state['avg_loss'] += (max(-change, 0.0) - state['avg_loss']) / weight
+        if state['avg_loss'] > 0:
+            rsi = 100 - (100 / (1 + state['avg_gain'] / state['avg_loss']))
+        else:
+            rsi = 100.0 if state['avg_gain'] > 0 else 50.0
+
+        state['prev_price'] = price
+        return {
+            'sma_20': sma,
+            'rsi': rsi,
+            'bb_upper': sma + (std * 2),
+            'bb_middle': sma,
+            'bb_lower': sma - (std * 2),
+            'price_change': change,
+            'sentiment': 'bullish' if change > 0 else ('bearish' if change < 0 else 'neutral')
+        }
 
-    def _continuous_update(self):
+    async def _continuous_update(self):
         """
         Continuously update data in the background
         """
+        loop = asyncio.get_running_loop()
+
         while self.is_running:
             try:
                 # Simulate real-time updates every 30 seconds
-                time.sleep(30)
-
-                # Add new data point
-                latest_timestamp = self.price_data['timestamp'].max()
-                new_timestamp = latest_timestamp + timedelta(minutes=30)
-
-                # Generate new data points for all symbols
-                new_data = []
-                for symbol in self.price_data['symbol'].unique():
-                    # Get the last price for this symbol
-                    last_price = self.price_data[
-                        (self.price_data['symbol'] == symbol) &
-                        (self.price_data['timestamp'] == latest_timestamp)
-                    ]['price'].iloc[0]
-
-                    # Generate new price with some random movement
-                    change = np.random.normal(0, 0.01)  # 1% volatility
-                    new_price = last_price * (1 + change)
-
-                    new_data.append({
-                        'symbol': symbol,
-                        'timestamp': new_timestamp,
-                        'price': round(new_price, 2),
-                        'volume': np.random.randint(1000000, 10000000),
-                        'source': 'simulated'
-                    })
-
-                # Add new data
-                new_df = pd.DataFrame(new_data)
-                self.price_data = pd.concat([self.price_data, new_df], ignore_index=True)
-
-                # Recalculate indicators
-                self.analysis_data = self.calculate_technical_indicators(self.price_data)
-                self.alerts_data = self.create_alerts(self.analysis_data)
-
-                logger.info(f"Updated data at {new_timestamp} - Total records: {len(self.price_data)}")
+                await asyncio.sleep(30)
+
+                # Building the new rows is CPU work; keep it off the event loop.
+                # The rings are only written here on the loop thread, so
+                # readers never see a half-appended row
+                update = await loop.run_in_executor(None, self._build_update)
+                self._append_update(*update)
 
             except Exception as e:
                 logger.error(f"Error in continuous update: {e}")
-                time.sleep(60)  # Wait longer on error
+                await asyncio.sleep(60)  # Wait longer on error
+
+    def _apply_update(self):
+        """
+        Append one simulated tick per symbol with its indicators and alerts
+        """
+        self._append_update(*self._build_update())
+
+    def _build_update(self):
+        """
+        Build one simulated tick per symbol with its indicators and alerts,
+        advancing the indicator state; the rings are left untouched
+        """
+        import numpy as np
+        import pandas as pd
+
+        # Generate new prices for all symbols in one draw, rounded once
+        states = self._indicator_state
+        last_prices = np.array([state['prev_price'] for state in states.values()])
+        changes = np.random.normal(0, 0.01, len(states))  # 1% volatility
+        new_prices = np.round(last_prices * (1 + changes), 2).tolist()
+        volumes = np.random.randint(1000000, 10000000, len(states)).tolist()
+
+        new_data = []
+        new_analysis = []
+        previous = []
+        for (symbol, state), price, volume in zip(states.items(), new_prices, volumes):
+            new_timestamp = state['prev_timestamp'] + timedelta(minutes=30)
+            row = {
+                'symbol': symbol,
+                'timestamp': new_timestamp,
+                'price': price,
+                'volume': volume,
+                'source': 'simulated'
+            }
+            previous.append({
+                'symbol': symbol,
+                'timestamp': state['prev_timestamp'],
+                'price': state['prev_price'],
+                'rsi': float('nan')
+            })
+            state['prev_timestamp'] = new_timestamp
+
+            new_data.append(row)
+            new_analysis.append({**row, **self._update_indicators(symbol, row['price'])})
+
+        # Only new rows are appended; earlier indicators don't change
+        new_df = pd.DataFrame(new_data).astype(self._price_ring.dtypes)
+        new_analysis_df = pd.DataFrame(new_analysis).astype(self._analysis_ring.dtypes)
+
+        # Alerts for the new rows, using the previous price for the move
+        new_alerts = self.create_alerts(pd.concat([
+            pd.DataFrame(previous).astype({'symbol': new_analysis_df['symbol'].dtype}),
+            new_analysis_df
+        ], ignore_index=True))
+        if not new_alerts.empty:
+            new_alerts = new_alerts[new_alerts['timestamp'].isin(new_df['timestamp'])]
+
+        return new_df, new_analysis_df, new_alerts
+
+    def _append_update(self, new_df: pd.DataFrame, new_analysis_df: pd.DataFrame, new_alerts: pd.DataFrame):
+        """
+        Write a built tick into the rings (a few rows, cheap enough for the loop)
+        """
+        self._price_ring.append(new_df)
+        self._analysis_ring.append(new_analysis_df)
+        if not new_alerts.empty:
+            self._alerts_ring.append(new_alerts)
+
+        logger.info(f"Updated data at {new_df['timestamp'].max()} - Total records: {len(self._price_ring)}")
 
     def stop_data_processing(self):
         """
         Stop the data processing pipeline
         """
         self.is_running = False
-        if self.data_thread:
-            self.data_thread.join(timeout=5)
+        if self.update_task:
+            self.update_task.cancel()
         logger.info("Financial data processing pipeline stopped")
 
-    def get_latest_data(self) -> Dict[str, Any]:
+    def get_latest_data(self) -> bytes:
         """
-        Get the latest processed data
+        Get the latest processed data as a JSON document
+
+        Frames are column-oriented ({column: [values]}) and serialized
+        straight from their arrays, so no per-row dicts are built; return
+        the bytes as-is, e.g. Response(content=..., media_type='application/json')
         """
-        return {
-            'price_data': self.price_data.tail(100).to_dict('records'),  # Last 100 records
-            'analysis_data': self.analysis_data.tail(50).to_dict('records'),  # Last 50 records
-            'alerts': self.alerts_data.tail(10).to_dict('records'),  # Last 10 alerts
+        return orjson.dumps({
+            'price_data': _frame_columns(self._price_ring.tail(100)),  # Last 100 records
+            'analysis_data': _frame_columns(self._analysis_ring.tail(50)),  # Last 50 records
+            'alerts': _frame_columns(self._alerts_ring.tail(10)),  # Last 10 alerts
             'last_update': datetime.now().isoformat(),
-            'total_records': len(self.price_data)
-        }
+            'total_records': len(self._price_ring)
+        }, option=orjson.OPT_SERIALIZE_NUMPY)
 
     def get_data_summary(self) -> Dict[str, Any]:
         """
         Get a summary of the processed data
         """
-        if self.price_data.empty:
+        price_data = self.price_data
+        if price_data.empty:
             return {'message': 'No data available'}
 
         return {
-            'symbols': self.price_data['symbol'].unique().tolist(),
-            'total_records': len(self.price_data),
+            'symbols': price_data['symbol'].unique().tolist(),
+            'total_records': len(price_data),
             'date_range': {
-                'start': self.price_data['timestamp'].min().isoformat(),
-                'end': self.price_data['timestamp'].max().isoformat()
+                'start': price_data['timestamp'].min().isoformat(),
+                'end': price_data['timestamp'].max().isoformat()
             },
             'latest_prices': {
                 symbol: group['price'].iloc[-1]
-                for symbol, group in self.price_data.groupby('symbol')
+                for symbol, group in price_data.groupby('symbol', observed=True)
             }
         }
 
-# Utility functions for data integration
-def create_sample_data() -> pd.DataFrame:
+def _wilder_rsi_loop(prices, new_group, period, rsi, avg_gains, avg_losses):
+    """RSI with Wilder smoothing over consecutive symbol runs in one pass"""
+    avg_gain = 0.0
+    avg_loss = 0.0
+    count = 0
+
+    for i in range(prices.shape[0]):
+        if new_group[i]:
+            avg_gain = 0.0
+            avg_loss = 0.0
+            count = 0
+        else:
+            change = prices[i] - prices[i - 1]
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            # Running mean until `period` changes are seen, Wilder's
+            # (avg * (period - 1) + x) / period after that
+            count += 1
+            weight = count if count < period else period
+            avg_gain += (gain - avg_gain) / weight
+            avg_loss += (loss - avg_loss) / weight
+
+        avg_gains[i] = avg_gain
+        avg_losses[i] = avg_loss
+        if avg_loss > 0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            rsi[i] = 100.0
+        else:
+            rsi[i] = 50.0  # Neutral until there is any movement
+
+def _rolling_mean_std_loop(prices, new_group, window, means, stds):
+    """Rolling mean and sample std over consecutive symbol runs in one pass"""
+    mean = 0.0
+    m2 = 0.0
+    count = 0
+    start = 0
+
+    for i in range(prices.shape[0]):
+        if new_group[i]:
+            mean = 0.0
+            m2 = 0.0
+            count = 0
+            start = i
+
+        # Welford update: add the new price, drop the one leaving the window
+        price = prices[i]
+        count += 1
+        delta = price - mean
+        mean += delta / count
+        m2 += delta * (price - mean)
+        if i - start >= window:
+            old = prices[i - window]
+            count -= 1
+            delta = old - mean
+            mean -= delta / count
+            m2 -= delta * (old - mean)
+
+        means[i] = mean
+        if count > 1:
+            stds[i] = (m2 / (count - 1)) ** 0.5 if m2 > 0 else 0.0
+        else:
+            stds[i] = math.nan
+
+@functools.lru_cache(maxsize=None)
+def _compiled(loop):
     """
-    Create sample financial data for testing
+    JIT-compile an indicator loop on first use, falling back to plain Python
     """
-    # Generate sample data for the last 30 days
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=30)
+    try:
+        from numba import njit
+    except ImportError:
+        logger.warning("Numba not available - indicators will run without JIT")
+        return loop
+    return njit(cache=True, fastmath=True)(loop)
+
+def _group_starts(symbols: pd.Series):
+    """
+    Mask of the first row of each symbol run, for data sorted by symbol
+    """
+    import numpy as np
+
+    symbol_values = symbols.to_numpy()
+    new_group = np.ones(len(symbol_values), dtype=np.bool_)
+    new_group[1:] = symbol_values[1:] != symbol_values[:-1]
+    return new_group
 
-    # Sample stock symbols
-    symbols = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA']
+def _wilder_rsi(prices: pd.Series, symbols: pd.Series, period: int = 14):
+    """
+    RSI and smoothed gain/loss arrays for data sorted by symbol
+    """
+    import numpy as np
 
-    data_rows = []
-    current_date = start_date
+    rsi, avg_gains, avg_losses = np.empty((3, len(prices)))
+    _compiled(_wilder_rsi_loop)(
+        prices.to_numpy(dtype=np.float64), _group_starts(symbols), period, rsi, avg_gains, avg_losses
+    )
+    return rsi, avg_gains, avg_losses
 
-    while current_date <= end_date:
-        if current_date.weekday() < 5:  # Only weekdays
-            for symbol in symbols:
-                # Generate realistic price movements
-                base_price = 100 + (hash(symbol + str(current_date.date())) % 200)
-                volatility = np.random.normal(0, 0.02)  # 2% daily volatility
-                price = base_price * (1 + volatility)
+def _rolling_mean_std(prices: pd.Series, symbols: pd.Series, window: int = 20):
+    """
+    Rolling mean and std (min_periods=1) per symbol for data sorted by symbol
+    """
+    import numpy as np
 
-                data_rows.append({
-                    'symbol': symbol,
-                    'timestamp': current_date,
-                    'price': round(price, 2),
-                    'volume': np.random.randint(1000000, 10000000),
-                    'source': 'simulated'
-                })
+    means, stds = np.empty((2, len(prices)))
+    _compiled(_rolling_mean_std_loop)(
+        prices.to_numpy(dtype=np.float64), _group_starts(symbols), window, means, stds
+    )
+    return means, stds
 
-        current_date += timedelta(days=1)
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    """
+    Create a directory once per process
+    """
+    if path:
+        os.makedirs(path, exist_ok=True)
 
-    return pd.DataFrame(data_rows)
+def _frame_columns(data: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Columns as NumPy arrays where orjson can serialize them natively
+    (numbers, datetimes), Python lists otherwise (categories, strings)
+    """
+    return {
+        name: column.to_numpy() if column.dtype.kind in 'biufM' else column.tolist()
+        for name, column in data.items()
+    }
 
-def save_sample_data(data: pd.DataFrame, filename: str = "data/price_stream.csv"):
+# Utility functions for data integration
+def build_price_panel(
+    symbols: List[str],
+    start_date: datetime,
+    end_date: datetime,
+    volatility: float = 0.02,
+    base_spread: int = 200,
+    rng=None
+) -> pd.DataFrame:
     """
-    Save sample data to CSV file
+    Simulated prices for symbols on every weekday between start_date and
+    end_date, built as one (days x symbols) matrix
+
+    Rows are day-major with symbols in order within each day; each symbol
+    moves around a base of 100 + hash(symbol) % base_spread.
     """
-    import os
+    import numpy as np
+    import pandas as pd
 
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # Weekdays only, at the same time of day as end_date
+    dates = pd.bdate_range(start_date, end_date, normalize=False)
+    n_days, n_symbols = len(dates), len(symbols)
+
+    # Generate realistic price movements
+    base_prices = 100 + np.array([hash(symbol) % base_spread for symbol in symbols])
+    noise = rng.normal(0, volatility, size=(n_days, n_symbols))
+    prices = base_prices[None, :] * (1 + noise)
+
+    return pd.DataFrame({
+        'symbol': np.tile(symbols, n_days),
+        'timestamp': np.repeat(dates.values, n_symbols),
+        'price': np.round(prices.ravel(), 2),
+        'volume': rng.integers(1000000, 10000000, size=n_days * n_symbols),
+        'source': 'simulated'
+    }).astype(PRICE_DTYPES)
+
+def create_sample_data() -> pd.DataFrame:
+    """
+    Create sample financial data for testing
+    """
+    # Generate sample data for the last 30 days
+    end_date = datetime.now()
+    return build_price_panel(
+        ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA'],
+        end_date - timedelta(days=30),
+        end_date,
+        volatility=0.02  # 2% daily volatility
+    )
+
+def save_sample_data(data: pd.DataFrame, filename: str = "data/price_stream.parquet"):
+    """
+    Save sample data to Parquet file
+    """
     # Create data directory if it doesn't exist
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    _ensure_dir(os.path.dirname(filename))
 
     # Save data
-    data.to_csv(filename, index=False)
+    data.to_parquet(filename, engine="pyarrow", compression="zstd", index=False)
     logger.info(f"Sample data saved to {filename}")
 
 if __name__ == "__main__":
     # Create and run the financial data processor
     processor = FinancialDataProcessor()
 
-    # Start the data processing pipeline
-    processor.start_data_processing()
+    async def main():
+        # Start the data processing pipeline and run until interrupted
+        processor.start_data_processing()
+        await processor.update_task
 
     try:
-        # Keep the main thread alive
-        while processor.is_running:
-            time.sleep(1)
+        asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Shutting down...")
         processor.stop_data_processing()
\ No newline at end of file
@@ -42,63 +42,88 @@ def generate_stock_data(
 
     all_data = []
 
+    # Generate date range (weekdays only), shared by every symbol
+    date_range = pd.date_range(start=start_date, end=end_date, freq='B')  # Business days only
+    n_days = len(date_range)
+
+    # Base price and RNG seed per symbol, hashed once
+    symbol_meta = {}
     for symbol in symbols:
-        logger.info(f"Generating data for {symbol}")
+        symbol_hash = hash(symbol)
+        symbol_meta[symbol] = (100 + (symbol_hash % 400), symbol_hash & 0xFFFFFFFF)
 
-        # Generate date range (weekdays only)
-        date_range = pd.date_range(start=start_date, end=end_date, freq='B')  # Business days only
+    for symbol in symbols:
+        logger.info(f"Generating data for {symbol}")
 
         # Generate realistic price movements
-        base_price = 100 + (hash(symbol) % 400)  # Different base price for each symbol
-        n_days = len(date_range)
+        base_price, seed = symbol_meta[symbol]  # Different base price for each symbol
 
         # Generate price series with some trend and volatility
-        np.random.seed(hash(symbol) % 10000)  # Different seed for each symbol
+        rng = np.random.default_rng(seed)  # Different seed for each symbol
+        trend_end, walk_scale = rng.uniform([-50, 1], [100, 5])
+        base_volume = rng.integers(1000000, 10000000)
+
+        # One draw for every per-day noise series:
+        # random walk, volume, open, high, low
+        noise = rng.standard_normal((5, n_days))
 
         # Create trend component
-        trend = np.linspace(0, np.random.uniform(-50, 100), n_days)
+        trend = np.linspace(0, trend_end, n_days)
 
         # Create random walk component
-        random_walk = np.random.normal(0, np.random.uniform(1, 5), n_days).cumsum()
+        random_walk = noise[0]
+        random_walk *= walk_scale
+        np.cumsum(random_walk, out=random_walk)
 
         # Combine components
         price_series = base_price + trend + random_walk
 
         # Ensure prices stay positive
-        price_series = np.maximum(price_series, 1)
+        np.maximum(price_series, 1, out=price_series)
 
         # Generate volume data
-        base_volume = np.random.randint(1000000, 10000000)
-        volume_series = np.random.normal(base_volume, base_volume * 0.3, n_days).astype(int)
-        volume_series = np.maximum(volume_series, 100000)
+        volume_series = np.maximum(base_volume + noise[1] * (base_volume * 0.3), 100000).astype(int)
 
         # Create OHLC data (Open, High, Low, Close)
         # For simplicity, we'll use Close as base and generate OHLC around it
         close_prices = price_series
-        open_prices = close_prices + np.random.normal(0, close_prices * 0.02, n_days)
-        high_prices = np.maximum(open_prices, close_prices) + np.abs(np.random.normal(0, close_prices * 0.01, n_days))
-        low_prices = np.minimum(open_prices, close_prices) - np.abs(np.random.normal(0, close_prices * 0.01, n_days))
+        open_prices = close_prices + noise[2] * (close_prices * 0.02)
+        high_prices = np.maximum(open_prices, close_prices) + np.abs(noise[3]) * (close_prices * 0.01)
+        low_prices = np.minimum(open_prices, close_prices) - np.abs(noise[4]) * (close_prices * 0.01)
+
+        # Round all four price series in one pass
+        open_prices, high_prices, low_prices, close_prices = np.round(
+            np.stack([open_prices, high_prices, low_prices, close_prices]), 2
+        )
 
         # Create DataFrame for this symbol
         symbol_data = pd.DataFrame({
             'symbol': symbol,
             'timestamp': date_range,
-            'open': np.round(open_prices, 2),
-            'high': np.round(high_prices, 2),
-            'low': np.round(low_prices, 2),
-            'close': np.round(close_prices, 2),
+            'open': open_prices,
+            'high': high_prices,
+            'low': low_prices,
+            'close': close_prices,
             'volume': volume_series,
             'source': 'demo'
         })
 
         all_data.append(symbol_data)
 
-    # Combine all data
-    combined_data = pd.concat(all_data, ignore_index=True)
-
-    # Save to CSV
-    output_file = os.path.join(output_dir, "demo_stock_data.csv")
-    combined_data.to_csv(output_file, index=False)
+    # Combine all data; symbol codes and single-precision prices keep the
+    # frame (and the Parquet file) compact
+    combined_data = pd.concat(all_data, ignore_index=True).astype({
+        'symbol': 'category',
+        'open': 'float32',
+        'high': 'float32',
+        'low': 'float32',
+        'close': 'float32',
+        'volume': 'uint32'
+    })
+
+    # Save to Parquet
+    output_file = os.path.join(output_dir, "demo_stock_data.parquet")
+    combined_data.to_parquet(output_file, engine="pyarrow", compression="zstd", index=False)
 
     logger.info(f"Generated {len(combined_data)} records for {len(symbols)} symbols")
     logger.info(f"Data saved to {output_file}")
@@ -170,9 +195,9 @@ def generate_market_indices_data(output_dir: str = "data") -> None:
     # Combine all indices data
     combined_indices = pd.concat(all_indices_data, ignore_index=True)
 
-    # Save to CSV
-    output_file = os.path.join(output_dir, "demo_indices_data.csv")
-    combined_indices.to_csv(output_file, index=False)
+    # Save to Parquet
+    output_file = os.path.join(output_dir, "demo_indices_data.parquet")
+    combined_indices.to_parquet(output_file, engine="pyarrow", compression="zstd", index=False)
 
     logger.info(f"Generated indices data saved to {output_file}")
 
@@ -203,44 +228,34 @@ def generate_sample_portfolio_data(output_dir: str = "data") -> None:
     start_date = end_date - timedelta(days=90)
     date_range = pd.date_range(start=start_date, end=end_date, freq='B')
 
-    portfolio_data = []
+    # Simulate every (day, holding) price at once
+    shares = np.array([holding['shares'] for holding in portfolio])
+    avg_costs = np.array([holding['avg_cost'] for holding in portfolio])
+    days_from_start = np.asarray((date_range - start_date).days)
+    rng = np.random.default_rng()
+    volatility = rng.normal(0, 0.02, size=(len(date_range), len(portfolio))) * np.sqrt(days_from_start / 30)[:, None]
+    current_prices = avg_costs * (1 + volatility)
 
-    for date in date_range:
-        total_value = 0
-        total_cost = 0
-
-        for holding in portfolio:
-            # Simulate price movement
-            base_price = holding['avg_cost']
-            days_from_start = (date - start_date).days
-            volatility = np.random.normal(0, 0.02) * np.sqrt(days_from_start / 30)
-            current_price = base_price * (1 + volatility)
-
-            holding_value = holding['shares'] * current_price
-            holding_cost = holding['shares'] * holding['avg_cost']
-
-            total_value += holding_value
-            total_cost += holding_cost
-
-        daily_return = (total_value - total_cost) / total_cost * 100
-
-        portfolio_data.append({
-            'date': date,
-            'total_value': round(total_value, 2),
-            'total_cost': round(total_cost, 2),
-            'daily_return': round(daily_return, 2),
-            'source': 'demo'
-        })
+    total_value = current_prices @ shares
+    total_cost = float(shares @ avg_costs)
+    daily_return = (total_value - total_cost) / total_cost * 100
 
     # Create DataFrame and save
-    portfolio_df = pd.DataFrame(portfolio_data)
-    output_file = os.path.join(output_dir, "demo_portfolio_data.csv")
-    portfolio_df.to_csv(output_file, index=False)
+    portfolio_df = pd.DataFrame({
+        'date': date_range,
+        'total_value': np.round(total_value, 2),
+        'total_cost': round(total_cost, 2),
+        'daily_return': np.round(daily_return, 2),
+        'source': 'demo'
+    })
+
+    output_file = os.path.join(output_dir, "demo_portfolio_data.parquet")
+    portfolio_df.to_parquet(output_file, engine="pyarrow", compression="zstd", index=False)
 
     logger.info(f"Generated portfolio data saved to {output_file}")
 
     print("\n💼 Sample Portfolio Summary:")
-    latest_data = portfolio_data[-1]
+    latest_data = portfolio_df.iloc[-1]
     print(f"  Total Value: ${latest_data['total_value']:,.2f}")
     print(f"  Total Cost: ${latest_data['total_cost']:,.2f}")
     print(f"  Total Return: {latest_data['daily_return']:+.2f}%")
@@ -265,9 +280,9 @@ def main():
 
         print("\nDemo data generation completed successfully!")
         print("\nGenerated files:")
-        print("  • data/demo_stock_data.csv")
-        print("  • data/demo_indices_data.csv")
-        print("  • data/demo_portfolio_data.csv")
+        print("  • data/demo_stock_data.parquet")
+        print("  • data/demo_indices_data.parquet")
+        print("  • data/demo_portfolio_data.parquet")
         print("\nYou can now start the Finance AI Assistant and use this demo data!")
 
     except Exception as e:
@@ -3,17 +3,22 @@ Finance AI Assistant Frontend - Streamlit Dashboard
 Interactive financial analysis and visualization dashboard
 """
 
+from __future__ import annotations
+
 import streamlit as st
-import requests
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import numpy as np
-from datetime import datetime, timedelta
+import httpx
+import orjson
+from datetime import date, datetime, timedelta
 import time
 import logging
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
+
+# pandas and plotly are only needed on the Stock Analysis page; they are
+# imported where used so other pages start without paying for them
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -21,6 +26,15 @@ logger = logging.getLogger(__name__)
 
 # Configuration
 BACKEND_URL = "http://localhost:8000"
+REQUEST_TIMEOUT = (3, 10)  # (connect, read) seconds
+RAW_DATA_ROWS = 500  # cap for the raw history table
+APP_DATA_VERSION = "1"  # bump when backend payloads change shape; busts the disk cache
+
+# Theme colours live in .streamlit/config.toml; this is the only custom-styled element
+SIDEBAR_HEADER = (
+    '<div style="font-size: 1.25rem; font-weight: bold; color: #1f77b4; margin-bottom: 1rem;">'
+    'Finance AI Assistant</div>'
+)
 
 # Page configuration
 st.set_page_config(
@@ -30,45 +44,110 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 0.25rem solid #1f77b4;
-    }
-    .sidebar-header {
-        font-size: 1.25rem;
-        font-weight: bold;
-        color: #1f77b4;
-        margin-bottom: 1rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def _client() -> httpx.Client:
+    """
+    HTTP client shared across reruns so backend connections stay open;
+    over HTTPS the concurrent panel fetches multiplex on one HTTP/2 connection
+    """
+    transport = httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    )
+    return httpx.Client(
+        base_url=BACKEND_URL,
+        timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+        transport=transport
+    )
+
+def _fetch_json(endpoint: str, params: tuple) -> Any:
+    """
+    GET an endpoint and decode the JSON body with orjson; raises on failure
+    so that errors are never stored by the caches below
+    """
+    response = _client().get(endpoint, params=dict(params))
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+# Cached per (endpoint, params) so Streamlit reruns with unchanged inputs
+# skip the request; lifetimes follow how often each kind of data changes.
+# Caches that get_backend_data_many also calls from worker threads can't
+# draw a spinner there, so only the history cache (main thread only) owns one;
+# it shows while the request runs and never on a hit
+@st.cache_data(ttl=30, max_entries=256, show_spinner=False)
+def _fetch_live(endpoint: str, params: tuple) -> Any:
+    return _fetch_json(endpoint, params)
+
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+def _fetch_default(endpoint: str, params: tuple) -> Any:
+    return _fetch_json(endpoint, params)
+
+@st.cache_data(ttl=300, max_entries=256, show_spinner="Loading price history...")
+def _fetch_history(endpoint: str, params: tuple) -> Any:
+    return _fetch_json(endpoint, params)
+
+# Disk-persisted caches ignore ttl, so freshness comes from the key instead:
+# the day bucket rolls entries over daily, the version busts them on schema changes
+@st.cache_data(persist="disk", max_entries=1024, show_spinner=False)
+def _fetch_stable(endpoint: str, params: tuple, version: str, day: str) -> Any:
+    return _fetch_json(endpoint, params)
+
+def _fetch_info(endpoint: str, params: tuple) -> Any:
+    return _fetch_stable(endpoint, params, APP_DATA_VERSION, date.today().isoformat())
+
+def _cached_fetch(endpoint: str):
+    """Pick the cache whose lifetime suits the endpoint"""
+    if endpoint.endswith("/quote") or endpoint == "/api/market/indices":
+        return _fetch_live
+    if endpoint.endswith("/history"):
+        return _fetch_history
+    if endpoint.endswith("/info"):
+        return _fetch_info
+    return _fetch_default
+
+def _params_key(params: Optional[Dict]) -> tuple:
+    return tuple(sorted(params.items())) if params else ()
+
+def _report_backend_error(e: Exception):
+    st.error(f"Error connecting to backend: {e}")
+    logger.error(f"Backend request failed: {e}")
+
+@st.cache_resource
+def _request_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by every session for concurrent backend calls"""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="backend")
 
 def get_backend_data(endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
     """
     Fetch data from the FastAPI backend
     """
     try:
-        url = f"{BACKEND_URL}{endpoint}"
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error connecting to backend: {e}")
-        logger.error(f"Backend request failed: {e}")
+        return _cached_fetch(endpoint)(endpoint, _params_key(params))
+    except httpx.HTTPError as e:
+        _report_backend_error(e)
         return None
 
+def get_backend_data_many(calls: List[Tuple[str, Optional[Dict]]]) -> List[Optional[Dict]]:
+    """
+    Fetch several endpoints concurrently; results come back in call order,
+    with None (and an error message) for any request that failed
+    """
+    executor = _request_executor()
+    futures = [
+        executor.submit(_cached_fetch(endpoint), endpoint, _params_key(params))
+        for endpoint, params in calls
+    ]
+
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except httpx.HTTPError as e:
+            _report_backend_error(e)
+            results.append(None)
+    return results
+
 def display_stock_search():
     """Stock search and selection interface"""
     st.header("🔍 Stock Search & Analysis")
@@ -85,14 +164,24 @@ def display_stock_search():
         limit = st.selectbox("Max results", [5, 10, 15, 20], index=1)
 
     if search_query:
-        with st.spinner("Searching stocks..."):
-            results = get_backend_data("/api/stocks/search", {"query": search_query, "limit": limit})
-
-        if results:
-            st.subheader(f"Found {len(results)} results for '{search_query}'")
+        # The options for the current query live in session_state, so reruns
+        # from picking a stock neither refetch nor rebuild them
+        search_key = (search_query, limit)
+        if st.session_state.get("search_key") != search_key:
+            with st.spinner("Searching stocks..."):
+                results = get_backend_data("/api/stocks/search", {"query": search_query, "limit": limit})
+            st.session_state["search_options"] = (
+                {f"{stock['symbol']} - {stock['name']}": stock['symbol'] for stock in results}
+                if results else None
+            )
+            # Failed searches aren't remembered so the next rerun retries
+            st.session_state["search_key"] = search_key if results else None
+        stock_options = st.session_state["search_options"]
+
+        if stock_options:
+            st.subheader(f"Found {len(stock_options)} results for '{search_query}'")
 
             # Create a selection interface
-            stock_options = {f"{stock['symbol']} - {stock['name']}": stock['symbol'] for stock in results}
             selected_stock = st.selectbox("Select a stock for analysis", list(stock_options.keys()))
 
             if selected_stock:
@@ -101,10 +190,26 @@ def display_stock_search():
 
     return None
 
+def _analysis_key(symbol: str) -> str:
+    return f"analysis::{symbol}"
+
+def _analysis(symbol: str) -> Optional[Dict]:
+    """
+    Technical analysis for a symbol, fetched at most once per page render;
+    the overview and technical tabs both read it
+    """
+    key = _analysis_key(symbol)
+    if st.session_state.get(key) is None:
+        st.session_state[key] = get_backend_data(f"/api/stocks/{symbol}/analysis")
+    return st.session_state[key]
+
 def display_stock_info(symbol: str):
     """Display comprehensive stock information"""
     st.header(f"📊 {symbol} - Stock Analysis")
 
+    # Each full render refetches once; tab fragments reuse what is stored
+    st.session_state.pop(_analysis_key(symbol), None)
+
     # Create tabs for different views
     tab1, tab2, tab3, tab4 = st.tabs(["Overview", "Price Chart", "Technical Analysis", "News & Alerts"])
 
@@ -122,12 +227,18 @@ def display_stock_info(symbol: str):
 
 def display_stock_overview(symbol: str):
     """Display stock overview information"""
+    # Fetch all three panels at once; total wait is the slowest request
+    with st.spinner("Loading stock data..."):
+        info, quote, analysis = get_backend_data_many([
+            (f"/api/stocks/{symbol}/info", None),
+            (f"/api/stocks/{symbol}/quote", None),
+            (f"/api/stocks/{symbol}/analysis", None)
+        ])
+    st.session_state[_analysis_key(symbol)] = analysis
+
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        with st.spinner("Loading stock info..."):
-            info = get_backend_data(f"/api/stocks/{symbol}/info")
-
         if info:
             st.subheader("Company Information")
             st.write(f"**Name:** {info.get('name', 'N/A')}")
@@ -135,9 +246,6 @@ def display_stock_overview(symbol: str):
             st.write(f"**Industry:** {info.get('industry', 'N/A')}")
 
     with col2:
-        with st.spinner("Loading market data..."):
-            quote = get_backend_data(f"/api/stocks/{symbol}/quote")
-
         if quote:
             st.subheader("Market Data")
             st.metric("Current Price", f"${quote.get('current_price', 'N/A')}")
@@ -146,9 +254,6 @@ def display_stock_overview(symbol: str):
             st.metric("Volume", f"{quote.get('volume', 'N/A'):,}")
 
     with col3:
-        with st.spinner("Loading analysis..."):
-            analysis = get_backend_data(f"/api/stocks/{symbol}/analysis")
-
         if analysis:
             st.subheader("Technical Indicators")
             st.metric("SMA (20)", f"${analysis.get('sma_20', 'N/A')}")
@@ -156,111 +261,154 @@ def display_stock_overview(symbol: str):
             st.metric("RSI", f"{analysis.get('rsi', 'N/A')}")
             st.write(f"**Trend:** {analysis.get('trend', 'N/A').title()}")
 
-def display_price_chart(symbol: str):
-    """Display interactive price chart"""
-    st.subheader("Price History")
-
-    # Time period selection
-    col1, col2 = st.columns(2)
-    with col1:
-        period = st.selectbox(
-            "Time Period",
-            ["1mo", "3mo", "6mo", "1y", "2y", "5y"],
-            index=3
-        )
-    with col2:
-        interval = st.selectbox(
-            "Interval",
-            ["1d", "1wk", "1mo"],
-            index=0
-        )
+def _frame_fingerprint(df: pd.DataFrame) -> tuple:
+    """Cheap cache key for a price frame: row count plus the latest bar"""
+    if df.empty:
+        return (0,)
+    return (len(df), str(df['timestamp'].iloc[-1]), float(df['close'].iloc[-1]))
 
-    with st.spinner("Loading price history..."):
-        history = get_backend_data(f"/api/stocks/{symbol}/history", {"period": period, "interval": interval})
+@st.cache_data(
+    show_spinner=False,
+    max_entries=32,
+    hash_funcs={"pandas.core.frame.DataFrame": _frame_fingerprint}
+)
+def _build_price_fig(df: pd.DataFrame, symbol: str) -> go.Figure:
+    """Build the candlestick + volume figure; cached so reruns skip trace construction"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        subplot_titles=(f'{symbol} Price Chart', 'Volume'),
+        row_heights=[0.7, 0.3]
+    )
 
-    if history:
-        # Convert to DataFrame for plotting
-        df = pd.DataFrame(history)
+    # Price candlestick
+    fig.add_trace(
+        go.Candlestick(
+            x=df['timestamp'],
+            open=df['open'],
+            high=df['high'],
+            low=df['low'],
+            close=df['close'],
+            name='Price'
+        ),
+        row=1, col=1
+    )
 
-        # Create candlestick chart
-        fig = make_subplots(
-            rows=2, cols=1,
-            shared_xaxes=True,
-            subplot_titles=(f'{symbol} Price Chart', 'Volume'),
-            row_heights=[0.7, 0.3]
-        )
+    # Volume bar chart
+    fig.add_trace(
+        go.Bar(
+            x=df['timestamp'],
+            y=df['volume'],
+            name='Volume',
+            marker_color='rgba(31, 119, 180, 0.3)'
+        ),
+        row=2, col=1
+    )
 
-        # Price candlestick
-        fig.add_trace(
-            go.Candlestick(
-                x=df['timestamp'],
-                open=df['open'],
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                name='Price'
-            ),
-            row=1, col=1
-        )
+    fig.update_layout(
+        height=600,
+        title_text=f"{symbol} Historical Price Data",
+        xaxis_rangeslider_visible=False
+    )
+    return fig
 
-        # Volume bar chart
-        fig.add_trace(
-            go.Bar(
-                x=df['timestamp'],
-                y=df['volume'],
-                name='Volume',
-                marker_color='rgba(31, 119, 180, 0.3)'
-            ),
-            row=2, col=1
-        )
+def display_price_chart(symbol: str):
+    """Display interactive price chart"""
+    st.subheader("Price History")
 
-        fig.update_layout(
-            height=600,
-            title_text=f"{symbol} Historical Price Data",
-            xaxis_rangeslider_visible=False
+    # Period/interval changes rerun only this panel, not the whole page
+    @st.fragment
+    def chart_panel():
+        # Time period selection
+        col1, col2 = st.columns(2)
+        with col1:
+            period = st.selectbox(
+                "Time Period",
+                ["1mo", "3mo", "6mo", "1y", "2y", "5y"],
+                index=3
+            )
+        with col2:
+            interval = st.selectbox(
+                "Interval",
+                ["1d", "1wk", "1mo"],
+                index=0
+            )
+
+        history = get_backend_data(
+            f"/api/stocks/{symbol}/history",
+            {"period": period, "interval": interval, "format": "columnar"}
         )
 
-        st.plotly_chart(fig, use_container_width=True)
-
-        # Display data table
-        with st.expander("View Raw Data"):
-            st.dataframe(df)
+        if history:
+            import pandas as pd
+
+            # Columnar payload: one array per field, no per-row transpose
+            df = pd.DataFrame(history, copy=False)
+
+            fig = _build_price_fig(df, symbol)
+            st.plotly_chart(fig, use_container_width=True)
+
+            # Only serialize the table when asked for; a collapsed expander still ships it
+            if st.toggle("View Raw Data", key=f"raw_{symbol}"):
+                if len(df) > RAW_DATA_ROWS:
+                    st.caption(f"Showing the latest {RAW_DATA_ROWS} of {len(df)} rows")
+                st.dataframe(df.tail(RAW_DATA_ROWS), use_container_width=True)
+
+    chart_panel()
+
+# Signal boxes for the technical analysis tab: (Streamlit call, message)
+RSI_SIGNALS = {
+    "overbought": (st.error, "⚠️ Overbought (RSI > 70)"),
+    "oversold": (st.warning, "💡 Oversold (RSI < 30)"),
+    "neutral": (st.success, "✅ Neutral RSI"),
+}
+TREND_SIGNALS = {
+    "bullish": (st.success, "📈 Bullish Trend"),
+    "bearish": (st.error, "📉 Bearish Trend"),
+}
+NEUTRAL_TREND = (st.info, "➡️ Neutral Trend")
+
+def _rsi_zone(rsi: float) -> str:
+    """Classic 70/30 bands; both bounds count as neutral"""
+    if rsi > 70:
+        return "overbought"
+    if rsi < 30:
+        return "oversold"
+    return "neutral"
 
 def display_technical_analysis(symbol: str):
     """Display technical analysis indicators"""
     st.subheader("Technical Analysis")
 
-    with st.spinner("Loading technical analysis..."):
-        analysis = get_backend_data(f"/api/stocks/{symbol}/analysis")
+    @st.fragment
+    def analysis_panel():
+        analysis = _analysis(symbol)
 
-    if analysis:
-        col1, col2, col3 = st.columns(3)
+        if analysis:
+            col1, col2, col3 = st.columns(3)
 
-        with col1:
-            st.metric("Current Price", f"${analysis.get('current_price', 'N/A')}")
-            st.metric("SMA (20)", f"${analysis.get('sma_20', 'N/A')}")
-            st.metric("SMA (50)", f"${analysis.get('sma_50', 'N/A')}")
+            with col1:
+                st.metric("Current Price", f"${analysis.get('current_price', 'N/A')}")
+                st.metric("SMA (20)", f"${analysis.get('sma_20', 'N/A')}")
+                st.metric("SMA (50)", f"${analysis.get('sma_50', 'N/A')}")
 
-        with col2:
-            rsi = analysis.get('rsi', 50)
-            st.metric("RSI (14)", f"{rsi}")
-
-            # RSI indicator
-            if rsi > 70:
-                st.error("⚠️ Overbought (RSI > 70)")
-            elif rsi < 30:
-                st.warning("💡 Oversold (RSI < 30)")
-            else:
-                st.success("✅ Neutral RSI")
-
-        with col3:
-            trend = analysis.get('trend', 'neutral')
-            if trend == 'bullish':
-                st.success("📈 Bullish Trend")
-            elif trend == 'bearish':
-                st.error("📉 Bearish Trend")
-            else:
-                st.info("➡️ Neutral Trend")
+            with col2:
+                rsi = analysis.get('rsi', 50)
+                st.metric("RSI (14)", f"{rsi}")
+
+                # RSI indicator
+                show, message = RSI_SIGNALS[_rsi_zone(rsi)]
+                show(message)
+
+            with col3:
+                trend = analysis.get('trend', 'neutral')
+                show, message = TREND_SIGNALS.get(trend, NEUTRAL_TREND)
+                show(message)
+
+    analysis_panel()
 
 def display_news_alerts(symbol: str):
     """Display news and alerts (placeholder for now)"""
@@ -275,6 +423,14 @@ def display_news_alerts(symbol: str):
     st.write("• Volume spikes")
     st.write("• Market sentiment changes")
 
+def _delta_color(value: float) -> str:
+    """Green/red text for price moves, like st.metric deltas"""
+    if value > 0:
+        return "color: #09ab3b"
+    if value < 0:
+        return "color: #ff2b2b"
+    return ""
+
 def display_market_overview():
     """Display market overview dashboard"""
     st.header("🌍 Market Overview")
@@ -283,17 +439,25 @@ def display_market_overview():
         indices = get_backend_data("/api/market/indices")
 
     if indices:
-        # Create columns for different indices
-        cols = st.columns(len(indices))
-
-        for i, (symbol, data) in enumerate(indices.items()):
-            with cols[i]:
-                st.subheader(data.get('name', symbol))
-                st.metric(
-                    "Current",
-                    f"${data.get('current_price', 'N/A')}",
-                    delta=f"{data.get('change', 0):+.2f} ({data.get('change_percent', 0):+.2f}%)"
-                )
+        import pandas as pd
+
+        # One table instead of a column + metric per index: a single element to diff per rerun
+        df = pd.DataFrame([
+            {
+                "Index": data.get('name', symbol),
+                "Price": data.get('current_price'),
+                "Δ": data.get('change', 0),
+                "Δ%": data.get('change_percent', 0)
+            }
+            for symbol, data in indices.items()
+        ])
+        st.dataframe(
+            df.style
+            .format({"Price": "${:.2f}", "Δ": "{:+.2f}", "Δ%": "{:+.2f}%"})
+            .map(_delta_color, subset=["Δ", "Δ%"]),
+            hide_index=True,
+            use_container_width=True
+        )
 
 def display_portfolio_tracker():
     """Portfolio tracking interface"""
@@ -319,7 +483,7 @@ def display_portfolio_tracker():
 def main():
     """Main application function"""
     # Sidebar navigation
-    st.sidebar.markdown('<div class="sidebar-header">Finance AI Assistant</div>', unsafe_allow_html=True)
+    st.sidebar.markdown(SIDEBAR_HEADER, unsafe_allow_html=True)
 
     # Navigation menu
     page = st.sidebar.selectbox(
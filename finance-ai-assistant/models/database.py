@@ -2,15 +2,33 @@
 MongoDB database connection and models for Finance AI Assistant
 """
 
+import asyncio
+import logging
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import Document, init_beanie
-from pydantic import BaseModel, Field
+from pymongo import IndexModel, ASCENDING, DESCENDING
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
-from datetime import datetime
-from config.settings import settings
+from datetime import datetime, timezone
+from config.settings import settings, ensure_dirs
+
+logger = logging.getLogger(__name__)
+
+DAY_SECONDS = 24 * 60 * 60
+
+# Shared by every document: no re-validation on attribute assignment (the
+# Pydantic v2 core only validates on construction and load), and fields can
+# be populated by name as well as alias
+DOCUMENT_CONFIG = ConfigDict(validate_assignment=False, populate_by_name=True)
+
+def _utcnow() -> datetime:
+    """Timezone-aware replacement for the deprecated datetime.utcnow"""
+    return datetime.now(timezone.utc)
 
 class StockData(Document):
     """Stock data model"""
+    model_config = DOCUMENT_CONFIG
+
     symbol: str = Field(..., description="Stock symbol")
     company_name: str = Field(..., description="Company name")
     price: float = Field(..., description="Current price")
@@ -22,13 +40,20 @@ class StockData(Document):
     dividend_yield: Optional[float] = Field(None, description="Dividend yield")
     high_52_week: Optional[float] = Field(None, description="52-week high")
     low_52_week: Optional[float] = Field(None, description="52-week low")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Data timestamp")
+    timestamp: datetime = Field(default_factory=_utcnow, description="Data timestamp")
 
     class Settings:
         name = settings.stocks_collection
+        indexes = [
+            IndexModel([("symbol", ASCENDING), ("timestamp", DESCENDING)]),
+            # Quote snapshots expire on their own
+            IndexModel("timestamp", expireAfterSeconds=settings.stock_data_ttl_days * DAY_SECONDS),
+        ]
 
 class NewsArticle(Document):
     """News article model"""
+    model_config = DOCUMENT_CONFIG
+
     title: str = Field(..., description="Article title")
     summary: str = Field(..., description="Article summary")
     content: Optional[str] = Field(None, description="Full article content")
@@ -39,34 +64,42 @@ class NewsArticle(Document):
     sentiment: str = Field(..., description="Sentiment analysis (positive/negative/neutral)")
     sentiment_score: float = Field(..., description="Sentiment score (-1 to 1)")
     tags: List[str] = Field(default_factory=list, description="Article tags")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Data timestamp")
+    timestamp: datetime = Field(default_factory=_utcnow, description="Data timestamp")
 
     class Settings:
         name = settings.news_collection
+        indexes = [
+            IndexModel([("symbols", ASCENDING), ("published_at", DESCENDING)]),
+            IndexModel("timestamp", expireAfterSeconds=settings.news_ttl_days * DAY_SECONDS),
+        ]
 
 class Portfolio(Document):
     """User portfolio model"""
+    model_config = DOCUMENT_CONFIG
+
     user_id: str = Field(..., description="User identifier")
     name: str = Field(..., description="Portfolio name")
     holdings: List[Dict[str, Any]] = Field(default_factory=list, description="Stock holdings")
     total_value: float = Field(default=0.0, description="Total portfolio value")
     total_change: float = Field(default=0.0, description="Total change")
     total_change_percent: float = Field(default=0.0, description="Total change percentage")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation date")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update")
+    created_at: datetime = Field(default_factory=_utcnow, description="Creation date")
+    updated_at: datetime = Field(default_factory=_utcnow, description="Last update")
 
     class Settings:
         name = settings.portfolios_collection
 
 class User(Document):
     """User model"""
+    model_config = DOCUMENT_CONFIG
+
     username: str = Field(..., description="Username")
     email: str = Field(..., description="Email address")
     hashed_password: str = Field(..., description="Hashed password")
     is_active: bool = Field(default=True, description="Account status")
     portfolios: List[str] = Field(default_factory=list, description="User portfolios")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Account creation date")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update")
+    created_at: datetime = Field(default_factory=_utcnow, description="Account creation date")
+    updated_at: datetime = Field(default_factory=_utcnow, description="Last update")
 
     class Settings:
         name = settings.users_collection
@@ -77,24 +110,34 @@ class User(Document):
 
 class ChatMessage(Document):
     """Chat message model"""
+    model_config = DOCUMENT_CONFIG
+
     user_id: str = Field(..., description="User identifier")
     message: str = Field(..., description="User message")
     response: str = Field(..., description="AI response")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Message timestamp")
+    timestamp: datetime = Field(default_factory=_utcnow, description="Message timestamp")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
     class Settings:
         name = settings.chat_history_collection
+        indexes = [
+            IndexModel([("user_id", ASCENDING), ("timestamp", DESCENDING)]),
+        ]
 
 class TechnicalAnalysis(Document):
     """Technical analysis data model"""
+    model_config = DOCUMENT_CONFIG
+
     symbol: str = Field(..., description="Stock symbol")
     analysis_type: str = Field(..., description="Analysis type (RSI, MACD, etc.)")
     data: Dict[str, Any] = Field(..., description="Analysis data")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Analysis timestamp")
+    timestamp: datetime = Field(default_factory=_utcnow, description="Analysis timestamp")
 
     class Settings:
         name = settings.technical_analysis_collection
+        indexes = [
+            IndexModel([("symbol", ASCENDING), ("analysis_type", ASCENDING), ("timestamp", DESCENDING)]),
+        ]
 
 class DatabaseConnection:
     """MongoDB connection manager"""
@@ -102,9 +145,17 @@ class DatabaseConnection:
     def __init__(self):
         self.client: Optional[AsyncIOMotorClient] = None
         self.database = None
+        self._initialized = False
+        self._connect_lock = asyncio.Lock()
 
     async def connect(self):
-        """Initialize database connection"""
+        """Initialize database connection; later calls are no-ops once connected"""
+        async with self._connect_lock:
+            if self._initialized and self.client is not None:
+                return
+            await self._connect()
+
+    async def _connect(self):
         try:
             # Build MongoDB connection string
             if settings.mongodb_username and settings.mongodb_password:
@@ -116,7 +167,17 @@ class DatabaseConnection:
             else:
                 connection_string = f"mongodb://{settings.mongodb_url}/{settings.mongodb_database}"
 
-            self.client = AsyncIOMotorClient(connection_string)
+            # zstd needs the zstandard package; pymongo falls back to zlib without it
+            self.client = AsyncIOMotorClient(
+                connection_string,
+                maxPoolSize=settings.mongodb_max_pool_size,
+                minPoolSize=settings.mongodb_min_pool_size,
+                serverSelectionTimeoutMS=settings.mongodb_timeout_ms,
+                waitQueueTimeoutMS=settings.mongodb_timeout_ms,
+                compressors="zstd,zlib",
+                retryReads=True,
+                appname="finance-ai-assistant"
+            )
             self.database = self.client[settings.mongodb_database]
 
             # Initialize Beanie with the document models
@@ -132,16 +193,25 @@ class DatabaseConnection:
                 ]
             )
 
-            print(f"✅ Connected to MongoDB: {settings.mongodb_database}")
+            self._initialized = True
+            logger.info("Connected to MongoDB: %s", settings.mongodb_database)
         except Exception as e:
-            print(f"❌ Failed to connect to MongoDB: {e}")
+            logger.error("Failed to connect to MongoDB: %s", e)
+            # Don't leave a half-initialized client behind for the next attempt
+            if self.client:
+                self.client.close()
+                self.client = None
+                self.database = None
             raise
 
     async def disconnect(self):
         """Close database connection"""
         if self.client:
             self.client.close()
-            print("🔌 Disconnected from MongoDB")
+            self.client = None
+            self.database = None
+            logger.info("Disconnected from MongoDB")
+        self._initialized = False
 
     async def get_database(self):
         """Get database instance"""
@@ -166,6 +236,7 @@ async def get_database():
 
 async def init_database():
     """Initialize database connection"""
+    ensure_dirs()
     await db_connection.connect()
 
 async def close_database():
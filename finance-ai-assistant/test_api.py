@@ -3,126 +3,101 @@
 Simple test script to verify the Finance AI Assistant API is working
 """
 
-import requests
+import asyncio
 import json
 from datetime import datetime
 
-def test_api():
-    """Test basic API endpoints"""
-    base_url = "http://localhost:8000"
+import httpx
+import orjson
 
-    print("Testing Finance AI Assistant API")
-    print("=" * 50)
+BASE_URL = "http://localhost:8000"
 
-    # Test 1: Health check
-    try:
-        response = requests.get(f"{base_url}/health")
-        if response.status_code == 200:
-            print("PASS - Health check")
-            print(f"   Response: {response.json()}")
-        else:
-            print(f"FAIL - Health check ({response.status_code})")
-    except Exception as e:
-        print(f"ERROR - Health check: {e}")
 
-    print()
+def _health_details(data):
+    return [f"Response: {data}"]
 
-    # Test 2: Root endpoint
-    try:
-        response = requests.get(f"{base_url}/")
-        if response.status_code == 200:
-            print("PASS - Root endpoint")
-            print(f"   Response: {response.json()}")
-        else:
-            print(f"FAIL - Root endpoint ({response.status_code})")
-    except Exception as e:
-        print(f"ERROR - Root endpoint: {e}")
 
-    print()
+def _quote_details(data):
+    return [
+        f"Symbol: {data.get('symbol')}",
+        f"Price: ${data.get('current_price')}",
+        f"Source: {data.get('source', 'unknown')}",
+    ]
 
-    # Test 3: Stock quote (with fallback data)
-    try:
-        response = requests.get(f"{base_url}/api/stocks/AAPL/quote")
-        if response.status_code == 200:
-            print("PASS - Stock quote (AAPL)")
-            data = response.json()
-            print(f"   Symbol: {data.get('symbol')}")
-            print(f"   Price: ${data.get('current_price')}")
-            print(f"   Source: {data.get('source', 'unknown')}")
-        else:
-            print(f"FAIL - Stock quote (AAPL) ({response.status_code})")
-            print(f"   Error: {response.text}")
-    except Exception as e:
-        print(f"ERROR - Stock quote (AAPL): {e}")
 
-    print()
+def _info_details(data):
+    return [f"Name: {data.get('name')}", f"Sector: {data.get('sector')}"]
 
-    # Test 4: Stock info
-    try:
-        response = requests.get(f"{base_url}/api/stocks/AAPL/info")
-        if response.status_code == 200:
-            print("PASS - Stock info (AAPL)")
-            data = response.json()
-            print(f"   Name: {data.get('name')}")
-            print(f"   Sector: {data.get('sector')}")
-        else:
-            print(f"FAIL - Stock info (AAPL) ({response.status_code})")
-            print(f"   Error: {response.text}")
-    except Exception as e:
-        print(f"ERROR - Stock info (AAPL): {e}")
 
-    print()
+def _indices_details(data):
+    lines = [f"Found {len(data)} indices"]
+    lines.extend(f"{symbol}: ${info.get('current_price')}" for symbol, info in data.items())
+    return lines
 
-    # Test 5: Market indices
-    try:
-        response = requests.get(f"{base_url}/api/market/indices")
-        if response.status_code == 200:
-            print("PASS - Market indices")
-            data = response.json()
-            print(f"   Found {len(data)} indices")
-            for symbol, info in data.items():
-                print(f"   {symbol}: ${info.get('current_price')}")
-        else:
-            print(f"FAIL - Market indices ({response.status_code})")
-            print(f"   Error: {response.text}")
-    except Exception as e:
-        print(f"ERROR - Market indices: {e}")
 
-    print()
+def _prediction_details(data):
+    return [
+        f"Symbol: {data.get('symbol')}",
+        f"Predictions: {len(data.get('predictions', []))} days",
+        f"Model: {data.get('model')}",
+    ]
+
+
+def _news_details(data):
+    lines = [f"Found {len(data)} news items"]
+    if data:
+        lines.append(f"First news: {data[0].get('title', 'No title')[:50]}...")
+    return lines
 
-    # Test 6: Test prediction endpoint
-    try:
-        response = requests.get(f"{base_url}/api/stocks/AAPL/predict-test?days=3")
-        if response.status_code == 200:
-            print("PASS - Test prediction")
-            data = response.json()
-            print(f"   Symbol: {data.get('symbol')}")
-            print(f"   Predictions: {len(data.get('predictions', []))} days")
-            print(f"   Model: {data.get('model')}")
-        else:
-            print(f"FAIL - Test prediction ({response.status_code})")
-            print(f"   Error: {response.text}")
-    except Exception as e:
-        print(f"ERROR - Test prediction: {e}")
 
-    print()
+# (name, path, details formatter, show response body on failure)
+CHECKS = [
+    ("Health check", "/health", _health_details, False),
+    ("Root endpoint", "/", _health_details, False),
+    ("Stock quote (AAPL)", "/api/stocks/AAPL/quote", _quote_details, True),
+    ("Stock info (AAPL)", "/api/stocks/AAPL/info", _info_details, True),
+    ("Market indices", "/api/market/indices", _indices_details, True),
+    ("Test prediction", "/api/stocks/AAPL/predict-test?days=3", _prediction_details, True),
+    ("News endpoint", "/api/stocks/AAPL/news?limit=2", _news_details, True),
+]
 
-    # Test 7: News endpoint
+
+async def _probe(client, name, url, parse=None, show_error=True):
+    """Run a single GET and return the lines to print for it"""
     try:
-        response = requests.get(f"{base_url}/api/stocks/AAPL/news?limit=2")
+        response = await client.get(url)
         if response.status_code == 200:
-            print("PASS - News endpoint")
-            data = response.json()
-            print(f"   Found {len(data)} news items")
-            if data:
-                print(f"   First news: {data[0].get('title', 'No title')[:50]}...")
+            lines = [f"PASS - {name}"]
+            if parse:
+                lines.extend(f"   {line}" for line in parse(orjson.loads(response.content)))
         else:
-            print(f"FAIL - News endpoint ({response.status_code})")
-            print(f"   Error: {response.text}")
+            lines = [f"FAIL - {name} ({response.status_code})"]
+            if show_error:
+                lines.append(f"   Error: {response.text}")
     except Exception as e:
-        print(f"ERROR - News endpoint: {e}")
+        lines = [f"ERROR - {name}: {e}"]
+    return lines
+
+
+async def run(base_url=BASE_URL):
+    """Probe every endpoint concurrently over one keep-alive client"""
+    async with httpx.AsyncClient(base_url=base_url, timeout=10.0, http2=True) as client:
+        return await asyncio.gather(*[
+            _probe(client, name, url, parse, show_error)
+            for name, url, parse, show_error in CHECKS
+        ])
+
+
+def test_api():
+    """Test basic API endpoints"""
+    print("Testing Finance AI Assistant API")
+    print("=" * 50)
+
+    # All checks run in parallel; results print in declaration order
+    for lines in asyncio.run(run()):
+        print("\n".join(lines))
+        print()
 
-    print()
     print("API Testing Complete!")
     print("=" * 50)
 
@@ -0,0 +1,165 @@
+"""
+Response cache for Finance AI Assistant API
+Short-lived Redis cache for slow upstream lookups (quotes, sentiment, news)
+"""
+
+import os
+import json
+import logging
+import functools
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from cachetools import TTLCache
+
+# Import our modules
+from ingestion.stock_stream import stock_ingestion
+from ingestion.news_stream import news_ingestion
+from rag.rag_pipeline import rag_pipeline
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Import here to handle optional dependencies
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    REDIS_AVAILABLE = False
+
+# Time-to-live per kind of data (seconds)
+QUOTE_TTL = int(os.getenv('QUOTE_CACHE_TTL', '30'))
+SENTIMENT_TTL = int(os.getenv('SENTIMENT_CACHE_TTL', '600'))
+NEWS_TTL = int(os.getenv('NEWS_CACHE_TTL', '60'))
+
+# Entry cap per TTL for the in-process fallback
+LOCAL_CACHE_MAX = int(os.getenv('LOCAL_CACHE_MAX', '10000'))
+
+def _json_default(value: Any) -> Any:
+    """Serialize numpy scalars and datetimes that upstream payloads may carry"""
+    if hasattr(value, 'item'):
+        return value.item()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+class ResponseCache:
+    """
+    GET/SETEX cache in Redis; falls back to in-process TTLCaches (one per
+    TTL value, each capped at LOCAL_CACHE_MAX entries) when Redis is not
+    installed or not reachable so the API works without it
+    """
+
+    def __init__(self):
+        self.redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+        self.redis = None
+        self._local: Dict[int, TTLCache] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def connect(self):
+        """Connect to Redis, staying on the local cache if that fails"""
+        if not REDIS_AVAILABLE:
+            logger.warning("redis not installed - using in-process response cache")
+            return
+
+        client = aioredis.from_url(self.redis_url, socket_connect_timeout=1, socket_timeout=1)
+        try:
+            await client.ping()
+            self.redis = client
+            logger.info(f"Response cache connected to Redis at {self.redis_url}")
+        except Exception as e:
+            logger.warning(f"Redis unavailable ({e}) - using in-process response cache")
+            await client.aclose()
+
+    async def close(self):
+        """Close the Redis connection"""
+        if self.redis is not None:
+            await self.redis.aclose()
+            self.redis = None
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss"""
+        raw = None
+        if self.redis is not None:
+            try:
+                raw = await self.redis.get(key)
+            except Exception as e:
+                logger.warning(f"Redis GET failed for {key}: {e}")
+        else:
+            for local in self._local.values():
+                raw = local.get(key)
+                if raw is not None:
+                    break
+
+        if raw is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(raw)
+
+    async def set(self, key: str, ttl: int, value: Any):
+        """Store value under key for ttl seconds"""
+        raw = json.dumps(value, default=_json_default)
+        if self.redis is not None:
+            try:
+                await self.redis.setex(key, ttl, raw)
+            except Exception as e:
+                logger.warning(f"Redis SETEX failed for {key}: {e}")
+        elif ttl > 0:
+            local = self._local.get(ttl)
+            if local is None:
+                local = self._local[ttl] = TTLCache(maxsize=LOCAL_CACHE_MAX, ttl=ttl)
+            local[key] = raw
+
+    def cached(self, ttl: int, prefix: str, should_cache: Optional[Callable[[Any], bool]] = None) -> Callable:
+        """
+        Decorator for async lookups: results are cached per call arguments.
+        None results (not found / upstream failure) are never cached, nor
+        results that should_cache rejects (e.g. error payloads).
+        """
+        def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                key = ":".join(
+                    [prefix, *map(str, args), *(f"{k}={v}" for k, v in sorted(kwargs.items()))]
+                )
+                value = await self.get(key)
+                if value is not None:
+                    logger.debug(f"Cache hit: {key}")
+                    return value
+
+                value = await func(*args, **kwargs)
+                if value is not None and (should_cache is None or should_cache(value)):
+                    await self.set(key, ttl, value)
+                return value
+            return wrapper
+        return decorator
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            "backend": "redis" if self.redis is not None else "local",
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
+
+# Global instance
+response_cache = ResponseCache()
+cached = response_cache.cached
+
+def _is_sentiment_result(result: Dict[str, Any]) -> bool:
+    """Sentiment analysis reports failures as a normal payload with 'error' set"""
+    return 'error' not in result
+
+# Cached entry points used by the API endpoints
+get_stock_quote = cached(ttl=QUOTE_TTL, prefix="quote")(stock_ingestion.get_stock_quote_yfinance)
+analyze_sentiment = cached(
+    ttl=SENTIMENT_TTL, prefix="sentiment", should_cache=_is_sentiment_result
+)(rag_pipeline.analyze_sentiment)
+# An empty list means every news source failed; retry rather than cache it
+get_all_news = cached(ttl=NEWS_TTL, prefix="news", should_cache=bool)(news_ingestion.get_all_news)
@@ -4,20 +4,56 @@ Provides specialized endpoints for advanced financial analysis
 """
 
 from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional, Dict, Any
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional, Dict, Any, Tuple
+import asyncio
 import logging
+import numpy as np
+import pandas as pd
+from collections import Counter
+from functools import lru_cache
 from datetime import datetime, timedelta
 
 # Import our modules
 from ingestion.stock_stream import stock_ingestion
 from rag.rag_pipeline import rag_pipeline
+from api.cache import get_stock_quote, analyze_sentiment, get_all_news
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Create router
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Sector concentration (HHI) thresholds for portfolio risk levels
+HHI_HIGH_RISK = 0.4
+HHI_LOW_RISK = 0.2
+
+def frame_to_columns(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Convert a DataFrame to {column: values} without building per-row dicts.
+    Numeric columns stay NumPy arrays for ORJSONResponse to serialize directly.
+    """
+    columns = {}
+    for name, series in df.items():
+        if pd.api.types.is_datetime64_any_dtype(series):
+            columns[str(name)] = series.dt.to_pydatetime().tolist()
+        elif pd.api.types.is_numeric_dtype(series):
+            columns[str(name)] = series.to_numpy()
+        else:
+            columns[str(name)] = series.tolist()
+    return columns
+
+async def gather_sentiments(symbols: List[str]) -> List[Any]:
+    """
+    Run sentiment analysis for several symbols concurrently.
+    Results keep the order of `symbols`; a failed symbol yields its exception.
+    """
+    return await asyncio.gather(
+        *(analyze_sentiment(symbol) for symbol in symbols),
+        return_exceptions=True
+    )
 
 @router.get("/api/stocks/{symbol}/analysis")
 async def get_stock_analysis(symbol: str):
@@ -26,13 +62,13 @@ async def get_stock_analysis(symbol: str):
     """
     try:
         # Get stock data
-        stock_data = await stock_ingestion.get_stock_quote_yfinance(symbol)
+        stock_data = await get_stock_quote(symbol)
 
         if not stock_data:
             raise HTTPException(status_code=404, detail=f"Stock {symbol} not found")
 
         # Get sentiment analysis
-        sentiment_data = await rag_pipeline.analyze_sentiment(symbol)
+        sentiment_data = await analyze_sentiment(symbol)
 
         # Get recent news
         from ingestion.news_stream import news_ingestion
@@ -86,7 +122,7 @@ async def get_stock_history(
     interval: str = Query("1d", description="Data interval (1d, 1wk, 1mo)")
 ):
     """
-    Get historical stock data
+    Get historical stock data, with "data" laid out column-wise
     """
     try:
         historical_data = await stock_ingestion.get_historical_data(symbol, period, interval)
@@ -94,17 +130,15 @@ async def get_stock_history(
         if historical_data.empty:
             raise HTTPException(status_code=404, detail=f"No historical data found for {symbol}")
 
-        # Convert to list of dictionaries
-        records = historical_data.reset_index().to_dict('records')
-
-        return {
+        # Returned directly so orjson serializes the NumPy columns as-is
+        return ORJSONResponse({
             "symbol": symbol,
             "period": period,
             "interval": interval,
-            "data_points": len(records),
-            "data": records,
+            "data_points": len(historical_data),
+            "data": frame_to_columns(historical_data),
             "timestamp": datetime.now().isoformat()
-        }
+        })
 
     except HTTPException:
         raise
@@ -122,28 +156,25 @@ async def get_market_overview():
         indices_data = await stock_ingestion.get_market_indices()
 
         # Get top news
-        from ingestion.news_stream import news_ingestion
-        news_data = await news_ingestion.get_all_news(limit=10)
+        news_data = await get_all_news(limit=10)
 
         # Get top sentiment analysis for major stocks
         major_symbols = ["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA"]
-        sentiment_data = []
+        sentiment_data = [
+            s for s in await gather_sentiments(major_symbols)
+            if not isinstance(s, BaseException)
+        ]
 
-        for symbol in major_symbols:
-            try:
-                sentiment = await rag_pipeline.analyze_sentiment(symbol)
-                sentiment_data.append(sentiment)
-            except:
-                continue
+        labels = Counter(s['sentiment_label'] for s in sentiment_data)
 
         overview = {
             "timestamp": datetime.now().isoformat(),
             "market_indices": indices_data,
             "top_news": news_data[:5],
             "sentiment_summary": {
-                "positive_count": sum(1 for s in sentiment_data if s['sentiment_label'] == 'positive'),
-                "negative_count": sum(1 for s in sentiment_data if s['sentiment_label'] == 'negative'),
-                "neutral_count": sum(1 for s in sentiment_data if s['sentiment_label'] == 'neutral'),
+                "positive_count": labels['positive'],
+                "negative_count": labels['negative'],
+                "neutral_count": labels['neutral'],
                 "total_analyzed": len(sentiment_data)
             },
             "top_sentiments": sentiment_data[:5]
@@ -175,38 +206,24 @@ async def get_portfolio_insights():
         holdings = portfolio_data.get('holdings', [])
         symbols = [holding['symbol'] for holding in holdings]
 
-        # Get sentiment for all holdings
+        # Get sentiment for all holdings (failed lookups count as neutral)
+        labels = Counter(
+            'neutral' if isinstance(sentiment, BaseException) else sentiment['sentiment_label']
+            for sentiment in await gather_sentiments(symbols)
+        )
         sentiment_summary = {
-            'positive': 0,
-            'negative': 0,
-            'neutral': 0
+            'positive': labels['positive'],
+            'negative': labels['negative'],
+            'neutral': labels['neutral']
         }
 
-        for symbol in symbols:
-            try:
-                sentiment = await rag_pipeline.analyze_sentiment(symbol)
-                sentiment_summary[sentiment['sentiment_label']] += 1
-            except:
-                sentiment_summary['neutral'] += 1
-
         # Calculate risk metrics
-        total_value = portfolio_data.get('total_value', 0)
-        sector_allocation = portfolio_data.get('sector_allocation', {})
-
-        # Determine risk level
-        risk_level = "moderate"
-        if len(sector_allocation) <= 2:
-            risk_level = "high"  # Low diversification
-        elif len(sector_allocation) >= 5:
-            risk_level = "low"  # High diversification
+        risk_assessment = assess_sector_risk(portfolio_data.get('sector_allocation', {}))
+        risk_level = risk_assessment['risk_level']
 
         enhanced_insights = {
             **insights,
-            "risk_assessment": {
-                "risk_level": risk_level,
-                "diversification_score": len(sector_allocation),
-                "sector_concentration": max(sector_allocation.values()) if sector_allocation else 0
-            },
+            "risk_assessment": risk_assessment,
             "sentiment_summary": sentiment_summary,
             "recommendations": generate_portfolio_recommendations(insights, risk_level)
         }
@@ -219,10 +236,53 @@ async def get_portfolio_insights():
         logger.error(f"Error getting portfolio insights: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting portfolio insights: {str(e)}")
 
+def assess_sector_risk(sector_allocation: Dict[str, float]) -> Dict[str, Any]:
+    """
+    Assess diversification risk from sector weights using the
+    Herfindahl-Hirschman index (sum of squared sector shares)
+    """
+    weights = np.fromiter(sector_allocation.values(), dtype=np.float64, count=len(sector_allocation))
+    total = weights.sum()
+
+    # No allocation at all counts as fully concentrated
+    hhi = round(float((weights * weights).sum() / (total * total)), 4) if total > 0 else 1.0
+
+    # Determine risk level: above 0.4 is roughly two sectors or fewer,
+    # 0.2 and below is five or more evenly weighted sectors
+    risk_level = "moderate"
+    if hhi > HHI_HIGH_RISK:
+        risk_level = "high"  # Low diversification
+    elif hhi <= HHI_LOW_RISK:
+        risk_level = "low"  # High diversification
+
+    return {
+        "risk_level": risk_level,
+        "diversification_score": int(weights.size),
+        "sector_concentration": float(weights.max()) if weights.size else 0,
+        "herfindahl_index": hhi
+    }
+
 def generate_portfolio_recommendations(insights: Dict[str, Any], risk_level: str) -> List[str]:
     """
     Generate portfolio recommendations based on analysis
     """
+    sentiment_summary = insights.get('sentiment_summary', {})
+    positive_count = sentiment_summary.get('positive', 0)
+    negative_count = sentiment_summary.get('negative', 0)
+
+    total_gain_loss_percent = insights.get('total_gain_loss_percent', 0)
+    gain_bucket = 0
+    if total_gain_loss_percent < -10:
+        gain_bucket = -1
+    elif total_gain_loss_percent > 20:
+        gain_bucket = 1
+
+    # Cached as a tuple; each caller gets its own list
+    return list(_recommendations(risk_level, negative_count > positive_count, positive_count > 0, gain_bucket))
+
+@lru_cache(maxsize=64)
+def _recommendations(risk_level: str, mostly_negative: bool, any_positive: bool, gain_bucket: int) -> Tuple[str, ...]:
+    """Recommendation texts for one combination of the discrete inputs"""
     recommendations = []
 
     # Risk-based recommendations
@@ -235,25 +295,20 @@ def generate_portfolio_recommendations(insights: Dict[str, Any], risk_level: str
         recommendations.append("Consider reviewing individual stock performance")
 
     # Sentiment-based recommendations
-    sentiment_summary = insights.get('sentiment_summary', {})
-    positive_count = sentiment_summary.get('positive', 0)
-    negative_count = sentiment_summary.get('negative', 0)
-
-    if negative_count > positive_count:
+    if mostly_negative:
         recommendations.append("Monitor stocks with negative sentiment more closely")
         recommendations.append("Consider reviewing your holdings in light of recent news")
 
-    if positive_count > 0:
+    if any_positive:
         recommendations.append("Positive sentiment in your holdings is encouraging")
 
     # Performance-based recommendations
-    total_gain_loss_percent = insights.get('total_gain_loss_percent', 0)
-    if total_gain_loss_percent < -10:
+    if gain_bucket < 0:
         recommendations.append("Portfolio shows significant losses - consider reviewing your strategy")
-    elif total_gain_loss_percent > 20:
+    elif gain_bucket > 0:
         recommendations.append("Strong portfolio performance - consider taking some profits")
 
-    return recommendations
+    return tuple(recommendations)
 
 @router.get("/api/search")
 async def search_financial_data(
@@ -313,12 +368,13 @@ async def get_stock_trends(symbol: str, days: int = Query(30, description="Numbe
         if historical_data.empty:
             raise HTTPException(status_code=404, detail=f"No trend data found for {symbol}")
 
-        # Calculate trends
-        recent_data = historical_data.tail(10)  # Last 10 days
-        older_data = historical_data.tail(30).head(20)  # Previous 20 days
+        # Calculate trends on the raw close prices
+        closes = historical_data['Close'].to_numpy(dtype=np.float64)
+        recent_closes = closes[-10:]  # Last 10 days
+        older_closes = closes[-30:][:20]  # Previous 20 days
 
-        recent_avg = recent_data['Close'].mean()
-        older_avg = older_data['Close'].mean()
+        recent_avg = recent_closes.mean()
+        older_avg = older_closes.mean()
 
         # Determine trend
         trend_direction = "sideways"
@@ -328,10 +384,11 @@ async def get_stock_trends(symbol: str, days: int = Query(30, description="Numbe
             trend_direction = "downward"
 
         # Calculate volatility
-        volatility = historical_data['Close'].pct_change().std() * 100
+        returns = np.diff(closes) / closes[:-1]
+        volatility = returns.std(ddof=1) * 100 if len(returns) > 1 else 0.0
 
         # Get sentiment trend
-        sentiment_data = await rag_pipeline.analyze_sentiment(symbol)
+        sentiment_data = await analyze_sentiment(symbol)
 
         trends = {
             "symbol": symbol,
@@ -339,8 +396,8 @@ async def get_stock_trends(symbol: str, days: int = Query(30, description="Numbe
             "trend_direction": trend_direction,
             "trend_strength": abs(recent_avg - older_avg) / older_avg * 100,
             "volatility_percent": round(volatility, 2),
-            "current_price": historical_data['Close'].iloc[-1],
-            "price_change_10d": ((recent_data['Close'].iloc[-1] / recent_data['Close'].iloc[0] - 1) * 100) if len(recent_data) > 1 else 0,
+            "current_price": float(closes[-1]),
+            "price_change_10d": ((recent_closes[-1] / recent_closes[0] - 1) * 100) if len(recent_closes) > 1 else 0,
             "sentiment_trend": sentiment_data.get('sentiment_label', 'neutral'),
             "data_points": len(historical_data),
             "timestamp": datetime.now().isoformat()
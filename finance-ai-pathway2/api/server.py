@@ -5,11 +5,10 @@ Provides REST API endpoints for financial data and RAG queries
 
 from fastapi import FastAPI, HTTPException, Depends, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 import logging
-import asyncio
 import json
 from datetime import datetime
 from contextlib import asynccontextmanager
@@ -20,7 +19,9 @@ from ingestion.news_stream import news_ingestion
 from ingestion.portfolio_stream import portfolio_ingestion
 from rag.rag_pipeline import rag_pipeline
 from rag.llm_config import llm_manager
-from processing.indexing import search_engine
+from processing.indexing import search_engine, hash_embeddings
+from api.cache import response_cache, get_stock_quote, analyze_sentiment, get_all_news
+from api.streams import stream_publisher, STOCK_UPDATE_INTERVAL, NEWS_UPDATE_INTERVAL
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -40,10 +41,14 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error initializing search engine: {e}")
 
+    await response_cache.connect()
+
     yield
 
     # Shutdown tasks
     logger.info("Shutting down Finance AI Assistant API")
+    await stream_publisher.close()
+    await response_cache.close()
 
 async def initialize_search_engine():
     """Initialize search engine with sample data"""
@@ -57,15 +62,9 @@ async def initialize_search_engine():
             stock_data = stocks_df.to_dict('records')
 
             # Create simple embeddings for stocks
-            def create_stock_embedding(stock):
-                text = f"{stock['name']} {stock['sector']} stock"
-                embedding = []
-                for i in range(384):
-                    hash_val = hash(f"{text}_{i}") % 1000 / 1000.0
-                    embedding.append(hash_val)
-                return embedding
-
-            stock_embeddings = [create_stock_embedding(stock) for stock in stock_data]
+            stock_embeddings = hash_embeddings(
+                [f"{stock['name']} {stock['sector']} stock" for stock in stock_data]
+            )
             search_engine.index_stocks(stock_data, stock_embeddings)  # type: ignore
 
         except Exception as e:
@@ -77,15 +76,9 @@ async def initialize_search_engine():
             news_data = news_df.to_dict('records')
 
             # Create simple embeddings for news
-            def create_news_embedding(news):
-                text = f"{news['title']} {news['summary']}"
-                embedding = []
-                for i in range(384):
-                    hash_val = hash(f"{text}_{i}") % 1000 / 1000.0
-                    embedding.append(hash_val)
-                return embedding
-
-            news_embeddings = [create_news_embedding(news) for news in news_data]
+            news_embeddings = hash_embeddings(
+                [f"{news['title']} {news['summary']}" for news in news_data]
+            )
             search_engine.index_news(news_data, news_embeddings)  # type: ignore
 
         except Exception as e:
@@ -99,7 +92,8 @@ app = FastAPI(
     title="Finance AI Assistant API",
     description="A comprehensive financial data API with RAG capabilities",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -187,7 +181,9 @@ async def health_check():
         "timestamp": datetime.now().isoformat(),
         "services": {
             "llm": llm_manager.get_config_info(),
-            "search_engine": search_engine.get_stats()
+            "search_engine": search_engine.get_stats(),
+            "cache": response_cache.get_stats(),
+            "streams": stream_publisher.get_stats()
         }
     }
 
@@ -209,7 +205,7 @@ async def get_stock_info(symbol: str):
     Get stock information
     """
     try:
-        stock_data = await stock_ingestion.get_stock_quote_yfinance(symbol)
+        stock_data = await get_stock_quote(symbol)
 
         if not stock_data:
             raise HTTPException(status_code=404, detail=f"Stock {symbol} not found")
@@ -269,7 +265,7 @@ async def get_news(limit: int = Query(20, description="Maximum number of news it
     Get financial news
     """
     try:
-        news_data = await news_ingestion.get_all_news(limit=limit)
+        news_data = await get_all_news(limit=limit)
 
         result = []
         for news_item in news_data:
@@ -323,7 +319,7 @@ async def get_sentiment_analysis(symbol: str):
     Get sentiment analysis for a stock
     """
     try:
-        sentiment_data = await rag_pipeline.analyze_sentiment(symbol)
+        sentiment_data = await analyze_sentiment(symbol)
         return SentimentAnalysis(**sentiment_data)
 
     except Exception as e:
@@ -375,11 +371,13 @@ async def websocket_stock_data(websocket: WebSocket, symbol: str):
     await websocket.accept()
 
     try:
-        while True:
-            # Get real-time stock data
-            stock_data = await stock_ingestion.get_stock_quote_yfinance(symbol)
+        # One shared poller per symbol, however many clients watch it
+        async with stream_publisher.subscribe(
+            f"stock:{symbol}", lambda: get_stock_quote(symbol), STOCK_UPDATE_INTERVAL
+        ) as updates:
+            while True:
+                stock_data = await updates.get()
 
-            if stock_data:
                 await websocket.send_json({
                     "type": "stock_update",
                     "symbol": symbol,
@@ -387,9 +385,6 @@ async def websocket_stock_data(websocket: WebSocket, symbol: str):
                     "timestamp": datetime.now().isoformat()
                 })
 
-            # Wait before next update
-            await asyncio.sleep(30)  # Update every 30 seconds
-
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for {symbol}")
     except Exception as e:
@@ -410,18 +405,17 @@ async def websocket_news_data(websocket: WebSocket):
     await websocket.accept()
 
     try:
-        while True:
-            # Get latest news
-            news_data = await news_ingestion.get_all_news(limit=5)
-
-            await websocket.send_json({
-                "type": "news_update",
-                "data": news_data,
-                "timestamp": datetime.now().isoformat()
-            })
+        async with stream_publisher.subscribe(
+            "news", lambda: get_all_news(limit=5), NEWS_UPDATE_INTERVAL
+        ) as updates:
+            while True:
+                news_data = await updates.get()
 
-            # Wait before next update
-            await asyncio.sleep(60)  # Update every minute
+                await websocket.send_json({
+                    "type": "news_update",
+                    "data": news_data,
+                    "timestamp": datetime.now().isoformat()
+                })
 
     except WebSocketDisconnect:
         logger.info("News WebSocket disconnected")
@@ -0,0 +1,97 @@
+"""
+Shared update streams for Finance AI Assistant WebSockets
+One poller per topic fans its latest value out to every subscriber
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Polling interval per kind of stream (seconds)
+STOCK_UPDATE_INTERVAL = 30
+NEWS_UPDATE_INTERVAL = 60
+
+class _Topic:
+    """Poller task, latest value and subscriber queues for one topic"""
+
+    def __init__(self):
+        self.latest: Optional[Any] = None
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.task: Optional[asyncio.Task] = None
+
+class StreamPublisher:
+    """
+    Polls each topic's upstream once per interval no matter how many
+    WebSocket clients are watching it. Subscribers get the latest value;
+    a slow client skips stale updates instead of queueing them.
+    """
+
+    def __init__(self):
+        self._topics: Dict[str, _Topic] = {}
+
+    @asynccontextmanager
+    async def subscribe(
+        self,
+        topic: str,
+        fetch: Callable[[], Awaitable[Any]],
+        interval: float
+    ) -> AsyncIterator[asyncio.Queue]:
+        """
+        Subscribe to a topic, starting its poller on the first subscriber
+        and stopping it when the last one leaves
+        """
+        state = self._topics.get(topic)
+        if state is None:
+            state = self._topics[topic] = _Topic()
+            state.task = asyncio.create_task(self._poll(topic, state, fetch, interval))
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        if state.latest is not None:
+            queue.put_nowait(state.latest)
+        state.subscribers.add(queue)
+
+        try:
+            yield queue
+        finally:
+            state.subscribers.discard(queue)
+            if not state.subscribers and self._topics.get(topic) is state:
+                del self._topics[topic]
+                state.task.cancel()
+
+    async def _poll(self, topic: str, state: _Topic, fetch: Callable[[], Awaitable[Any]], interval: float):
+        """Fetch the topic's value every interval and publish it"""
+        while True:
+            try:
+                value = await fetch()
+            except Exception as e:
+                logger.error(f"Error polling {topic}: {e}")
+                value = None
+
+            if value is not None:
+                state.latest = value
+                for queue in state.subscribers:
+                    if queue.full():
+                        queue.get_nowait()
+                    queue.put_nowait(value)
+
+            await asyncio.sleep(interval)
+
+    async def close(self):
+        """Stop all pollers"""
+        tasks = [state.task for state in self._topics.values() if state.task is not None]
+        self._topics.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Subscriber count per active topic"""
+        return {topic: len(state.subscribers) for topic, state in self._topics.items()}
+
+# Global instance
+stream_publisher = StreamPublisher()
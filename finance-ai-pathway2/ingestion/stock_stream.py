@@ -21,6 +21,13 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Yahoo spark endpoint: recent closes plus quote metadata for many symbols per request
+# v7 answers {"spark": {"result": [{symbol, response: [chart]}]}}; the v8
+# endpoint answers {SYMBOL: {close: [...], chartPreviousClose, ...}} instead.
+# Both layouts are parsed so either URL works
+SPARK_URL = 'https://query1.finance.yahoo.com/v7/finance/spark'
+SPARK_CHUNK_SIZE = 10
+
 class StockDataIngestion:
     """Handles stock data ingestion from multiple sources"""
 
@@ -107,6 +114,97 @@ class StockDataIngestion:
             logger.error(f"RapidAPI error for {symbol}: {e}")
             return None
 
+    async def get_stock_quotes_batch(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get quotes for many symbols with one request per SPARK_CHUNK_SIZE symbols.
+        Returns quotes keyed by symbol; symbols Yahoo did not answer for are left out.
+        Fundamentals (market cap, P/E, sector, ...) are not part of this feed.
+        """
+        chunks = [symbols[i:i + SPARK_CHUNK_SIZE] for i in range(0, len(symbols), SPARK_CHUNK_SIZE)]
+        if not chunks:
+            return {}
+
+        async with httpx.AsyncClient(timeout=10.0, headers={'User-Agent': 'Mozilla/5.0'}) as client:
+            results = await asyncio.gather(
+                *(self._fetch_spark_chunk(client, chunk) for chunk in chunks),
+                return_exceptions=True
+            )
+
+        quotes = {}
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Batch quote error for {','.join(chunk)}: {result}")
+                continue
+            quotes.update(result)
+        return quotes
+
+    async def _fetch_spark_chunk(self, client: httpx.AsyncClient, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch and parse one spark request"""
+        response = await client.get(
+            SPARK_URL,
+            params={'symbols': ','.join(symbols), 'range': '5d', 'interval': '1d'}
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        if 'spark' in data:
+            items = (data['spark'] or {}).get('result') or []
+            parsed = (self._parse_spark_result(item) for item in items)
+        else:
+            parsed = (self._parse_spark_v8_result(symbol, item) for symbol, item in data.items())
+
+        return {quote['symbol']: quote for quote in parsed if quote}
+
+    def _parse_spark_result(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Convert one v7 spark result into the quote dict used across the app"""
+        try:
+            series = item['response'][0]
+            meta = series.get('meta', {})
+            quote_data = series.get('indicators', {}).get('quote', [{}])[0]
+            return self._spark_quote(item.get('symbol') or meta.get('symbol'), quote_data.get('close'), meta)
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            logger.warning(f"Could not parse batch quote {item.get('symbol')}: {e}")
+            return None
+
+    def _parse_spark_v8_result(self, symbol: str, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Convert one v8 spark entry (flat close series, no chart meta)"""
+        try:
+            return self._spark_quote(item.get('symbol') or symbol, item.get('close'), item)
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            logger.warning(f"Could not parse batch quote {symbol}: {e}")
+            return None
+
+    def _spark_quote(self, symbol: str, closes: Optional[List[Optional[float]]], meta: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build a quote from a close series plus whatever market fields came with it"""
+        closes = [c for c in closes or [] if c is not None]
+
+        current_price = meta.get('regularMarketPrice') or (closes[-1] if closes else None)
+        if current_price is None:
+            return None
+        if len(closes) >= 2:
+            previous_close = closes[-2]
+        else:
+            previous_close = meta.get('previousClose') or meta.get('chartPreviousClose') or current_price
+
+        return {
+            'symbol': symbol,
+            'name': meta.get('longName') or meta.get('shortName') or symbol,
+            'current_price': round(current_price, 2),
+            'previous_close': round(previous_close, 2),
+            'day_high': round(meta.get('regularMarketDayHigh') or current_price, 2),
+            'day_low': round(meta.get('regularMarketDayLow') or current_price, 2),
+            'volume': int(meta.get('regularMarketVolume') or 0),
+            'market_cap': None,
+            'pe_ratio': None,
+            'dividend_yield': None,
+            'fifty_two_week_high': meta.get('fiftyTwoWeekHigh'),
+            'fifty_two_week_low': meta.get('fiftyTwoWeekLow'),
+            'sector': None,
+            'industry': None,
+            'source': 'yahoo_spark',
+            'timestamp': datetime.now().isoformat()
+        }
+
     async def get_historical_data(self, symbol: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
         """Get historical stock data"""
         try:
@@ -125,9 +223,14 @@ class StockDataIngestion:
             return pd.DataFrame()
 
     async def get_multiple_stocks(self, symbols: List[str]) -> List[Dict[str, Any]]:
-        """Get data for multiple stocks concurrently"""
+        """Get data for multiple stocks, batched where possible"""
+        batch = await self.get_stock_quotes_batch(symbols)
+
+        # Per-symbol sources only for what the batch could not answer
         tasks = []
         for symbol in symbols:
+            if symbol in batch:
+                continue
             # Try RapidAPI first, fallback to yfinance
             task = self.get_stock_quote_rapidapi(symbol)
             tasks.append((symbol, task))
@@ -153,16 +256,18 @@ class StockDataIngestion:
                 except:
                     pass
 
-        return results
+        fallback = {result['symbol']: result for result in results}
+        return [batch.get(symbol) or fallback[symbol] for symbol in symbols if symbol in batch or symbol in fallback]
 
     async def get_market_indices(self) -> Dict[str, Any]:
         """Get major market indices data"""
         indices = ["^GSPC", "^IXIC", "^DJI", "^RUT"]  # S&P 500, NASDAQ, Dow Jones, Russell 2000
         index_data = {}
+        batch = await self.get_stock_quotes_batch(indices)
 
         for symbol in indices:
             try:
-                data = await self.get_stock_quote_yfinance(symbol)
+                data = batch.get(symbol) or await self.get_stock_quote_yfinance(symbol)
                 if data:
                     index_data[symbol] = {
                         "name": self._get_index_name(symbol),
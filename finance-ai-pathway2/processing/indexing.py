@@ -5,6 +5,7 @@ Handles vector indexing and search functionality for RAG
 
 import numpy as np
 import pandas as pd
+import hashlib
 from typing import List, Dict, Any, Optional, Tuple
 import logging
 import json
@@ -16,6 +17,20 @@ from collections import defaultdict
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def hash_embedding(text: str, dimension: int = 384) -> np.ndarray:
+    """
+    Deterministic hash-based embedding (placeholder for a real model).
+    One SHAKE-256 digest supplies 4 bytes per dimension, scaled to [0, 1).
+    """
+    digest = hashlib.shake_256(text.encode('utf-8')).digest(dimension * 4)
+    return np.frombuffer(digest, dtype='<u4').astype(np.float32) / np.float32(2 ** 32)
+
+def hash_embeddings(texts: List[str], dimension: int = 384) -> np.ndarray:
+    """Embed several texts with hash_embedding into a (len(texts), dimension) array"""
+    if not texts:
+        return np.empty((0, dimension), dtype=np.float32)
+    return np.stack([hash_embedding(text, dimension) for text in texts])
+
 class VectorStore:
     """Vector store for efficient similarity search"""
 
@@ -211,15 +226,9 @@ class SearchEngine:
 
         return unique_results[:top_k]
 
-    def _create_query_embedding(self, query: str) -> List[float]:
-        """Create embedding for query (simplified)"""
-        # This would typically use the same embedding model as the documents
-        # For now, create a simple deterministic embedding
-        embedding = []
-        for i in range(self.dimension):
-            hash_val = hash(f"{query}_{i}") % 1000 / 1000.0
-            embedding.append(hash_val)
-        return embedding
+    def _create_query_embedding(self, query: str) -> np.ndarray:
+        """Create embedding for query with the same hash scheme as the documents"""
+        return hash_embedding(query, self.dimension)
 
     def _keyword_search(self, query: str, top_k: int = 5) -> List[Tuple[float, Dict[str, Any]]]:
         """Perform keyword-based search"""
@@ -272,7 +272,8 @@ Always base your responses on the provided context and be transparent about data
                 'sentiment_score': 0.0,
                 'sentiment_label': 'neutral',
                 'news_count': 0,
-                'analysis': f'Error analyzing sentiment: {str(e)}'
+                'analysis': f'Error analyzing sentiment: {str(e)}',
+                'error': str(e)
             }
 
     async def get_portfolio_insights(self, portfolio_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -3,7 +3,7 @@ Tests for API endpoints
 """
 import pytest
 import asyncio
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from fastapi.testclient import TestClient
 import json
 from datetime import datetime
@@ -11,6 +11,8 @@ from datetime import datetime
 # Import API modules
 from api.server import app
 from api.routes import get_stock_analysis
+from api.cache import ResponseCache
+from api.streams import StreamPublisher
 
 
 class TestAPIServer:
@@ -105,6 +107,89 @@ class TestAPIRoutes:
             result = asyncio.run(get_stock_analysis('INVALID'))
             assert 'error' in result or 'symbol' in result
 
+    def test_assess_sector_risk(self):
+        """Test HHI-based diversification risk levels"""
+        from api.routes import assess_sector_risk
+
+        concentrated = assess_sector_risk({'Technology': 80.0, 'Energy': 20.0})
+        assert concentrated['risk_level'] == 'high'
+        assert concentrated['herfindahl_index'] == pytest.approx(0.68)
+        assert concentrated['sector_concentration'] == 80.0
+
+        even = assess_sector_risk({f'Sector {i}': 20.0 for i in range(5)})
+        assert even['risk_level'] == 'low'
+        assert even['diversification_score'] == 5
+
+        assert assess_sector_risk({'A': 40.0, 'B': 30.0, 'C': 30.0})['risk_level'] == 'moderate'
+        assert assess_sector_risk({})['risk_level'] == 'high'
+
+    def test_portfolio_recommendations(self):
+        """Test recommendations are reused per input bucket and returned as fresh lists"""
+        from api.routes import generate_portfolio_recommendations, _recommendations
+
+        insights = {
+            'sentiment_summary': {'positive': 1, 'negative': 3},
+            'total_gain_loss_percent': -15
+        }
+
+        first = generate_portfolio_recommendations(insights, "high")
+        assert "Monitor stocks with negative sentiment more closely" in first
+        assert "Portfolio shows significant losses - consider reviewing your strategy" in first
+        assert "Positive sentiment in your holdings is encouraging" in first
+
+        first.append("mutated")
+        hits = _recommendations.cache_info().hits
+        second = generate_portfolio_recommendations({**insights, 'total_gain_loss_percent': -40}, "high")
+        assert "mutated" not in second
+        assert _recommendations.cache_info().hits == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_get_stock_history(self):
+        """Test history is returned column-wise"""
+        import pandas as pd
+        from api.routes import get_stock_history
+
+        history = pd.DataFrame({
+            'Date': pd.date_range('2024-01-02', periods=3, tz='America/New_York'),
+            'Close': [100.0, 101.5, 102.0],
+            'Volume': [1000, 2000, 3000],
+            'symbol': 'AAPL'
+        })
+
+        with patch('api.routes.stock_ingestion') as mock_ingestion:
+            mock_ingestion.get_historical_data = AsyncMock(return_value=history)
+
+            response = await get_stock_history('AAPL', period='5d', interval='1d')
+            body = json.loads(response.body)
+
+            assert body['data_points'] == 3
+            assert body['data']['Close'] == [100.0, 101.5, 102.0]
+            assert body['data']['Volume'] == [1000, 2000, 3000]
+            assert body['data']['Date'][0] == '2024-01-02T00:00:00-05:00'
+            assert pd.DataFrame(body['data']).shape == (3, 4)
+
+    @pytest.mark.asyncio
+    async def test_get_stock_trends(self):
+        """Test trend statistics computed from close prices"""
+        import pandas as pd
+        from api.routes import get_stock_trends
+
+        closes = [100.0] * 20 + [110.0] * 10
+        history = pd.DataFrame({'Close': closes})
+
+        with patch('api.routes.stock_ingestion') as mock_ingestion, \
+             patch('api.routes.analyze_sentiment', AsyncMock(return_value={'sentiment_label': 'positive'})):
+            mock_ingestion.get_historical_data = AsyncMock(return_value=history)
+
+            result = await get_stock_trends('AAPL', days=30)
+
+            assert result['trend_direction'] == 'upward'
+            assert result['trend_strength'] == pytest.approx(10.0)
+            assert result['current_price'] == 110.0
+            assert result['price_change_10d'] == 0
+            assert result['volatility_percent'] == round(pd.Series(closes).pct_change().std() * 100, 2)
+            assert result['sentiment_trend'] == 'positive'
+
 
 class TestAPIIntegration:
     """Integration tests for API"""
@@ -182,6 +267,116 @@ class TestAPIPerformance:
         assert all(status == 200 for status in results)
 
 
+class TestResponseCache:
+    """Test the response cache with its in-process backend"""
+
+    @pytest.mark.asyncio
+    async def test_cached_returns_stored_value(self):
+        """Second call with the same arguments is served from the cache"""
+        cache = ResponseCache()
+        calls = []
+
+        @cache.cached(ttl=60, prefix="quote")
+        async def fetch(symbol):
+            calls.append(symbol)
+            return {'symbol': symbol, 'current_price': 150.25}
+
+        first = await fetch('AAPL')
+        second = await fetch('AAPL')
+        await fetch('MSFT')
+
+        assert first == second == {'symbol': 'AAPL', 'current_price': 150.25}
+        assert calls == ['AAPL', 'MSFT']
+        assert cache.get_stats()['hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_none_is_not_cached(self):
+        """Missing data is refetched instead of cached"""
+        cache = ResponseCache()
+        calls = []
+
+        @cache.cached(ttl=60, prefix="quote")
+        async def fetch(symbol):
+            calls.append(symbol)
+            return None
+
+        assert await fetch('INVALID') is None
+        assert await fetch('INVALID') is None
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_rejected_results_are_not_cached(self):
+        """Results failing should_cache (error payloads) are refetched"""
+        cache = ResponseCache()
+        calls = []
+
+        @cache.cached(ttl=60, prefix="sentiment", should_cache=lambda r: 'error' not in r)
+        async def analyze(symbol):
+            calls.append(symbol)
+            return {'symbol': symbol, 'sentiment_label': 'neutral', 'error': 'index not built'}
+
+        await analyze('AAPL')
+        await analyze('AAPL')
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_local_cache_is_bounded(self):
+        """The in-process fallback evicts entries past its size cap"""
+        with patch('api.cache.LOCAL_CACHE_MAX', 2):
+            cache = ResponseCache()
+            for symbol in ['AAPL', 'MSFT', 'GOOGL']:
+                await cache.set(f'quote:{symbol}', 60, {'symbol': symbol})
+
+        assert sum(len(local) for local in cache._local.values()) == 2
+        assert await cache.get('quote:GOOGL') == {'symbol': 'GOOGL'}
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self):
+        """Entries older than their TTL are dropped"""
+        cache = ResponseCache()
+        await cache.set('news:limit=5', 0, [{'title': 'Markets rally'}])
+
+        assert await cache.get('news:limit=5') is None
+
+
+class TestStreamPublisher:
+    """Test shared WebSocket update streams"""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_poller(self):
+        """Two subscribers to a topic trigger a single upstream fetch"""
+        publisher = StreamPublisher()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return {'symbol': 'AAPL', 'current_price': 150.25}
+
+        async with publisher.subscribe("stock:AAPL", fetch, 60) as first, \
+                   publisher.subscribe("stock:AAPL", fetch, 60) as second:
+            assert (await first.get())['current_price'] == 150.25
+            assert (await second.get())['current_price'] == 150.25
+            assert publisher.get_stats() == {"stock:AAPL": 2}
+
+        assert len(calls) == 1
+        assert publisher.get_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_gets_latest_value(self):
+        """A new subscriber starts from the last published value"""
+        publisher = StreamPublisher()
+
+        async def fetch():
+            return ['headline']
+
+        async with publisher.subscribe("news", fetch, 60) as first:
+            await first.get()
+            async with publisher.subscribe("news", fetch, 60) as second:
+                assert second.get_nowait() == ['headline']
+
+        await publisher.close()
+
+
 class TestAPIMonitoring:
     """Test API monitoring and logging"""
 
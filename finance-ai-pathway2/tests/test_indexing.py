@@ -0,0 +1,30 @@
+"""
+Tests for vector indexing helpers
+"""
+import numpy as np
+
+# Import only the indexing module, which has no optional dependencies
+from processing.indexing import hash_embedding, hash_embeddings
+
+
+class TestHashEmbedding:
+    """Test vectorized hash embeddings used for the sample search index"""
+
+    def test_hash_embedding_shape_and_range(self):
+        """Test embedding dimension, dtype and value range"""
+        embedding = hash_embedding("Apple Inc. Technology stock")
+        assert embedding.shape == (384,)
+        assert embedding.dtype == np.float32
+        assert embedding.min() >= 0.0 and embedding.max() < 1.0
+
+    def test_hash_embedding_deterministic(self):
+        """Test same text gives same embedding, different text differs"""
+        assert np.array_equal(hash_embedding("AAPL"), hash_embedding("AAPL"))
+        assert not np.array_equal(hash_embedding("AAPL"), hash_embedding("MSFT"))
+
+    def test_hash_embeddings_batch(self):
+        """Test batch embeddings stack row-wise"""
+        batch = hash_embeddings(["AAPL", "MSFT"], dimension=16)
+        assert batch.shape == (2, 16)
+        assert np.array_equal(batch[1], hash_embedding("MSFT", 16))
+        assert hash_embeddings([]).shape == (0, 384)
@@ -3,7 +3,9 @@ Tests for data ingestion modules
 """
 import pytest
 import asyncio
-from unittest.mock import Mock, patch, MagicMock
+import json
+import os
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import pandas as pd
 from datetime import datetime, timedelta
 
@@ -12,6 +14,14 @@ from ingestion.stock_stream import StockDataIngestion
 from ingestion.news_stream import NewsDataIngestion
 from ingestion.portfolio_stream import PortfolioDataIngestion
 
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def load_fixture(name):
+    """Load a JSON response fixture from tests/fixtures"""
+    with open(os.path.join(FIXTURES_DIR, name)) as f:
+        return json.load(f)
+
 
 class TestStockDataIngestion:
     """Test stock data ingestion functionality"""
@@ -65,6 +75,55 @@ class TestStockDataIngestion:
             assert result['symbol'] == 'AAPL'
             assert result['price'] == '150.00'
 
+    @pytest.mark.asyncio
+    async def test_get_stock_quotes_batch(self, stock_ingestion):
+        """Test batched quotes from the v7 spark layout"""
+        with patch('ingestion.stock_stream.httpx.AsyncClient') as mock_client:
+            mock_response = Mock()
+            mock_response.json.return_value = load_fixture('yahoo_spark_v7.json')
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+
+            quotes = await stock_ingestion.get_stock_quotes_batch(['AAPL', 'MSFT', 'NOTAREALSYMBOL'])
+
+            assert list(quotes) == ['AAPL', 'MSFT']
+            assert quotes['AAPL']['current_price'] == 212.49
+            assert quotes['AAPL']['previous_close'] == 213.07
+            assert quotes['AAPL']['name'] == 'Apple Inc.'
+            assert quotes['AAPL']['volume'] == 70122748
+            assert quotes['MSFT']['previous_close'] == 432.68  # Missing bar skipped
+
+    @pytest.mark.asyncio
+    async def test_get_stock_quotes_batch_v8_layout(self, stock_ingestion):
+        """Test batched quotes from the v8 spark layout"""
+        with patch('ingestion.stock_stream.httpx.AsyncClient') as mock_client:
+            mock_response = Mock()
+            mock_response.json.return_value = load_fixture('yahoo_spark_v8.json')
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+
+            quotes = await stock_ingestion.get_stock_quotes_batch(['AAPL', 'MSFT'])
+
+            assert list(quotes) == ['AAPL', 'MSFT']
+            assert quotes['AAPL']['current_price'] == 212.49
+            assert quotes['AAPL']['previous_close'] == 213.07
+            assert quotes['MSFT']['current_price'] == 442.57
+            assert quotes['MSFT']['previous_close'] == 432.68
+
+    @pytest.mark.asyncio
+    async def test_get_stock_quotes_batch_chunks_requests(self, stock_ingestion):
+        """Test that symbols are sent in chunks of SPARK_CHUNK_SIZE"""
+        from ingestion.stock_stream import SPARK_CHUNK_SIZE
+
+        with patch('ingestion.stock_stream.httpx.AsyncClient') as mock_client:
+            mock_response = Mock()
+            mock_response.json.return_value = {'spark': {'result': []}}
+            get = AsyncMock(return_value=mock_response)
+            mock_client.return_value.__aenter__.return_value.get = get
+
+            symbols = [f"S{i}" for i in range(SPARK_CHUNK_SIZE * 2 + 1)]
+            await stock_ingestion.get_stock_quotes_batch(symbols)
+
+            assert get.await_count == 3
+
     def test_calculate_technical_indicators(self, stock_ingestion):
         """Test technical indicators calculation"""
         # Sample price data
@@ -27,7 +27,7 @@ def display_stock_metrics(stock_data: Dict[str, Any]):
     with col4:
         st.metric("Market Cap", f"${stock_data.get('market_cap', 0)","}" if stock_data.get('market_cap') else "N/A")
 
-def display_stock_chart(history_data: List[Dict[str, Any]], symbol: str):
+def display_stock_chart(history_data: Dict[str, List[Any]], symbol: str):
     """Display interactive stock price chart"""
     st.subheader(f"📈 {symbol} Price History")
 
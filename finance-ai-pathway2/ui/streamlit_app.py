@@ -351,7 +351,7 @@ def display_stock_info(stock_data: Dict[str, Any]):
     st.write(f"**P/E Ratio:** {stock_data.get('pe_ratio', 'N/A')}")
     st.write(f"**Dividend Yield:** {stock_data.get('dividend_yield', 'N/A')}")
 
-def display_stock_chart(history_data: List[Dict[str, Any]], symbol: str):
+def display_stock_chart(history_data: Dict[str, List[Any]], symbol: str):
     """Display stock price chart"""
     st.subheader(f"📈 {symbol} Price History")
 